@@ -154,7 +154,7 @@ async def resolve_checkpoint(
             )
 
         # Log to session JSONL
-        storage.write_event(checkpoint.session_id, {
+        await storage.awrite_event(checkpoint.session_id, {
             "event_type": "checkpoint_resolved",
             "checkpoint_id": checkpoint.checkpoint_id,
             "checkpoint_instance_id": checkpoint_instance_id,
@@ -224,7 +224,7 @@ async def cancel_checkpoint(
             )
 
         # Log to session JSONL
-        storage.write_event(checkpoint.session_id, {
+        await storage.awrite_event(checkpoint.session_id, {
             "event_type": "checkpoint_cancelled",
             "checkpoint_id": checkpoint.checkpoint_id,
             "checkpoint_instance_id": checkpoint_instance_id,
@@ -13,7 +13,6 @@ from fastapi.responses import StreamingResponse
 from typing import Optional
 from datetime import datetime
 import logging
-import json
 import asyncio
 
 from .models import RunWorkflowRequest, RunWorkflowResponse
@@ -21,6 +20,7 @@ from ..services.workflow_executor import get_workflow_executor
 from ..services.sse_broadcaster import get_broadcaster
 from ..services.progress_store import get_progress_store
 from ..services.registry_manager import get_registry_manager
+from ..services import json_utils
 
 logger = logging.getLogger(__name__)
 
@@ -105,7 +105,7 @@ async def stream_run(
 
     async def event_generator():
         """Poll progress store and stream new events."""
-        last_sent_index = 0
+        next_seq = 0
 
         try:
             while True:
@@ -114,8 +114,8 @@ async def stream_run(
                     logger.info(f"Client disconnected: session_id={session_id}")
                     break
 
-                # Get current progress
-                progress = progress_store.get_session_progress(session_id)
+                # Get events added since the last poll
+                progress = progress_store.get_session_delta(session_id, next_seq)
 
                 if not progress:
                     # Session not found yet, wait and retry
@@ -123,12 +123,11 @@ async def stream_run(
                     continue
 
                 # Send new events (delta streaming)
-                if last_sent_index < len(progress.events):
-                    for event in progress.events[last_sent_index:]:
-                        # Send event directly (useSSE hook will wrap it)
-                        yield f"data: {json.dumps(event)}\n\n"
+                for event in progress.events:
+                    # Send event directly (useSSE hook will wrap it)
+                    yield f"data: {json_utils.dumps(event).decode()}\n\n"
 
-                    last_sent_index = len(progress.events)
+                next_seq = progress.next_seq
 
                 # Check if workflow completed
                 if progress.status in ["completed", "error"]:
@@ -138,7 +137,7 @@ async def stream_run(
                         "status": progress.status,
                         "timestamp": progress.updated_at
                     }
-                    yield f"event: workflow_{progress.status}\ndata: {json.dumps(final_event)}\n\n"
+                    yield f"event: workflow_{progress.status}\ndata: {json_utils.dumps(final_event).decode()}\n\n"
 
                     logger.info(f"Workflow {progress.status}: session_id={session_id}")
                     break
@@ -183,7 +182,7 @@ async def get_run_status(session_id: str):
         from ..services.storage import get_session_writer
         try:
             writer = get_session_writer()
-            events = writer.read_session(session_id)
+            events = await writer.aread_session(session_id)
             status = "completed" if events else "not_found"
         except FileNotFoundError:
             status = "not_found"
@@ -61,7 +61,7 @@ async def list_sessions(
         session_id = session_file.stem
 
         try:
-            events = reader.read_session(session_id)
+            events = await reader.aread_session(session_id)
 
             if not events:
                 continue
@@ -132,9 +132,9 @@ async def get_session(
         if event_type:
             events = reader.filter_events(session_id, event_type)
             # Need to read all events for metadata
-            all_events = reader.read_session(session_id)
+            all_events = await reader.aread_session(session_id)
         else:
-            events = reader.read_session(session_id)
+            events = await reader.aread_session(session_id)
             all_events = events
 
         if not all_events:
@@ -242,7 +242,7 @@ async def get_evidence_map(session_id: str):
 
     try:
         # load_artifact returns just the data field, not the full artifact structure
-        evidence_data = artifact_reader.load_artifact(artifact_id)
+        evidence_data = await artifact_reader.aload_artifact(artifact_id)
 
         if evidence_data is None:
             raise HTTPException(
@@ -347,7 +347,7 @@ async def trigger_compaction(
 
         # Get session events
         reader = get_session_writer()
-        events = reader.read_session(session_id)
+        events = await reader.aread_session(session_id)
 
         if not events:
             raise HTTPException(
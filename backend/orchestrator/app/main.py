@@ -21,7 +21,7 @@ import sys
 from .api import runs, sessions, registries, checkpoints, memory, artifacts
 from .api.models import HealthCheckResponse, ErrorResponse
 from .services.registry_manager import init_registry_manager, get_registry_manager
-from .services.storage import init_storage
+from .services.storage import init_storage, get_session_writer
 from .config import get_config
 
 # Configure logging
@@ -159,6 +159,18 @@ async def shutdown():
             except Exception as e:
                 logger.error(f"Failed to cancel workflow {session_id}: {e}")
 
+    # Retry registry writes that failed earlier
+    try:
+        get_registry_manager().flush()
+    except Exception as e:
+        logger.error(f"Failed to flush registry changes: {e}")
+
+    # Write session events still waiting for their group commit
+    try:
+        get_session_writer().flush()
+    except Exception as e:
+        logger.error(f"Failed to flush session events: {e}")
+
     logger.info("Shutdown complete")
 
 
@@ -8,11 +8,13 @@ Demonstrates:
 - Version metadata management
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from pathlib import Path
 from datetime import datetime
 import json
 import logging
+import threading
+from collections import OrderedDict
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
@@ -60,18 +62,27 @@ class ArtifactVersionStore:
     - storage/artifacts/{artifact_id}/v1.json (version content)
     - storage/artifacts/{artifact_id}/v2.json
     - storage/artifacts/{artifact_id}/metadata.json (lineage)
+
+    Versions are immutable once written, so loaded versions are kept in an
+    in-process LRU cache keyed by (artifact_id, version). Cached Artifact
+    objects are shared between callers and must be treated as read-only.
     """
 
-    def __init__(self, storage_path: str = "storage/artifacts"):
+    def __init__(self, storage_path: str = "storage/artifacts", cache_size: int = 128):
         """
         Initialize artifact version store.
 
         Args:
             storage_path: Base path for artifact storage
+            cache_size: Maximum artifact versions kept in the in-process cache
         """
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
 
+        self._cache: "OrderedDict[Tuple[str, int], Artifact]" = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_lock = threading.Lock()
+
         logger.info(f"ArtifactVersionStore initialized at {self.storage_path}")
 
     def _get_artifact_dir(self, artifact_id: str) -> Path:
@@ -115,6 +126,24 @@ class ArtifactVersionStore:
             logger.error(f"Failed to save metadata for artifact {metadata.artifact_id}: {e}")
             raise
 
+    def _cache_get(self, artifact_id: str, version: int) -> Optional[Artifact]:
+        """Get a cached artifact version (marks it most recently used)."""
+        key = (artifact_id, version)
+        with self._cache_lock:
+            artifact = self._cache.get(key)
+            if artifact is not None:
+                self._cache.move_to_end(key)
+            return artifact
+
+    def _cache_put(self, artifact: Artifact) -> None:
+        """Cache an artifact version, evicting the least recently used entry."""
+        key = (artifact.artifact_id, artifact.version)
+        with self._cache_lock:
+            self._cache[key] = artifact
+            self._cache.move_to_end(key)
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
     def generate_handle(self, artifact_id: str, version: int) -> str:
         """
         Generate artifact handle for a specific version.
@@ -224,6 +253,11 @@ class ArtifactVersionStore:
             Artifact object or None if not found
         """
         try:
+            if version is not None:
+                cached = self._cache_get(artifact_id, version)
+                if cached is not None:
+                    return cached
+
             # Load metadata
             artifact_metadata = self._load_metadata(artifact_id)
 
@@ -231,49 +265,104 @@ class ArtifactVersionStore:
                 logger.warning(f"Artifact not found: {artifact_id}")
                 return None
 
-            # Determine version to retrieve
-            if version is None:
-                version = artifact_metadata.current_version
+            return self._load_version(artifact_metadata, version)
 
-            # Find version metadata
-            version_meta = None
-            for v in artifact_metadata.versions:
-                if v.version == version:
-                    version_meta = v
-                    break
+        except Exception as e:
+            logger.error(f"Failed to get artifact version {artifact_id}/v{version}: {e}")
+            return None
 
-            if version_meta is None:
-                logger.warning(f"Version {version} not found for artifact {artifact_id}")
-                return None
+    def get_artifact_versions(
+        self,
+        requests: List[Tuple[str, int]]
+    ) -> List[Optional[Artifact]]:
+        """
+        Retrieve several artifact versions in one call.
 
-            # Load version content
-            version_path = self._get_version_file_path(artifact_id, version)
+        Cached versions are served from memory; for the rest, metadata is
+        loaded once per artifact_id, however many of its versions are requested.
 
-            if not version_path.exists():
-                logger.error(f"Version file missing: {version_path}")
-                return None
+        Args:
+            requests: List of (artifact_id, version) pairs
 
-            with open(version_path, 'r') as f:
-                content = json.load(f)
-
-            # Create Artifact object
-            artifact = Artifact(
-                artifact_id=artifact_id,
-                version=version_meta.version,
-                created_at=version_meta.created_at,
-                parent_version=version_meta.parent_version,
-                handle=version_meta.handle,
-                content=content,
-                metadata=version_meta.metadata,
-                tags=version_meta.tags
-            )
+        Returns:
+            List of Artifact objects (None where not found), in request order
+        """
+        metadata_by_id: Dict[str, Optional[ArtifactMetadata]] = {}
+        results: List[Optional[Artifact]] = []
 
-            return artifact
+        for artifact_id, version in requests:
+            try:
+                cached = self._cache_get(artifact_id, version)
+                if cached is not None:
+                    results.append(cached)
+                    continue
 
-        except Exception as e:
-            logger.error(f"Failed to get artifact version {artifact_id}/v{version}: {e}")
+                if artifact_id not in metadata_by_id:
+                    metadata_by_id[artifact_id] = self._load_metadata(artifact_id)
+
+                artifact_metadata = metadata_by_id[artifact_id]
+                if artifact_metadata is None:
+                    logger.warning(f"Artifact not found: {artifact_id}")
+                    results.append(None)
+                    continue
+
+                results.append(self._load_version(artifact_metadata, version))
+
+            except Exception as e:
+                logger.error(f"Failed to get artifact version {artifact_id}/v{version}: {e}")
+                results.append(None)
+
+        return results
+
+    def _load_version(
+        self,
+        artifact_metadata: ArtifactMetadata,
+        version: Optional[int]
+    ) -> Optional[Artifact]:
+        """Load version content for an artifact whose metadata is already loaded."""
+        artifact_id = artifact_metadata.artifact_id
+
+        # Determine version to retrieve
+        if version is None:
+            version = artifact_metadata.current_version
+
+        # Find version metadata
+        version_meta = None
+        for v in artifact_metadata.versions:
+            if v.version == version:
+                version_meta = v
+                break
+
+        if version_meta is None:
+            logger.warning(f"Version {version} not found for artifact {artifact_id}")
+            return None
+
+        # Load version content
+        version_path = self._get_version_file_path(artifact_id, version)
+
+        if not version_path.exists():
+            logger.error(f"Version file missing: {version_path}")
             return None
 
+        with open(version_path, 'r') as f:
+            content = json.load(f)
+
+        # Create Artifact object
+        artifact = Artifact(
+            artifact_id=artifact_id,
+            version=version_meta.version,
+            created_at=version_meta.created_at,
+            parent_version=version_meta.parent_version,
+            handle=version_meta.handle,
+            content=content,
+            metadata=version_meta.metadata,
+            tags=version_meta.tags
+        )
+
+        self._cache_put(artifact)
+
+        return artifact
+
     def list_artifact_versions(self, artifact_id: str) -> List[ArtifactVersion]:
         """
         List all versions of an artifact.
@@ -341,6 +430,10 @@ class ArtifactVersionStore:
             if version_to_delete is None:
                 return False
 
+            # Drop cached copy (the version number may be reused by a later save)
+            with self._cache_lock:
+                self._cache.pop((artifact_id, version), None)
+
             # Delete version file
             version_path = self._get_version_file_path(artifact_id, version)
             if version_path.exists():
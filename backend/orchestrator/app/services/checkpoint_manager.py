@@ -36,6 +36,7 @@ class CheckpointManager:
         self._checkpoints: Dict[str, CheckpointInstance] = {}
         self._lock = threading.Lock()
         self._session_checkpoints: Dict[str, List[str]] = {}  # session_id -> checkpoint_instance_ids
+        self._resolution_events: Dict[str, threading.Event] = {}  # checkpoint_instance_id -> set when no longer pending
 
         # Checkpoint store for persistence
         self.checkpoint_store = get_checkpoint_store()
@@ -122,6 +123,7 @@ class CheckpointManager:
         # Store in memory
         with self._lock:
             self._checkpoints[checkpoint_instance_id] = checkpoint
+            self._resolution_events[checkpoint_instance_id] = threading.Event()
 
             # Track session checkpoints
             if session_id not in self._session_checkpoints:
@@ -171,6 +173,7 @@ class CheckpointManager:
             checkpoint.status = CheckpointStatus.RESOLVED
             checkpoint.resolution = resolution
             checkpoint.resolved_at = resolution.resolved_at
+            self._signal_resolution(checkpoint_instance_id)
 
             logger.info(
                 f"Resolved checkpoint: {checkpoint_instance_id} "
@@ -293,6 +296,47 @@ class CheckpointManager:
 
         return None
 
+    def wait_for_resolution(
+        self,
+        checkpoint_instance_id: str,
+        timeout: Optional[float] = None
+    ) -> bool:
+        """
+        Block until checkpoint leaves PENDING (resolved, cancelled or timed out).
+
+        Args:
+            checkpoint_instance_id: Checkpoint instance ID
+            timeout: Maximum seconds to wait (None = wait indefinitely)
+
+        Returns:
+            True if the checkpoint was signalled, False if the wait timed out
+        """
+        with self._lock:
+            checkpoint = self._checkpoints.get(checkpoint_instance_id)
+            if checkpoint is None:
+                # Unknown checkpoint - nothing will signal it, so just sleep
+                event = None
+            elif checkpoint.status != CheckpointStatus.PENDING:
+                return True
+            else:
+                event = self._resolution_events.get(checkpoint_instance_id)
+                if event is None:
+                    # Pending checkpoints loaded from disk have no event yet
+                    event = threading.Event()
+                    self._resolution_events[checkpoint_instance_id] = event
+
+        if event is None:
+            threading.Event().wait(timeout)
+            return False
+
+        return event.wait(timeout)
+
+    def _signal_resolution(self, checkpoint_instance_id: str) -> None:
+        """Wake waiters for a checkpoint and drop its event. Caller must hold self._lock."""
+        event = self._resolution_events.pop(checkpoint_instance_id, None)
+        if event is not None:
+            event.set()
+
     def cancel_checkpoint(self, checkpoint_instance_id: str) -> bool:
         """
         Cancel checkpoint (admin only).
@@ -315,6 +359,7 @@ class CheckpointManager:
             # Update checkpoint
             checkpoint.status = CheckpointStatus.CANCELLED
             checkpoint.resolved_at = datetime.utcnow().isoformat() + "Z"
+            self._signal_resolution(checkpoint_instance_id)
 
             logger.info(f"Cancelled checkpoint: {checkpoint_instance_id}")
 
@@ -408,6 +453,7 @@ class CheckpointManager:
             checkpoint.status = CheckpointStatus.TIMEOUT
             checkpoint.resolution = resolution
             checkpoint.resolved_at = resolution.resolved_at
+            self._signal_resolution(checkpoint.checkpoint_instance_id)
 
         # Persist to disk
         self.checkpoint_store.save_checkpoint(checkpoint)
@@ -55,9 +55,10 @@ class CompactionManager:
         """
         self.session_id = session_id
         self.config = get_config()
-        self.compaction_config = self._load_compaction_config()
+        self.compaction_config = self.load_compaction_config()
 
-    def _load_compaction_config(self) -> Dict[str, Any]:
+    @staticmethod
+    def load_compaction_config() -> Dict[str, Any]:
         """Load compaction configuration from context_strategies.json"""
         try:
             with open("registries/context_strategies.json", "r") as f:
@@ -86,23 +87,42 @@ class CompactionManager:
         Returns:
             True if compaction should trigger
         """
-        if not self.compaction_config.get("enabled", False):
+        return self.quick_threshold_check(
+            len(events), estimated_tokens, self.compaction_config
+        )
+
+    @staticmethod
+    def quick_threshold_check(
+        event_count: int, estimated_tokens: int, compaction_config: Dict[str, Any]
+    ) -> bool:
+        """
+        Threshold comparison only - no manager construction or I/O.
+
+        Args:
+            event_count: Number of current session events
+            estimated_tokens: Estimated total tokens in events
+            compaction_config: "compaction" section of context_strategies.json
+
+        Returns:
+            True if compaction should trigger
+        """
+        if not compaction_config.get("enabled", False):
             return False
 
-        trigger_strategy = self.compaction_config.get("trigger_strategy", "token_threshold")
+        trigger_strategy = compaction_config.get("trigger_strategy", "token_threshold")
 
         if trigger_strategy == "token_threshold":
-            threshold = self.compaction_config.get("token_threshold", 8000)
+            threshold = compaction_config.get("token_threshold", 8000)
             return estimated_tokens > threshold
 
         elif trigger_strategy == "event_count":
-            threshold = self.compaction_config.get("event_count_threshold", 100)
-            return len(events) > threshold
+            threshold = compaction_config.get("event_count_threshold", 100)
+            return event_count > threshold
 
         elif trigger_strategy == "both":
-            token_threshold = self.compaction_config.get("token_threshold", 8000)
-            event_threshold = self.compaction_config.get("event_count_threshold", 100)
-            return estimated_tokens > token_threshold or len(events) > event_threshold
+            token_threshold = compaction_config.get("token_threshold", 8000)
+            event_threshold = compaction_config.get("event_count_threshold", 100)
+            return estimated_tokens > token_threshold or event_count > event_threshold
 
         return False
 
@@ -9,6 +9,7 @@ Demonstrates scalability patterns:
 - Intelligent summarization
 """
 
+import json
 from typing import Dict, List, Optional, Any
 import tiktoken
 import logging
@@ -251,18 +252,18 @@ class ContextCompiler:
         # Get budget allocation (from agent override or default)
         budget_allocation = self._get_budget_allocation(agent)
 
-        # Count tokens before compilation
-        tokens_before = (
-            self._count_tokens(original_input or {}) +
-            self._count_tokens(prior_outputs or {}) +
-            self._count_tokens(observations or [])
-        )
+        # Serialize each component once; reused for token counts and the artifact hint
+        component_texts = {
+            "original_input": json.dumps(original_input or {}),
+            "prior_outputs": json.dumps(prior_outputs or {}),
+            "observations": json.dumps(observations or []),
+        }
 
+        # Count tokens before compilation
         components_before = {
-            "original_input": self._count_tokens(original_input or {}),
-            "prior_outputs": self._count_tokens(prior_outputs or {}),
-            "observations": self._count_tokens(observations or []),
+            name: self._count_tokens(text) for name, text in component_texts.items()
         }
+        tokens_before = sum(components_before.values())
 
         # Build raw context for pipeline
         raw_context = {
@@ -273,7 +274,11 @@ class ContextCompiler:
             "metadata": {
                 "max_context_tokens": max_tokens,
                 "session_id": self.session_id,
-            }
+            },
+            # Producer hint for ArtifactResolverProcessor (see base_processor.py)
+            "_artifact_refs_present": any(
+                "artifact://" in text for text in component_texts.values()
+            ),
         }
 
         # Execute processor pipeline
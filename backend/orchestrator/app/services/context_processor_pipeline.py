@@ -13,6 +13,7 @@ from dataclasses import dataclass
 
 from app.services.registry_manager import RegistryManager
 from app.services.processors.base_processor import BaseProcessor, ProcessorResult
+from app.services.storage import get_event_batcher
 
 logger = logging.getLogger(__name__)
 
@@ -182,17 +183,18 @@ class ContextProcessorPipeline:
         )
 
         for processor in self.processors:
-            start_time = time.time()
+            start_time = time.perf_counter_ns()
 
             try:
                 result = processor.process(context, agent_id, self.session_id)
-                execution_time_ms = (time.time() - start_time) * 1000
+                execution_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
 
                 if not result.success:
                     logger.error(
                         f"Processor {processor.processor_id} failed: {result.error}"
                     )
-                    # Continue with original context on failure
+                    # Continue on failure - processors work on the context in
+                    # place, so keys it changed before failing stay changed
                     execution_log.append(
                         {
                             "processor_id": processor.processor_id,
@@ -224,7 +226,7 @@ class ContextProcessorPipeline:
                 )
 
             except Exception as e:
-                execution_time_ms = (time.time() - start_time) * 1000
+                execution_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
                 logger.error(
                     f"Processor {processor.processor_id} raised exception: {e}",
                     exc_info=True,
@@ -237,7 +239,16 @@ class ContextProcessorPipeline:
                         "execution_time_ms": execution_time_ms,
                     }
                 )
-                # Continue with previous context on exception
+                # Continue on exception - as above, keys the processor already
+                # changed in place stay changed
+
+        # Write events processors buffered during this run in one batch
+        try:
+            get_event_batcher().flush(self.session_id)
+        except Exception as e:
+            logger.error(
+                f"Failed to write buffered processor events for session={self.session_id}: {e}"
+            )
 
         # Attach execution log to context metadata
         if "metadata" not in context:
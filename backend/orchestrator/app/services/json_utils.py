@@ -0,0 +1,81 @@
+"""
+JSON helpers shared by storage, SSE streaming, registries and processors.
+
+Uses orjson when it is installed and falls back to stdlib json, both when
+orjson is missing and for values orjson rejects (e.g. integers over 64
+bits, non-str keys, NaN in input text).
+"""
+
+import json
+from typing import Any, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # Optional - everything falls back to stdlib json
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+
+def dumps(
+    value: Any,
+    *,
+    sort_keys: bool = False,
+    indent: bool = False,
+    append_newline: bool = False,
+    non_str_keys: bool = False,
+    separators: Optional[Tuple[str, str]] = None,
+) -> bytes:
+    """
+    Serialize value as JSON bytes.
+
+    Args:
+        value: Value to serialize
+        sort_keys: Sort dict keys
+        indent: Indent with 2 spaces
+        append_newline: End the output with "\\n"
+        non_str_keys: Let orjson serialize non-str dict keys
+        separators: Separators for the stdlib fallback (orjson output is compact)
+
+    Raises:
+        TypeError: If value contains a non-JSON-serializable object
+    """
+    if orjson is not None:
+        option = 0
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if append_newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        if non_str_keys:
+            option |= orjson.OPT_NON_STR_KEYS
+        try:
+            return orjson.dumps(value, option=option)
+        except TypeError:
+            pass  # e.g. non-str keys - stdlib json handles them
+
+    text = json.dumps(
+        value,
+        sort_keys=sort_keys,
+        indent=2 if indent else None,
+        separators=separators,
+    )
+    if append_newline:
+        text += "\n"
+    return text.encode()
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON text or bytes.
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN - stdlib json accepts it (or raises the usual error)
+    return json.loads(data)
@@ -7,6 +7,7 @@ Supports reactive and proactive memory retrieval patterns.
 
 import json
 import logging
+import threading
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
@@ -15,8 +16,26 @@ import uuid
 
 from app.config import get_config
 
+try:
+    import hnswlib  # Approximate nearest-neighbour index for embedding search
+except ImportError:  # Optional - embedding similarity is computed for every memory
+    hnswlib = None
+
 logger = logging.getLogger(__name__)
 
+# Embedding searches over fewer memories than this compare against every
+# memory exactly (the index only pays off for larger stores)
+ANN_INDEX_MIN_MEMORIES = 1000
+
+# Memories embedded per embeddings API request (the API caps a request at
+# 2048 inputs and a total token count, so large cold stores are split)
+EMBEDDING_BATCH_SIZE = 256
+
+# HNSW build/search parameters (recall vs. speed)
+ANN_INDEX_M = 16
+ANN_INDEX_EF_CONSTRUCTION = 200
+ANN_INDEX_EF_SEARCH = 64
+
 
 @dataclass
 class Memory:
@@ -55,6 +74,14 @@ class MemoryManager:
         self.memories_file = self.storage_path / "memories.jsonl"
         self.index_file = self.storage_path / "index.json"
 
+        # Memory embeddings by memory_id (content is immutable, so each
+        # memory is embedded once) and the HNSW index built over them
+        self._embeddings: Dict[str, List[float]] = {}
+        self._ann_index: Optional[Any] = None
+        self._ann_labels: Dict[str, int] = {}  # memory_id -> index label
+        self._ann_next_label = 0  # Labels of deleted memories are not reused
+        self._embedding_lock = threading.Lock()
+
         # Create storage directory if it doesn't exist
         self._ensure_storage()
 
@@ -263,6 +290,7 @@ class MemoryManager:
 
             # Rebuild index
             self._rebuild_index(remaining)
+            self._forget_embeddings([memory_id])
 
             logger.info(f"Memory deleted: {memory_id}")
             return True
@@ -306,6 +334,10 @@ class MemoryManager:
 
                 # Rebuild index
                 self._rebuild_index(valid_memories)
+                valid_ids = {memory.memory_id for memory in valid_memories}
+                self._forget_embeddings(
+                    [m.memory_id for m in all_memories if m.memory_id not in valid_ids]
+                )
 
                 logger.info(f"Retention policy applied: {deleted_count} expired memories deleted")
 
@@ -404,7 +436,7 @@ class MemoryManager:
                 # Embedding-based similarity (requires OpenAI API)
                 try:
                     scored_memories = self._compute_embedding_similarity(
-                        query_text, valid_memories
+                        query_text, valid_memories, limit=limit
                     )
                 except Exception as e:
                     logger.warning(
@@ -574,12 +606,16 @@ class MemoryManager:
         return scored_memories
 
     def _compute_embedding_similarity(
-        self, query_text: str, memories: List[Memory]
+        self, query_text: str, memories: List[Memory], limit: Optional[int] = None
     ) -> List[tuple[Memory, float]]:
         """
         Compute embedding-based similarity using OpenAI embeddings API.
 
         More accurate than keyword-based, but requires API key and costs $.
+        Memory embeddings are cached, so only new memories are embedded
+        (in requests of up to EMBEDDING_BATCH_SIZE). With hnswlib installed, stores of at least
+        ANN_INDEX_MIN_MEMORIES memories are searched through an HNSW index
+        and only the top `limit` candidates are scored.
         """
         try:
             from openai import OpenAI
@@ -597,15 +633,26 @@ class MemoryManager:
             )
             query_embedding = query_response.data[0].embedding
 
-            # Generate memory embeddings and compute cosine similarity
+            # Embed memories not seen before, caching each batch as it returns
+            # (a later failure doesn't discard the batches already embedded)
+            missing = [m for m in memories if m.memory_id not in self._embeddings]
+            for start in range(0, len(missing), EMBEDDING_BATCH_SIZE):
+                batch = missing[start:start + EMBEDDING_BATCH_SIZE]
+                memory_response = client.embeddings.create(
+                    model="text-embedding-ada-002", input=[m.content for m in batch]
+                )
+                with self._embedding_lock:
+                    for memory, item in zip(batch, memory_response.data):
+                        self._embeddings[memory.memory_id] = item.embedding
+
+            if hnswlib is not None and limit and len(memories) >= ANN_INDEX_MIN_MEMORIES:
+                return self._search_ann_index(query_embedding, memories, limit)
+
+            # Compute cosine similarity against every memory
             scored_memories = []
 
             for memory in memories:
-                # Use content as embedding input
-                memory_response = client.embeddings.create(
-                    model="text-embedding-ada-002", input=memory.content
-                )
-                memory_embedding = memory_response.data[0].embedding
+                memory_embedding = self._embeddings[memory.memory_id]
 
                 # Compute cosine similarity
                 similarity = self._cosine_similarity(query_embedding, memory_embedding)
@@ -620,6 +667,63 @@ class MemoryManager:
             logger.error(f"Embedding similarity computation failed: {e}")
             raise
 
+    def _search_ann_index(
+        self, query_embedding: List[float], memories: List[Memory], limit: int
+    ) -> List[tuple[Memory, float]]:
+        """
+        Find the `limit` memories nearest to the query through the HNSW index.
+
+        Memories are added to the index on first use (deleted ones are marked
+        deleted by _forget_embeddings). The search is filtered to the labels
+        of `memories`.
+        """
+        with self._embedding_lock:
+            if self._ann_index is None:
+                self._ann_index = hnswlib.Index(space="cosine", dim=len(query_embedding))
+                self._ann_index.init_index(
+                    max_elements=max(len(memories) * 2, ANN_INDEX_MIN_MEMORIES),
+                    ef_construction=ANN_INDEX_EF_CONSTRUCTION,
+                    M=ANN_INDEX_M,
+                )
+
+            new_ids = [m.memory_id for m in memories if m.memory_id not in self._ann_labels]
+            if new_ids:
+                # Deleted elements still occupy index capacity
+                capacity = self._ann_index.get_max_elements()
+                needed = self._ann_index.get_current_count() + len(new_ids)
+                if needed > capacity:
+                    self._ann_index.resize_index(max(needed, capacity * 2))
+
+                first_label = self._ann_next_label
+                labels = list(range(first_label, first_label + len(new_ids)))
+                self._ann_next_label += len(new_ids)
+                self._ann_index.add_items(
+                    [self._embeddings[memory_id] for memory_id in new_ids], labels
+                )
+                self._ann_labels.update(zip(new_ids, labels))
+
+            by_label = {self._ann_labels[m.memory_id]: m for m in memories}
+            k = min(limit, len(by_label))
+            self._ann_index.set_ef(max(ANN_INDEX_EF_SEARCH, k))
+            found_labels, distances = self._ann_index.knn_query(
+                query_embedding, k=k, filter=lambda label: label in by_label
+            )
+
+        # Cosine space distance is 1 - cosine similarity
+        return [
+            (by_label[int(label)], 1.0 - float(distance))
+            for label, distance in zip(found_labels[0], distances[0])
+        ]
+
+    def _forget_embeddings(self, memory_ids: List[str]) -> None:
+        """Drop cached embeddings (and index entries) of deleted memories."""
+        with self._embedding_lock:
+            for memory_id in memory_ids:
+                self._embeddings.pop(memory_id, None)
+                label = self._ann_labels.pop(memory_id, None)
+                if label is not None:
+                    self._ann_index.mark_deleted(label)
+
     def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
         """Compute cosine similarity between two vectors."""
         import math
@@ -11,21 +11,85 @@ Demonstrates scalability patterns:
 """
 
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from .registry_manager import get_registry_manager, AgentMetadata, WorkflowDefinition
 from .governance_enforcer import GovernanceEnforcer, create_governance_enforcer
 from .context_compiler import ContextCompiler, create_context_compiler
 from .agent_react_loop import create_agent_react_loop, AgentReActResult
-from .storage import get_session_writer
+from .storage import get_session_writer, utc_timestamp
 from .progress_store import get_progress_store
 from .checkpoint_manager import get_checkpoint_manager
 from ..config import get_config
 from ..models.checkpoint_models import CheckpointConfig, CheckpointInstance, CheckpointStatus, CheckpointResolution
+import logging
+import operator
 import re
 import time
+from collections import defaultdict
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+
+# Upper bound on a single blocking wait for checkpoint resolution. The wait
+# is normally ended by the resolution event; this only bounds re-checks.
+CHECKPOINT_RECHECK_SECONDS = 30.0
+
+# Retry interval when the deadline has passed but the checkpoint manager
+# has not yet applied the timeout (clock granularity between the two).
+CHECKPOINT_TIMEOUT_GRACE_SECONDS = 0.05
+
+# Resolution action reported when an admin cancels a checkpoint - the
+# workflow stops, as it never proceeds past a cancelled checkpoint
+CHECKPOINT_CANCELLED_ACTION = "cancelled"
+
+# Checkpoint trigger expressions: "fraud_score > 0.7", "claim.type == \"auto\""
+# Two-char operators come first so ">=" is not matched as ">".
+_EXPRESSION_PATTERN = re.compile(r'(\w+(?:\.\w+)*)\s*(>=|<=|==|>|<)\s*([0-9.]+|"[^"]*")')
+
+_COMPARISON_OPS = {
+    ">": operator.gt,
+    "<": operator.lt,
+    "==": operator.eq,
+    ">=": operator.ge,
+    "<=": operator.le,
+}
+
+# Checkpoint trigger condition evaluators keyed by trigger_condition.type:
+# (runner, expression, agent_output, original_input) -> bool
+_CONDITION_EVALUATORS = {
+    "output_based": lambda runner, expr, output, _input: (
+        runner._evaluate_expression(expr, output) if output else True
+    ),
+    "input_based": lambda runner, expr, _output, original_input: (
+        runner._evaluate_expression(expr, original_input)
+    ),
+    "always": lambda *_: True,
+}
+
+
+@lru_cache(maxsize=512)
+def _parse_expression(expression: str) -> Optional[Tuple[Tuple[str, ...], str, Any]]:
+    """Parse a trigger expression into (field_path_parts, operator, typed_value)."""
+    match = _EXPRESSION_PATTERN.match(expression)
+    if not match:
+        return None
+
+    field_path, op, value_str = match.groups()
+
+    # Parse value (number or string)
+    if value_str.startswith('"'):
+        value = value_str.strip('"')
+    else:
+        try:
+            value = float(value_str)
+        except ValueError:
+            return None
+
+    return tuple(field_path.split('.')), op, value
 
 
 class OrchestratorActionType(str, Enum):
@@ -102,6 +166,18 @@ class OrchestratorRunner:
         self.checkpoint_manager = get_checkpoint_manager()
         self.config = get_config()
 
+        # LLM reasoning helpers, bound once per runner instead of per iteration.
+        # Imported here rather than at module top: response_parser imports this module.
+        from ..prompts.react_prompts import build_orchestrator_prompt
+        from .response_parser import parse_orchestrator_response, create_fallback_orchestrator_response, ResponseParseError
+        from .llm_client import create_llm_client
+
+        self._build_orchestrator_prompt = build_orchestrator_prompt
+        self._parse_orchestrator_response = parse_orchestrator_response
+        self._create_fallback_response = create_fallback_orchestrator_response
+        self._response_parse_error = ResponseParseError
+        self._create_llm_client = create_llm_client
+
         # Load workflow and orchestrator agent
         self.workflow = self.registry.get_workflow(workflow_id)
         if not self.workflow:
@@ -111,6 +187,9 @@ class OrchestratorRunner:
         if not self.orchestrator_agent:
             raise ValueError("Orchestrator agent not found in registry")
 
+        # HITL checkpoint configs, parsed once and bucketed by trigger point
+        self._build_checkpoint_indices()
+
         # State
         self.observations: List[Dict[str, Any]] = []  # Orchestrator's observations (agent results)
         self.iteration = 0
@@ -119,6 +198,17 @@ class OrchestratorRunner:
         self.agents_executed_order: List[str] = []  # Track execution order
         self.last_invoked_agent_id: Optional[str] = None  # Track for handoff scoping (Phase 6)
 
+        # Fixed fields shared by every logged event (key order = event key order);
+        # orchestrator_iteration is refreshed at iteration boundaries
+        self._event_base: Dict[str, Any] = {
+            "event_type": None,
+            "session_id": session_id,
+            "workflow_id": workflow_id,
+            "orchestrator_iteration": self.iteration,
+            "timestamp": None,
+        }
+        self._start_monotonic: Optional[float] = None  # Set when execute() starts
+
     def execute(
         self,
         original_input: Dict[str, Any]
@@ -138,6 +228,8 @@ class OrchestratorRunner:
         Returns:
             OrchestratorResult with evidence map or error
         """
+        self._start_monotonic = time.monotonic()
+
         self._log_event("orchestrator_started", {
             "workflow_id": self.workflow_id,
             "workflow_mode": self.workflow.mode,
@@ -162,6 +254,9 @@ class OrchestratorRunner:
                 resolution = self._wait_for_checkpoint_resolution(pre_workflow_checkpoint)
 
                 # Handle resolution
+                if resolution.action == CHECKPOINT_CANCELLED_ACTION:
+                    return self._checkpoint_cancelled_result(pre_workflow_checkpoint, warnings)
+
                 if resolution.action == "reject":
                     return OrchestratorResult(
                         session_id=self.session_id,
@@ -181,6 +276,7 @@ class OrchestratorRunner:
             # Orchestrator ReAct Loop
             while self.iteration < self.orchestrator_agent.max_iterations:
                 self.iteration += 1
+                self._event_base["orchestrator_iteration"] = self.iteration
 
                 # Check workflow timeout
                 if self._check_workflow_timeout():
@@ -203,17 +299,24 @@ class OrchestratorRunner:
 
                 # Step 3: Handle orchestrator action
                 if reasoning.action.type == OrchestratorActionType.INVOKE_AGENTS:
+                    agent_requests = self._dedupe_agent_requests(
+                        reasoning.action.agent_requests or []
+                    )
+
                     # Execute agent invocations
                     success = self._execute_agent_invocations(
-                        reasoning.action.agent_requests or [],
+                        agent_requests,
                         original_input
                     )
                     if not success:
                         warnings.append("Some agent invocations failed")
 
                     # HITL Checkpoint: After-Agent (check each executed agent)
-                    for agent_request in (reasoning.action.agent_requests or []):
+                    for agent_request in agent_requests:
                         agent_id = agent_request.agent_id
+                        if agent_id not in self._after_agent_checkpoints:
+                            continue  # No checkpoint configured for this agent
+
                         agent_output = self.prior_outputs.get(agent_id)
 
                         if agent_output:
@@ -231,6 +334,9 @@ class OrchestratorRunner:
                                 resolution = self._wait_for_checkpoint_resolution(checkpoint)
 
                                 # Handle resolution
+                                if resolution.action == CHECKPOINT_CANCELLED_ACTION:
+                                    return self._checkpoint_cancelled_result(checkpoint, warnings)
+
                                 if resolution.action == "cancel_workflow":
                                     return OrchestratorResult(
                                         session_id=self.session_id,
@@ -267,6 +373,9 @@ class OrchestratorRunner:
                         resolution = self._wait_for_checkpoint_resolution(completion_checkpoint)
 
                         # Handle resolution
+                        if resolution.action == CHECKPOINT_CANCELLED_ACTION:
+                            return self._checkpoint_cancelled_result(completion_checkpoint, warnings)
+
                         if resolution.action == "reject":
                             # Don't complete - continue loop for revision
                             warnings.append("Completion rejected at checkpoint - continuing workflow")
@@ -348,6 +457,13 @@ class OrchestratorRunner:
                 total_agent_invocations=sum(self.agent_invocations.values())
             )
 
+        finally:
+            # Make the run's events durable before reporting it finished
+            try:
+                self.storage.flush_sync(self.session_id)
+            except Exception as e:
+                logger.error(f"Failed to write events for session={self.session_id}: {e}")
+
     # ============= Private Methods =============
 
     def _compile_orchestrator_context(
@@ -416,10 +532,6 @@ class OrchestratorRunner:
 
         Demonstrates: Meta-agent LLM integration with dynamic agent discovery.
         """
-        from ..prompts.react_prompts import build_orchestrator_prompt
-        from .response_parser import parse_orchestrator_response, create_fallback_orchestrator_response, ResponseParseError
-        from .llm_client import create_llm_client
-
         if not self.llm_client:
             # Stub fallback - follows suggested_sequence
             suggested_sequence = self.workflow.suggested_sequence or []
@@ -457,7 +569,7 @@ class OrchestratorRunner:
 
         try:
             # Build orchestrator ReAct prompt
-            messages = build_orchestrator_prompt(
+            messages = self._build_orchestrator_prompt(
                 agent_name=self.orchestrator_agent.name,
                 agent_description=self.orchestrator_agent.description,
                 workflow_goal=self.workflow.goal,
@@ -473,23 +585,23 @@ class OrchestratorRunner:
                 raise RuntimeError(f"Model profile '{self.orchestrator_agent.model_profile_id}' not found")
 
             # Create LLM client for orchestrator's model
-            llm_client = create_llm_client(model_profile, self.session_id)
+            llm_client = self._create_llm_client(model_profile, self.session_id)
 
             # Call LLM
             llm_response = llm_client.call(messages)
 
             # Parse response
-            reasoning = parse_orchestrator_response(llm_response.content)
+            reasoning = self._parse_orchestrator_response(llm_response.content)
 
             return reasoning
 
-        except ResponseParseError as e:
+        except self._response_parse_error as e:
             # Parsing failed - return fallback
             self._log_event("llm_response_parse_error", {
                 "error": str(e),
                 "iteration": self.iteration
             })
-            return create_fallback_orchestrator_response(str(e), self.agents_executed_order)
+            return self._create_fallback_response(str(e), self.agents_executed_order)
 
         except Exception as e:
             # LLM call failed - return error fallback
@@ -497,7 +609,32 @@ class OrchestratorRunner:
                 "error": str(e),
                 "iteration": self.iteration
             })
-            return create_fallback_orchestrator_response(f"LLM call failed: {str(e)}", self.agents_executed_order)
+            return self._create_fallback_response(f"LLM call failed: {str(e)}", self.agents_executed_order)
+
+    def _dedupe_agent_requests(
+        self,
+        agent_requests: List[AgentInvocationRequest]
+    ) -> List[AgentInvocationRequest]:
+        """
+        Drop repeated agent_ids from one orchestrator action (first request wins).
+
+        LLM responses occasionally list the same agent twice; running it twice
+        burns tokens and the workflow invocation budget.
+        """
+        seen = set()
+        deduped = [
+            req for req in agent_requests
+            if not (req.agent_id in seen or seen.add(req.agent_id))
+        ]
+
+        if len(deduped) != len(agent_requests):
+            self._log_event("duplicate_agent_requests_dropped", {
+                "iteration": self.iteration,
+                "requested": [req.agent_id for req in agent_requests],
+                "dropped_count": len(agent_requests) - len(deduped)
+            })
+
+        return deduped
 
     def _execute_agent_invocations(
         self,
@@ -566,7 +703,7 @@ class OrchestratorRunner:
                     "result": agent_result.output,
                     "iterations_used": agent_result.iterations_used,
                     "tool_calls_made": agent_result.tool_calls_made,
-                    "timestamp": datetime.utcnow().isoformat() + "Z"
+                    "timestamp": utc_timestamp()
                 })
 
                 self._log_event("agent_invocation_completed", {
@@ -722,13 +859,17 @@ class OrchestratorRunner:
                 "recommended_action": rec_output.get("recommended_action")
             }
 
-        # Compile supporting evidence from all agents
-        for agent_id, output in self.prior_outputs.items():
-            evidence_map["supporting_evidence"].append({
+        # Compile supporting evidence from all agents, in execution order
+        # (dict.fromkeys drops repeat invocations of the same agent)
+        evidence_map["supporting_evidence"] = [
+            {
                 "source": agent_id,
                 "evidence_type": "agent_output",
-                "summary": str(output)[:200]  # Truncate for brevity
-            })
+                "summary": str(self.prior_outputs[agent_id])[:200]  # Truncate for brevity
+            }
+            for agent_id in dict.fromkeys(self.agents_executed_order)
+            if agent_id in self.prior_outputs
+        ]
 
         return evidence_map
 
@@ -738,35 +879,66 @@ class OrchestratorRunner:
 
         Demonstrates: Time-based safety mechanism.
         """
-        # This will be implemented with actual timing in Phase 6
-        # For now, just check iteration count as proxy
-        max_duration = self.config.workflow.max_duration_seconds
-        # TODO: Track actual elapsed time
-        return False
+        if self._start_monotonic is None:
+            return False
+
+        elapsed = time.monotonic() - self._start_monotonic
+        return elapsed >= self.config.workflow.max_duration_seconds
 
     # ============= HITL Checkpoint Methods =============
 
+    def _build_checkpoint_indices(self) -> None:
+        """
+        Parse workflow hitl_checkpoints into CheckpointConfig buckets by trigger point.
+
+        Each config is validated exactly once, here at runner construction;
+        the per-step checks reuse the validated instances. Invalid configs
+        are logged and skipped rather than failing the whole workflow.
+        """
+        self._pre_workflow_checkpoints: List[CheckpointConfig] = []
+        self._after_agent_checkpoints: Dict[str, List[CheckpointConfig]] = defaultdict(list)
+        self._before_completion_checkpoints: List[CheckpointConfig] = []
+
+        for checkpoint_config_dict in self.workflow.hitl_checkpoints or []:
+            try:
+                checkpoint_config = CheckpointConfig(**checkpoint_config_dict)
+            except (ValidationError, TypeError) as e:
+                checkpoint_id = (
+                    checkpoint_config_dict.get("checkpoint_id")
+                    if isinstance(checkpoint_config_dict, dict) else None
+                )
+                logger.warning(
+                    f"Skipping invalid HITL checkpoint config '{checkpoint_id}' "
+                    f"in workflow '{self.workflow_id}': {e}"
+                )
+                continue
+
+            trigger_point = checkpoint_config.trigger_point
+            if trigger_point == "pre_workflow":
+                self._pre_workflow_checkpoints.append(checkpoint_config)
+            elif trigger_point == "after_agent":
+                self._after_agent_checkpoints[checkpoint_config.agent_id].append(checkpoint_config)
+            elif trigger_point == "before_completion":
+                self._before_completion_checkpoints.append(checkpoint_config)
+
+        # Plain dict: lookups for agents without checkpoints must not insert keys
+        self._after_agent_checkpoints = dict(self._after_agent_checkpoints)
+
     def _check_pre_workflow_checkpoint(
         self,
         original_input: Dict[str, Any]
     ) -> Optional[CheckpointInstance]:
         """Check if pre-workflow checkpoint is configured and should trigger."""
-        hitl_checkpoints = self.workflow.hitl_checkpoints if hasattr(self.workflow, 'hitl_checkpoints') else []
-
-        for checkpoint_config_dict in hitl_checkpoints:
-            if checkpoint_config_dict.get("trigger_point") == "pre_workflow":
-                # Convert dict to CheckpointConfig model
-                checkpoint_config = CheckpointConfig(**checkpoint_config_dict)
-
-                # Evaluate trigger condition (if exists)
-                if self._evaluate_checkpoint_condition(checkpoint_config, None, original_input):
-                    # Create checkpoint
-                    return self.checkpoint_manager.create_checkpoint(
-                        session_id=self.session_id,
-                        workflow_id=self.workflow_id,
-                        checkpoint_config=checkpoint_config,
-                        context_data={"original_input": original_input}
-                    )
+        for checkpoint_config in self._pre_workflow_checkpoints:
+            # Evaluate trigger condition (if exists)
+            if self._evaluate_checkpoint_condition(checkpoint_config, None, original_input):
+                # Create checkpoint
+                return self.checkpoint_manager.create_checkpoint(
+                    session_id=self.session_id,
+                    workflow_id=self.workflow_id,
+                    checkpoint_config=checkpoint_config,
+                    context_data={"original_input": original_input}
+                )
 
         return None
 
@@ -779,69 +951,58 @@ class OrchestratorRunner:
         if not agent_output:
             return None
 
-        hitl_checkpoints = self.workflow.hitl_checkpoints if hasattr(self.workflow, 'hitl_checkpoints') else []
-
-        for checkpoint_config_dict in hitl_checkpoints:
-            if (checkpoint_config_dict.get("trigger_point") == "after_agent" and
-                checkpoint_config_dict.get("agent_id") == agent_id):
-
-                # Convert dict to CheckpointConfig model
-                checkpoint_config = CheckpointConfig(**checkpoint_config_dict)
-
-                # Evaluate trigger condition (if exists)
-                if self._evaluate_checkpoint_condition(checkpoint_config, agent_output, {}):
-                    # Create checkpoint with agent output as context
-                    return self.checkpoint_manager.create_checkpoint(
-                        session_id=self.session_id,
-                        workflow_id=self.workflow_id,
-                        checkpoint_config=checkpoint_config,
-                        context_data={
-                            "agent_id": agent_id,
-                            "agent_output": agent_output,
-                            "prior_outputs": self.prior_outputs
-                        }
-                    )
-
-        return None
-
-    def _check_before_completion_checkpoint(
-        self,
-        evidence_map: Dict[str, Any]
-    ) -> Optional[CheckpointInstance]:
-        """Check if before-completion checkpoint is configured."""
-        hitl_checkpoints = self.workflow.hitl_checkpoints if hasattr(self.workflow, 'hitl_checkpoints') else []
-
-        for checkpoint_config_dict in hitl_checkpoints:
-            if checkpoint_config_dict.get("trigger_point") == "before_completion":
-                # Convert dict to CheckpointConfig model
-                checkpoint_config = CheckpointConfig(**checkpoint_config_dict)
-
-                # Create checkpoint with evidence map as context
+        for checkpoint_config in self._after_agent_checkpoints.get(agent_id, ()):
+            # Evaluate trigger condition (if exists)
+            if self._evaluate_checkpoint_condition(checkpoint_config, agent_output, {}):
+                # Create checkpoint with agent output as context
                 return self.checkpoint_manager.create_checkpoint(
                     session_id=self.session_id,
                     workflow_id=self.workflow_id,
                     checkpoint_config=checkpoint_config,
                     context_data={
-                        "evidence_map": evidence_map,
-                        "agents_executed": self.agents_executed_order,
+                        "agent_id": agent_id,
+                        "agent_output": agent_output,
                         "prior_outputs": self.prior_outputs
                     }
                 )
 
         return None
 
+    def _check_before_completion_checkpoint(
+        self,
+        evidence_map: Dict[str, Any]
+    ) -> Optional[CheckpointInstance]:
+        """Check if before-completion checkpoint is configured (the first one is used)."""
+        checkpoint_configs = self._before_completion_checkpoints
+        if not checkpoint_configs:
+            return None
+        checkpoint_config = checkpoint_configs[0]
+
+        # Create checkpoint with evidence map as context
+        return self.checkpoint_manager.create_checkpoint(
+            session_id=self.session_id,
+            workflow_id=self.workflow_id,
+            checkpoint_config=checkpoint_config,
+            context_data={
+                "evidence_map": evidence_map,
+                "agents_executed": self.agents_executed_order,
+                "prior_outputs": self.prior_outputs
+            }
+        )
+
     def _wait_for_checkpoint_resolution(
         self,
         checkpoint: CheckpointInstance
     ) -> CheckpointResolution:
         """
-        Wait for checkpoint to be resolved (blocking with polling).
+        Wait for checkpoint to be resolved (blocking, event-driven).
 
-        Uses exponential backoff to reduce CPU usage during wait.
-        Handles timeout logic.
+        Blocks on the checkpoint manager's resolution event instead of polling,
+        so a human decision unblocks the workflow immediately.
+        Handles timeout logic: the deadline is computed once up front, so
+        the wait never overshoots the checkpoint's remaining budget.
         """
-        poll_interval = 1.0  # Start with 1 second
-        max_poll_interval = 10.0
+        deadline = self._checkpoint_deadline(checkpoint)
 
         while True:
             # Check if resolved
@@ -856,19 +1017,82 @@ class OrchestratorRunner:
                 })
                 return current.resolution
 
-            # Check timeout
-            timeout_action = self.checkpoint_manager.check_timeout(checkpoint.checkpoint_instance_id)
-            if timeout_action:
+            # Timed out by the manager's background checker
+            if current and current.status == CheckpointStatus.TIMEOUT and current.resolution:
                 self._log_event("checkpoint_timeout", {
                     "checkpoint_id": checkpoint.checkpoint_id,
                     "checkpoint_instance_id": checkpoint.checkpoint_instance_id,
-                    "timeout_action": timeout_action
+                    "timeout_action": current.resolution.action
                 })
-                return self._handle_checkpoint_timeout(checkpoint, timeout_action)
+                return current.resolution
+
+            # Cancelled by an admin - stop waiting and continue the workflow
+            if current and current.status == CheckpointStatus.CANCELLED:
+                self._log_event("checkpoint_cancelled", {
+                    "checkpoint_id": checkpoint.checkpoint_id,
+                    "checkpoint_instance_id": checkpoint.checkpoint_instance_id
+                })
+                return CheckpointResolution(
+                    action=CHECKPOINT_CANCELLED_ACTION,
+                    user_id="system",
+                    user_role="system",
+                    comments="Checkpoint cancelled",
+                    resolved_at=current.resolved_at or utc_timestamp()
+                )
+
+            remaining = (
+                CHECKPOINT_RECHECK_SECONDS if deadline is None
+                else deadline - time.monotonic()
+            )
+
+            # Check timeout (only once the deadline has passed)
+            if remaining <= 0:
+                timeout_action = self.checkpoint_manager.check_timeout(checkpoint.checkpoint_instance_id)
+                if timeout_action:
+                    self._log_event("checkpoint_timeout", {
+                        "checkpoint_id": checkpoint.checkpoint_id,
+                        "checkpoint_instance_id": checkpoint.checkpoint_instance_id,
+                        "timeout_action": timeout_action
+                    })
+                    return self._handle_checkpoint_timeout(checkpoint, timeout_action)
+
+                # Manager's wall clock has not reached timeout_at yet
+                remaining = CHECKPOINT_TIMEOUT_GRACE_SECONDS
+
+            # Block until resolved/cancelled, or until the timeout is due
+            self.checkpoint_manager.wait_for_resolution(
+                checkpoint.checkpoint_instance_id,
+                timeout=min(remaining, CHECKPOINT_RECHECK_SECONDS)
+            )
+
+    def _checkpoint_deadline(
+        self,
+        checkpoint: CheckpointInstance
+    ) -> Optional[float]:
+        """Monotonic deadline for a checkpoint's timeout (None if it never times out)."""
+        if not checkpoint.timeout_at:
+            return None
+
+        timeout_time = datetime.fromisoformat(checkpoint.timeout_at.rstrip("Z"))
+        remaining = (timeout_time - datetime.utcnow()).total_seconds()
+        return time.monotonic() + remaining
 
-            # Poll with exponential backoff
-            time.sleep(poll_interval)
-            poll_interval = min(poll_interval * 1.5, max_poll_interval)
+    def _checkpoint_cancelled_result(
+        self,
+        checkpoint: CheckpointInstance,
+        warnings: List[str]
+    ) -> OrchestratorResult:
+        """Result for a workflow stopped because its checkpoint was cancelled."""
+        return OrchestratorResult(
+            session_id=self.session_id,
+            workflow_id=self.workflow_id,
+            status="cancelled",
+            completion_reason="checkpoint_cancelled",
+            agents_executed=self.agents_executed_order,
+            total_iterations=self.iteration,
+            total_agent_invocations=sum(self.agent_invocations.values()),
+            warnings=warnings + [f"Workflow cancelled: checkpoint {checkpoint.checkpoint_id} was cancelled"]
+        )
 
     def _handle_checkpoint_timeout(
         self,
@@ -881,7 +1105,7 @@ class OrchestratorRunner:
             user_id="system",
             user_role="system",
             comments=f"Checkpoint timed out - automatic action: {timeout_action}",
-            resolved_at=datetime.utcnow().isoformat() + "Z"
+            resolved_at=utc_timestamp()
         )
 
     def _evaluate_checkpoint_condition(
@@ -898,17 +1122,13 @@ class OrchestratorRunner:
         if not checkpoint_config.trigger_condition:
             return True  # No condition = always trigger
 
-        condition_type = checkpoint_config.trigger_condition.type
-        condition_expr = checkpoint_config.trigger_condition.condition
+        trigger_condition = checkpoint_config.trigger_condition
+        evaluator = _CONDITION_EVALUATORS.get(trigger_condition.type)
 
-        if condition_type == "output_based" and agent_output:
-            return self._evaluate_expression(condition_expr, agent_output)
-        elif condition_type == "input_based":
-            return self._evaluate_expression(condition_expr, original_input)
-        elif condition_type == "always":
-            return True
+        if evaluator is None:
+            return True  # Default to triggering
 
-        return True  # Default to triggering
+        return evaluator(self, trigger_condition.condition, agent_output, original_input)
 
     def _evaluate_expression(self, expression: str, data: Dict[str, Any]) -> bool:
         """
@@ -918,66 +1138,44 @@ class OrchestratorRunner:
         No eval() - manual parsing for security.
         """
         try:
-            # Parse expression: "fraud_score > 0.7"
-            pattern = r'(\w+(?:\.\w+)*)\s*([><=]+)\s*([0-9.]+|"[^"]*")'
-            match = re.match(pattern, expression.strip())
+            # Parse expression: "fraud_score > 0.7" (cached per expression string)
+            parsed = _parse_expression(expression.strip())
 
-            if not match:
+            if not parsed:
                 return True  # If can't parse, trigger anyway
 
-            field_path, operator, value_str = match.groups()
+            field_parts, op, value = parsed
 
             # Extract field value (support nested: fraud.score)
             field_value = data
-            for part in field_path.split('.'):
+            for part in field_parts:
                 if isinstance(field_value, dict) and part in field_value:
                     field_value = field_value[part]
                 else:
                     return False  # Field doesn't exist
 
-            # Parse value (number or string)
-            if value_str.startswith('"'):
-                value = value_str.strip('"')
-            else:
-                value = float(value_str)
-
             # Evaluate comparison
-            if operator == '>':
-                return field_value > value
-            elif operator == '<':
-                return field_value < value
-            elif operator == '==':
-                return field_value == value
-            elif operator == '>=':
-                return field_value >= value
-            elif operator == '<=':
-                return field_value <= value
+            return bool(_COMPARISON_OPS[op](field_value, value))
 
         except Exception as e:
             # On any error, default to triggering
             return True
 
-        return False
-
     def _log_event(
         self,
         event_type: str,
         data: Dict[str, Any]
     ) -> None:
         """Log event to storage AND progress store for real-time streaming."""
-        event = {
-            "event_type": event_type,
-            "session_id": self.session_id,
-            "workflow_id": self.workflow_id,
-            "orchestrator_iteration": self.iteration,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            **data
-        }
+        event = self._event_base.copy()
+        event["event_type"] = event_type
+        event["timestamp"] = utc_timestamp()
+        event.update(data)
 
-        # Write to storage (existing - for persistence and replay)
+        # Write to storage (for persistence and replay) - group-committed by the writer
         self.storage.write_event(self.session_id, event)
 
-        # Write to progress store (NEW - for real-time SSE streaming)
+        # Write to progress store (synchronous - for real-time SSE streaming)
         self.progress_store.add_event(self.session_id, event)
 
 
@@ -8,15 +8,38 @@ Supports on-demand and preload modes for artifact access.
 import time
 import logging
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 
+from app.services import json_utils
 from app.services.processors.base_processor import BaseProcessor, ProcessorResult
 from app.config import get_config
-from app.services.storage import write_event
+from app.services.storage import write_event, utc_timestamp
 
 logger = logging.getLogger(__name__)
 
+# Worker cap for per-handle fetches when the store has no batch API
+MAX_RESOLVE_WORKERS = 8
+
+# Shared I/O pool for per-handle fetches (created on first use)
+_io_pool: Optional[ThreadPoolExecutor] = None
+_io_pool_lock = threading.Lock()
+
+
+def _get_io_pool() -> ThreadPoolExecutor:
+    """Get the shared thread pool for overlapping artifact fetches."""
+    global _io_pool
+    if _io_pool is None:
+        with _io_pool_lock:
+            if _io_pool is None:
+                _io_pool = ThreadPoolExecutor(
+                    max_workers=MAX_RESOLVE_WORKERS,
+                    thread_name_prefix="artifact-resolver",
+                )
+    return _io_pool
+
 
 class ArtifactResolverProcessor(BaseProcessor):
     """
@@ -29,12 +52,30 @@ class ArtifactResolverProcessor(BaseProcessor):
     """
 
     # Regex pattern for artifact handles: artifact://{artifact_id}/v{version}
-    ARTIFACT_HANDLE_PATTERN = re.compile(r'artifact://([a-zA-Z0-9_-]+)/v(\d+)')
+    # (unanchored - used with findall during discovery)
+    ARTIFACT_HANDLE_PATTERN = re.compile(r'artifact://([A-Za-z0-9_-]+)/v(\d+)')
+
+    # Anchored form for parsing a single handle - rejects at the first bad character
+    ARTIFACT_HANDLE_MATCH = re.compile(r'\Aartifact://([A-Za-z0-9_-]+)/v(\d+)\Z')
+
+    # Bytes form for scanning an orjson-serialized context in one pass
+    ARTIFACT_HANDLE_BYTES_PATTERN = re.compile(rb'artifact://([A-Za-z0-9_-]+)/v(\d+)')
+
+    # Context fields searched for artifact handles
+    HANDLE_SEARCH_FIELDS = ("prior_outputs", "observations", "original_input")
+
+    def __init__(self, processor_id: str, config: Dict[str, Any]):
+        super().__init__(processor_id, config)
+
+        # Registry lookups are cached for the processor's lifetime
+        # (one pipeline per context compiler)
+        self._max_artifacts = self._load_max_artifacts_limit()
+        self._access_mode_cache: Dict[str, str] = {}
 
     def process(
         self, context: Dict[str, Any], agent_id: str, session_id: str
     ) -> ProcessorResult:
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         try:
             config = get_config()
@@ -42,7 +83,7 @@ class ArtifactResolverProcessor(BaseProcessor):
 
             # Check if artifact versioning is enabled
             if not hasattr(config, 'artifacts') or not config.artifacts.versioning_enabled:
-                execution_time_ms = (time.time() - start_time) * 1000
+                execution_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
                 return self._create_result(
                     context=context,
                     success=True,
@@ -70,24 +111,14 @@ class ArtifactResolverProcessor(BaseProcessor):
                         f"requests={len(artifact_requests)}"
                     )
 
-                    for request in artifact_requests:
-                        handle = request.get("handle")
-                        if handle:
-                            artifact = self._resolve_handle(artifact_store, handle)
-                            if artifact:
-                                artifacts_resolved.append({
-                                    "artifact_id": artifact.artifact_id,
-                                    "version": artifact.version,
-                                    "handle": artifact.handle,
-                                    "content": artifact.content,
-                                    "metadata": artifact.metadata,
-                                    "tags": artifact.tags,
-                                })
+                    handles = [
+                        request.get("handle") for request in artifact_requests
+                        if request.get("handle")
+                    ]
+                    artifacts_resolved = self._resolve_handles(artifact_store, handles)
 
                     # Add to context
-                    if "artifacts" not in context:
-                        context["artifacts"] = []
-                    context["artifacts"].extend(artifacts_resolved)
+                    context.setdefault("artifacts", []).extend(artifacts_resolved)
 
                     modifications["access_mode"] = "on_demand"
                     modifications["artifacts_resolved"] = len(artifacts_resolved)
@@ -117,23 +148,11 @@ class ArtifactResolverProcessor(BaseProcessor):
                     )
                     handles = handles[:max_artifacts]
 
-                # Resolve each handle
-                for handle in handles:
-                    artifact = self._resolve_handle(artifact_store, handle)
-                    if artifact:
-                        artifacts_resolved.append({
-                            "artifact_id": artifact.artifact_id,
-                            "version": artifact.version,
-                            "handle": artifact.handle,
-                            "content": artifact.content,
-                            "metadata": artifact.metadata,
-                            "tags": artifact.tags,
-                        })
+                # Resolve all handles in one batched fetch
+                artifacts_resolved = self._resolve_handles(artifact_store, handles)
 
                 # Add to context
-                if "artifacts" not in context:
-                    context["artifacts"] = []
-                context["artifacts"].extend(artifacts_resolved)
+                context.setdefault("artifacts", []).extend(artifacts_resolved)
 
                 modifications["access_mode"] = "preload"
                 modifications["artifacts_resolved"] = len(artifacts_resolved)
@@ -145,7 +164,7 @@ class ArtifactResolverProcessor(BaseProcessor):
                     "event_type": "artifact_resolved",
                     "session_id": session_id,
                     "agent_id": agent_id,
-                    "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                    "timestamp": utc_timestamp(),
                     "access_mode": artifact_access_mode,
                     "artifacts_resolved": len(artifacts_resolved),
                     "artifact_handles": [a["handle"] for a in artifacts_resolved],
@@ -158,7 +177,7 @@ class ArtifactResolverProcessor(BaseProcessor):
                     f"{len(artifacts_resolved)} artifacts resolved"
                 )
 
-            execution_time_ms = (time.time() - start_time) * 1000
+            execution_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
 
             return self._create_result(
                 context=context,
@@ -168,7 +187,7 @@ class ArtifactResolverProcessor(BaseProcessor):
             )
 
         except Exception as e:
-            execution_time_ms = (time.time() - start_time) * 1000
+            execution_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
             logger.error(
                 f"ArtifactResolver failed for session={session_id}: {e}",
                 exc_info=True,
@@ -182,7 +201,7 @@ class ArtifactResolverProcessor(BaseProcessor):
 
     def _get_artifact_access_mode(self, agent_id: str) -> str:
         """
-        Get artifact access mode for agent.
+        Get artifact access mode for agent (cached per agent).
 
         Args:
             agent_id: Agent identifier
@@ -190,16 +209,22 @@ class ArtifactResolverProcessor(BaseProcessor):
         Returns:
             Access mode ("on_demand" or "preload")
         """
+        access_mode = self._access_mode_cache.get(agent_id)
+        if access_mode is None:
+            access_mode = self._load_artifact_access_mode(agent_id)
+            self._access_mode_cache[agent_id] = access_mode
+        return access_mode
+
+    def _load_artifact_access_mode(self, agent_id: str) -> str:
+        """Look up an agent's artifact access mode in the registry."""
         try:
             from app.services.registry_manager import get_registry_manager
 
             registry = get_registry_manager()
             agent = registry.get_agent(agent_id)
 
-            if agent and "context_requirements" in agent:
-                context_reqs = agent["context_requirements"]
-                if "artifact_access_mode" in context_reqs:
-                    return context_reqs["artifact_access_mode"]
+            if agent and "artifact_access_mode" in agent.context_requirements:
+                return agent.context_requirements["artifact_access_mode"]
 
         except Exception as e:
             logger.warning(f"Failed to get artifact access mode for {agent_id}: {e}")
@@ -214,14 +239,18 @@ class ArtifactResolverProcessor(BaseProcessor):
         Returns:
             Max artifacts limit (default: 5)
         """
+        return self._max_artifacts
+
+    def _load_max_artifacts_limit(self) -> int:
+        """Look up the max artifacts limit in governance policies."""
         try:
             from app.services.registry_manager import get_registry_manager
 
             registry = get_registry_manager()
-            policies = registry.get_governance_policies()
+            governance = registry.get_governance_policies()
 
-            if policies and "context_governance" in policies:
-                context_gov = policies["context_governance"]
+            if governance:
+                context_gov = governance.policies.get("context_governance", {})
                 if "max_artifact_loads_per_invocation" in context_gov:
                     return context_gov["max_artifact_loads_per_invocation"]
 
@@ -240,53 +269,154 @@ class ArtifactResolverProcessor(BaseProcessor):
         - observations
         - original_input
 
+        If the producer set context["_artifact_refs_present"] to False the
+        scan is skipped. When orjson is available the fields are serialized
+        once (in C) and scanned with a single regex pass; otherwise, or if a
+        value is not JSON-serializable, nested dicts/lists are walked
+        iteratively.
+
         Args:
             context: Context dictionary
 
+        Returns:
+            List of unique artifact handles
+        """
+        # Producer hint: False means no handles anywhere - skip the scan entirely
+        if context.get("_artifact_refs_present") is False:
+            return []
+
+        values = [context[field] for field in self.HANDLE_SEARCH_FIELDS if field in context]
+
+        if json_utils.HAS_ORJSON:
+            try:
+                blob = json_utils.dumps(values, non_str_keys=True)
+            except (TypeError, ValueError):
+                blob = None  # Non-JSON values - use the walker
+
+            if blob is not None:
+                if b"artifact://" not in blob:
+                    return []
+                return list({
+                    f"artifact://{artifact_id.decode()}/v{version.decode()}"
+                    for artifact_id, version in self.ARTIFACT_HANDLE_BYTES_PATTERN.findall(blob)
+                })
+
+        return self._walk_for_handles(values)
+
+    def _walk_for_handles(self, values: List[Any]) -> List[str]:
+        """
+        Walk nested dicts/lists iteratively, collecting handles into one set.
+
+        Checks dict keys as well as values, and tuples as well as lists, so
+        it finds the same handles as the serialized scan. Only runs the
+        regex on strings that contain "artifact://".
+
+        Args:
+            values: Values to search
+
         Returns:
             List of unique artifact handles
         """
         handles = set()
+        stack = list(values)
+
+        while stack:
+            value = stack.pop()
+
+            if isinstance(value, str):
+                # Cheap substring check rejects most strings before the regex
+                if "artifact://" in value:
+                    for artifact_id, version in self.ARTIFACT_HANDLE_PATTERN.findall(value):
+                        handles.add(f"artifact://{artifact_id}/v{version}")
 
-        # Search in context fields
-        fields_to_search = ["prior_outputs", "observations", "original_input"]
+            elif isinstance(value, dict):
+                stack.extend(value.keys())
+                stack.extend(value.values())
 
-        for field in fields_to_search:
-            if field in context:
-                handles.update(self._extract_handles_from_value(context[field]))
+            elif isinstance(value, (list, tuple)):
+                stack.extend(value)
 
         return list(handles)
 
-    def _extract_handles_from_value(self, value: Any) -> List[str]:
+    def _resolve_handles(
+        self, artifact_store, handles: List[str]
+    ) -> List[Dict[str, Any]]:
         """
-        Recursively extract artifact handles from a value.
+        Resolve several artifact handles with one batched store fetch.
+
+        Stores without a batch API (get_artifact_versions) fall back to
+        per-handle fetches overlapped on a shared thread pool.
 
         Args:
-            value: Value to search (string, dict, list, etc.)
+            artifact_store: ArtifactVersionStore instance
+            handles: Artifact handles (e.g., artifact://evidence_map/v3)
 
         Returns:
-            List of handles found
+            List of resolved artifact dicts (unresolvable handles are skipped)
         """
-        handles = []
+        get_artifact_versions = getattr(artifact_store, "get_artifact_versions", None)
+        if get_artifact_versions is None:
+            return self._resolve_handles_concurrently(artifact_store, handles)
 
-        if isinstance(value, str):
-            # Search for handles in string
-            matches = self.ARTIFACT_HANDLE_PATTERN.findall(value)
-            for artifact_id, version in matches:
-                handle = f"artifact://{artifact_id}/v{version}"
-                handles.append(handle)
+        requests = []
+        for handle in handles:
+            match = self.ARTIFACT_HANDLE_MATCH.match(handle)
+            if not match:
+                logger.warning(f"Invalid artifact handle format: {handle}")
+                continue
+            requests.append((match.group(1), int(match.group(2))))
 
-        elif isinstance(value, dict):
-            # Recursively search dict values
-            for v in value.values():
-                handles.extend(self._extract_handles_from_value(v))
+        if not requests:
+            return []
 
-        elif isinstance(value, list):
-            # Recursively search list items
-            for item in value:
-                handles.extend(self._extract_handles_from_value(item))
+        try:
+            artifacts = get_artifact_versions(requests)
+        except Exception as e:
+            logger.error(f"Failed to resolve artifact handles {handles}: {e}")
+            return []
+
+        for (artifact_id, version), artifact in zip(requests, artifacts):
+            if artifact is None:
+                logger.warning(f"Artifact not found: artifact://{artifact_id}/v{version}")
+
+        return [self._artifact_to_dict(artifact) for artifact in artifacts if artifact is not None]
+
+    def _resolve_handles_concurrently(
+        self, artifact_store, handles: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Resolve handles one fetch each, overlapping the fetches on a thread pool.
+
+        Args:
+            artifact_store: Artifact store without a batch API
+            handles: Artifact handles
 
-        return handles
+        Returns:
+            List of resolved artifact dicts, in handle order
+        """
+        if len(handles) <= 1:
+            artifacts = [self._resolve_handle(artifact_store, handle) for handle in handles]
+        else:
+            pool = _get_io_pool()
+            futures = [
+                pool.submit(self._resolve_handle, artifact_store, handle)
+                for handle in handles
+            ]
+            artifacts = [future.result() for future in futures]
+
+        return [self._artifact_to_dict(artifact) for artifact in artifacts if artifact]
+
+    @staticmethod
+    def _artifact_to_dict(artifact) -> Dict[str, Any]:
+        """Convert an Artifact into the dict added to context["artifacts"]."""
+        return {
+            "artifact_id": artifact.artifact_id,
+            "version": artifact.version,
+            "handle": artifact.handle,
+            "content": artifact.content,
+            "metadata": artifact.metadata,
+            "tags": artifact.tags,
+        }
 
     def _resolve_handle(
         self, artifact_store, handle: str
@@ -303,7 +433,7 @@ class ArtifactResolverProcessor(BaseProcessor):
         """
         try:
             # Parse handle
-            match = self.ARTIFACT_HANDLE_PATTERN.match(handle)
+            match = self.ARTIFACT_HANDLE_MATCH.match(handle)
             if not match:
                 logger.warning(f"Invalid artifact handle format: {handle}")
                 return None
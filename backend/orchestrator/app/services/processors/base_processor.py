@@ -3,17 +3,62 @@ Base Processor Abstract Class
 
 All context processors must inherit from BaseProcessor and implement the process() method.
 Processors are stateless and side-effect-free (except for logging).
+
+Context ownership: the pipeline copies the raw context once and hands that
+dict to each processor in turn. A processor may add, replace or delete
+top-level keys in place instead of copying the dict; containers it got
+from the caller (lists/dicts under those keys) should be replaced rather
+than mutated when the change must not leak back to the caller. There is
+no per-processor copy, so a processor that fails part-way (returns
+success=False or raises) leaves the keys it already changed in place, and
+the pipeline continues with them. Assign a replaced key only once its new
+value is complete.
+
+Context hints:
+- "_artifact_refs_present" (bool, optional): set by the context producer
+  (ContextCompiler) when building the raw context. False means no
+  "artifact://" handle appears in original_input, prior_outputs or
+  observations, so ArtifactResolverProcessor skips handle discovery.
+  Absent means unknown (discovery runs). A processor that adds artifact
+  handles to those fields must set the hint to True.
 """
 
+import json
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@lru_cache(maxsize=8)
+def _read_json_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a JSON file (cached per path, modification time and size)."""
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def load_json_cached(path: Path) -> Dict[str, Any]:
+    """
+    Load a JSON config file, re-reading it only when its mtime or size changes.
+
+    Costs one stat() per call instead of open + read + parse. The returned
+    dict is shared between callers and must be treated as read-only.
+
+    Args:
+        path: JSON file path
+
+    Returns:
+        Parsed JSON content
+    """
+    stat = path.stat()
+    return _read_json_file(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@dataclass(slots=True, frozen=True)
 class ProcessorResult:
-    """Result from a processor execution"""
+    """Result from a processor execution (slotted and immutable: one is built per processor call)"""
 
     context: Dict[str, Any]
     """The transformed context"""
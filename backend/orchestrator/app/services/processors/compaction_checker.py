@@ -7,9 +7,11 @@ Triggers CompactionManager if thresholds exceeded.
 
 import time
 import logging
+from pathlib import Path
 from typing import Dict, Any, List
 
-from app.services.processors.base_processor import BaseProcessor, ProcessorResult
+from app.services.compaction_manager import CompactionManager
+from app.services.processors.base_processor import BaseProcessor, ProcessorResult, load_json_cached
 from app.config import get_config
 
 logger = logging.getLogger(__name__)
@@ -28,7 +30,7 @@ class CompactionCheckerProcessor(BaseProcessor):
     def process(
         self, context: Dict[str, Any], agent_id: str, session_id: str
     ) -> ProcessorResult:
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         try:
             config = get_config()
@@ -36,7 +38,7 @@ class CompactionCheckerProcessor(BaseProcessor):
 
             # Check if compaction is enabled
             if not config.compaction.enabled:
-                execution_time_ms = (time.time() - start_time) * 1000
+                execution_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
                 return self._create_result(
                     context=context,
                     success=True,
@@ -48,7 +50,7 @@ class CompactionCheckerProcessor(BaseProcessor):
             check_threshold = self.config.get("check_threshold", True)
 
             if not check_threshold:
-                execution_time_ms = (time.time() - start_time) * 1000
+                execution_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
                 return self._create_result(
                     context=context,
                     success=True,
@@ -62,18 +64,30 @@ class CompactionCheckerProcessor(BaseProcessor):
             observations = context.get("observations", [])
             estimated_tokens = context.get("metadata", {}).get("estimated_tokens", 0)
 
-            # Import CompactionManager
-            from app.services.compaction_manager import CompactionManager
-
-            compaction_manager = CompactionManager(session_id)
+            # Nothing to compact: skip loading config/constructing CompactionManager
+            if not observations and not estimated_tokens:
+                modifications["compaction_triggered"] = False
+                modifications["reason"] = "threshold_not_exceeded"
+                execution_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
+                return self._create_result(
+                    context=context,
+                    success=True,
+                    execution_time_ms=execution_time_ms,
+                    modifications_made=modifications,
+                )
 
-            # Check if compaction needed
-            if compaction_manager.check_compaction_needed(observations, estimated_tokens):
+            # Check if compaction needed (arithmetic only - no manager construction)
+            compaction_config = self._load_compaction_config()
+            if CompactionManager.quick_threshold_check(
+                len(observations), estimated_tokens, compaction_config
+            ):
                 logger.info(
                     f"Compaction threshold exceeded for session={session_id}, "
                     f"triggering compaction"
                 )
 
+                compaction_manager = CompactionManager(session_id)
+
                 # Trigger compaction
                 method = config.compaction.method
                 result = compaction_manager.compact_events(observations, method)
@@ -98,7 +112,7 @@ class CompactionCheckerProcessor(BaseProcessor):
                 modifications["compaction_triggered"] = False
                 modifications["reason"] = "threshold_not_exceeded"
 
-            execution_time_ms = (time.time() - start_time) * 1000
+            execution_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
 
             return self._create_result(
                 context=context,
@@ -108,7 +122,7 @@ class CompactionCheckerProcessor(BaseProcessor):
             )
 
         except Exception as e:
-            execution_time_ms = (time.time() - start_time) * 1000
+            execution_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
             logger.error(
                 f"CompactionChecker failed for session={session_id}: {e}",
                 exc_info=True,
@@ -119,3 +133,14 @@ class CompactionCheckerProcessor(BaseProcessor):
                 execution_time_ms=execution_time_ms,
                 error=str(e),
             )
+
+    def _load_compaction_config(self) -> Dict[str, Any]:
+        """Load compaction configuration from context_strategies.json."""
+        try:
+            # Cached - only re-parsed when the strategies file changes
+            strategies = load_json_cached(Path("registries/context_strategies.json"))
+            return strategies.get("compaction", {})
+
+        except Exception as e:
+            logger.error(f"Failed to load compaction config: {e}")
+            return {"enabled": False}
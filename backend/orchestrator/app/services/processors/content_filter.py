@@ -5,20 +5,109 @@ Deterministic pre-LLM filtering of context data based on governance rules.
 Removes noise, masks PII, enforces security policies before LLM sees context.
 """
 
+import os
 import time
 import re
-import json
 import logging
-from typing import Dict, Any, List
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, Any, List, Optional, Tuple, Union, Callable, Iterator
 from datetime import datetime, timedelta
 from pathlib import Path
 
-from app.services.processors.base_processor import BaseProcessor, ProcessorResult
-from app.services.storage import write_event
+from app.services.processors.base_processor import BaseProcessor, ProcessorResult, load_json_cached
+from app.services.storage import write_event, utc_timestamp
+
+try:
+    import re2  # google-re2: linear-time matching, no catastrophic backtracking
+except ImportError:  # Optional - masking falls back to stdlib re
+    re2 = None
+
+try:
+    import numpy as np  # Vectorized timestamp comparison for age filtering
+except ImportError:  # Optional - age filtering parses timestamps per item
+    np = None
+
+# Worker cap for applying RE2-only masking on different fields concurrently
+MAX_RULE_WORKERS = 8
+
+_rule_pool: Optional[ThreadPoolExecutor] = None
+_rule_pool_lock = threading.Lock()
+
+try:
+    from ciso8601 import parse_datetime_as_naive as _parse_naive_timestamp
+except ImportError:  # Optional - stdlib parsing (handles "Z" on Python 3.11+)
+    def _parse_naive_timestamp(timestamp: str) -> datetime:
+        """Parse an ISO-8601 timestamp, dropping any UTC offset (as ciso8601 does)."""
+        return datetime.fromisoformat(timestamp).replace(tzinfo=None)
+
+# Lists shorter than this are age-filtered per item (array setup costs more)
+AGE_FILTER_VECTORIZE_MIN_ITEMS = 256
+
+# Masking joins at least this many strings with the sentinel and scans them once
+MASK_BATCH_MIN_ITEMS = 8
+_MASK_BATCH_SENTINEL = "\x1f"  # ASCII unit separator
+
+# Errors raised by the regex engines when a pattern cannot be compiled
+_REGEX_ERRORS = (re.error, re2.error) if re2 is not None else (re.error,)
+
+if re2 is not None:
+    # Unsupported patterns fall back to stdlib re - don't log them from C++
+    _RE2_OPTIONS = re2.Options()
+    _RE2_OPTIONS.log_errors = False
+
+# Syntax that RE2 matches differently from stdlib re: its \d, \w, \s and
+# \b (and POSIX classes) are ASCII-only, so e.g. a fullwidth-digit SSN would
+# slip past \d. Patterns using any of it (or case folding) stay on stdlib re.
+_RE2_UNSAFE_SYNTAX = re.compile(r"\\[dDwWsSbB]|\[\[:|\(\?[a-zA-Z]*i")
 
 logger = logging.getLogger(__name__)
 
 
+def _get_rule_pool() -> ThreadPoolExecutor:
+    """Get the shared thread pool for applying rules on different fields."""
+    global _rule_pool
+    if _rule_pool is None:
+        with _rule_pool_lock:
+            if _rule_pool is None:
+                _rule_pool = ThreadPoolExecutor(
+                    max_workers=min(MAX_RULE_WORKERS, os.cpu_count() or 1),
+                    thread_name_prefix="content-filter",
+                )
+    return _rule_pool
+
+
+# Pattern syntax whose result depends on the text around a match (anchors,
+# word boundaries, lookaround, conditionals). Checked textually - a false
+# positive (e.g. "[^0-9]") only means masking string by string.
+_POSITION_DEPENDENT_SYNTAX = ("^", "$", "\\A", "\\Z", "\\b", "\\B", "(?=", "(?!", "(?<", "(?(")
+
+
+def _has_position_dependence(pattern: str) -> bool:
+    """Whether a regex pattern may use anchors, lookaround or conditionals."""
+    return any(syntax in pattern for syntax in _POSITION_DEPENDENT_SYNTAX)
+
+
+def _iter_string_cells(container: Any, key: Any) -> Iterator[Tuple[Any, Any]]:
+    """
+    Yield (parent, key) for every string reachable from container[key].
+
+    Depth-first with an explicit stack, so callers can assign
+    parent[key] = new_value in place while iterating.
+    """
+    stack = [(container, key)]
+    while stack:
+        parent, key = stack.pop()
+        value = parent[key]
+
+        if isinstance(value, str):
+            yield parent, key
+        elif isinstance(value, dict):
+            stack.extend((value, child_key) for child_key in value)
+        elif isinstance(value, list):
+            stack.extend((value, index) for index in range(len(value)))
+
+
 class ContentFilterProcessor(BaseProcessor):
     """
     Applies deterministic filtering rules to context before LLM consumption.
@@ -30,17 +119,30 @@ class ContentFilterProcessor(BaseProcessor):
     - All filtering decisions logged for audit
     """
 
+    def __init__(self, processor_id: str, config: Dict[str, Any]):
+        super().__init__(processor_id, config)
+
+        # Compiled masking patterns keyed by (pattern, flags); kept for the
+        # processor's lifetime so each pattern is compiled once
+        self._compiled_patterns: Dict[Tuple[str, int], re.Pattern] = {}
+
+        # Masking passes per regex_mask pattern list (see _get_mask_passes)
+        self._mask_passes: Dict[Tuple[Tuple[str, str], ...], Tuple[Tuple[re.Pattern, Any], ...]] = {}
+
+        # Whether each regex_mask pattern list can be masked as a batch
+        self._mask_batchable: Dict[Tuple[Tuple[str, str], ...], bool] = {}
+
     def process(
         self, context: Dict[str, Any], agent_id: str, session_id: str
     ) -> ProcessorResult:
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         try:
             filtering_rules = self._load_filtering_rules()
 
             # If filtering disabled globally, skip
             if not filtering_rules.get("enabled", False):
-                execution_time_ms = (time.time() - start_time) * 1000
+                execution_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
                 return self._create_result(
                     context=context,
                     success=True,
@@ -48,16 +150,17 @@ class ContentFilterProcessor(BaseProcessor):
                     modifications_made={"status": "filtering_disabled"},
                 )
 
-            filtered_context = context.copy()
+            # Processors own the pipeline context - filter in place (no copy)
+            filtered_context = context
             filtering_log = []
 
-            # Apply each rule
-            for rule in filtering_rules.get("rules", []):
-                if not rule.get("enabled", True):
-                    continue  # Skip disabled rules
-
-                result = self._apply_rule(rule, filtered_context)
+            # Apply each enabled rule (results come back in rule order)
+            enabled_rules = [
+                rule for rule in filtering_rules.get("rules", [])
+                if rule.get("enabled", True)
+            ]
 
+            for rule, result in self._apply_rules(enabled_rules, filtered_context):
                 if result["modified"]:
                     filtering_log.append({
                         "rule_id": rule["rule_id"],
@@ -80,11 +183,11 @@ class ContentFilterProcessor(BaseProcessor):
             filtered_context["metadata"]["filtering_applied"] = len(filtering_log) > 0
             filtered_context["metadata"]["filtering_rules_triggered"] = len(filtering_log)
 
-            # Log filtering event if any rules were applied
-            if filtering_log:
+            # Log filtering event once enough rules were applied (default: any)
+            if filtering_log and len(filtering_log) >= filtering_rules.get("audit_min_rules_triggered", 1):
                 self._log_filtering_event(session_id, agent_id, filtering_log)
 
-            execution_time_ms = (time.time() - start_time) * 1000
+            execution_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
 
             return self._create_result(
                 context=filtered_context,
@@ -98,7 +201,7 @@ class ContentFilterProcessor(BaseProcessor):
             )
 
         except Exception as e:
-            execution_time_ms = (time.time() - start_time) * 1000
+            execution_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
             logger.error(
                 f"ContentFilter failed for session={session_id}: {e}",
                 exc_info=True,
@@ -113,13 +216,11 @@ class ContentFilterProcessor(BaseProcessor):
     def _load_filtering_rules(self) -> Dict[str, Any]:
         """Load filtering rules from governance policies."""
         try:
-            import os
-
             registry_path = os.environ.get("REGISTRY_PATH", "/registries")
             policy_file = Path(registry_path) / "governance_policies.json"
 
-            with open(policy_file, "r") as f:
-                policies = json.load(f)
+            # Cached - only re-parsed when the policy file changes
+            policies = load_json_cached(policy_file)
 
             filtering_config = policies.get("policies", {}).get("context_filtering", {})
             return filtering_config
@@ -128,6 +229,70 @@ class ContentFilterProcessor(BaseProcessor):
             logger.error(f"Failed to load filtering rules: {e}", exc_info=True)
             return {"enabled": False, "rules": []}
 
+    def _apply_rules(
+        self, rules: List[Dict[str, Any]], context: Dict[str, Any]
+    ) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Apply rules to context, returning (rule, result) pairs in rule order.
+
+        Rules on the same field run in order. Fields whose rules are all
+        masking with RE2-compiled patterns (RE2 releases the GIL while
+        matching) run on a shared thread pool, while the remaining fields
+        are processed on the calling thread - each only touches its own
+        field. Work that holds the GIL is never handed to the pool.
+        """
+        groups: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+        for index, rule in enumerate(rules):
+            groups.setdefault(rule["field"], []).append((index, rule))
+
+        parallel = []
+        serial = []
+        if re2 is not None and len(groups) > 1:
+            for group in groups.values():
+                (parallel if self._releases_gil(group) else serial).append(group)
+
+        if not parallel:
+            return [(rule, self._apply_rule(rule, context)) for rule in rules]
+
+        pool = _get_rule_pool()
+        futures = [
+            pool.submit(self._apply_rule_group, group, context)
+            for group in parallel
+        ]
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(rules)
+        try:
+            for group in serial:
+                for index, result in self._apply_rule_group(group, context):
+                    results[index] = result
+        finally:
+            wait(futures)  # Workers must be done with the context before returning
+        for future in futures:
+            for index, result in future.result():
+                results[index] = result
+
+        return list(zip(rules, results))
+
+    def _releases_gil(self, group: List[Tuple[int, Dict[str, Any]]]) -> bool:
+        """Whether every rule in a field's group masks with RE2-compiled patterns only."""
+        try:
+            return all(
+                rule["condition"]["type"] == "regex_mask"
+                and not any(
+                    isinstance(compiled, re.Pattern)
+                    for compiled, _ in self._get_mask_passes(rule["condition"]["patterns"])
+                )
+                for _, rule in group
+            )
+        except (KeyError, *_REGEX_ERRORS):
+            return False  # Malformed rule - let _apply_rule report it serially
+
+    def _apply_rule_group(
+        self, group: List[Tuple[int, Dict[str, Any]]], context: Dict[str, Any]
+    ) -> List[Tuple[int, Dict[str, Any]]]:
+        """Apply one field's rules in order, returning (rule_index, result) pairs."""
+        return [(index, self._apply_rule(rule, context)) for index, rule in group]
+
     def _apply_rule(self, rule: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Apply a single filtering rule to context.
@@ -150,36 +315,42 @@ class ContentFilterProcessor(BaseProcessor):
         """
         Filter items older than threshold.
 
+        Items are dated by condition["timestamp_field"] when the rule sets it
+        (one lookup per item), else by "timestamp" falling back to "created_at".
+
         Example: Remove observations older than 30 days.
         """
         field = rule["field"]
         max_age_days = rule["condition"]["max_age_days"]
+        timestamp_field = rule["condition"].get("timestamp_field")
 
         if field not in context or not isinstance(context[field], list):
             return {"modified": False, "items_filtered": 0}
 
         cutoff_date = datetime.utcnow() - timedelta(days=max_age_days)
-        original_count = len(context[field])
+        items = context[field]
+        original_count = len(items)
+
+        # Extract each item's timestamp once
+        if timestamp_field:
+            timestamps = [
+                item.get(timestamp_field) if isinstance(item, dict) else None
+                for item in items
+            ]
+        else:
+            timestamps = [
+                (item.get("timestamp") or item.get("created_at")) if isinstance(item, dict) else None
+                for item in items
+            ]
 
-        # Filter items with timestamp older than cutoff
-        filtered_items = []
-        for item in context[field]:
-            # Try to extract timestamp
-            timestamp = None
-            if isinstance(item, dict):
-                timestamp = item.get("timestamp") or item.get("created_at")
+        # Vectorized comparison for large lists (NumPy), else per-item parsing
+        keep = None
+        if np is not None and original_count >= AGE_FILTER_VECTORIZE_MIN_ITEMS:
+            keep = self._age_keep_flags_vectorized(timestamps, cutoff_date)
+        if keep is None:
+            keep = self._age_keep_flags(timestamps, cutoff_date)
 
-            if timestamp:
-                try:
-                    item_date = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                    if item_date.replace(tzinfo=None) >= cutoff_date:
-                        filtered_items.append(item)
-                except Exception:
-                    # Keep item if can't parse timestamp
-                    filtered_items.append(item)
-            else:
-                # Keep item if no timestamp
-                filtered_items.append(item)
+        filtered_items = [item for item, keep_item in zip(items, keep) if keep_item]
 
         context[field] = filtered_items
         items_removed = original_count - len(filtered_items)
@@ -189,10 +360,59 @@ class ContentFilterProcessor(BaseProcessor):
             "items_filtered": items_removed,
         }
 
+    @staticmethod
+    def _age_keep_flags(timestamps: List[Any], cutoff_date: datetime) -> List[bool]:
+        """
+        Per-item keep flags: True unless the timestamp parses and is older than cutoff.
+
+        Items without a timestamp, or whose timestamp can't be parsed, are kept.
+        """
+        keep = []
+        for timestamp in timestamps:
+            if timestamp:
+                try:
+                    keep.append(_parse_naive_timestamp(timestamp) >= cutoff_date)
+                except Exception:
+                    # Keep item if can't parse timestamp
+                    keep.append(True)
+            else:
+                # Keep item if no timestamp
+                keep.append(True)
+        return keep
+
+    @staticmethod
+    def _age_keep_flags_vectorized(
+        timestamps: List[Any], cutoff_date: datetime
+    ) -> Optional[List[bool]]:
+        """
+        Keep flags computed with one NumPy datetime64 comparison.
+
+        Only handles UTC "Z" timestamps (and missing ones); returns None when
+        any timestamp has another form, so the caller falls back to per-item
+        parsing with identical keep semantics.
+        """
+        values = []
+        for timestamp in timestamps:
+            if not timestamp:
+                values.append("NaT")
+            elif isinstance(timestamp, str) and timestamp.endswith("Z"):
+                values.append(timestamp[:-1])
+            else:
+                return None
+
+        try:
+            parsed = np.array(values, dtype="datetime64[us]")
+        except ValueError:
+            return None  # Unparseable timestamp - per-item path keeps it
+
+        return ((parsed >= np.datetime64(cutoff_date, "us")) | np.isnat(parsed)).tolist()
+
     def _mask_by_regex(self, rule: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Mask patterns using regex replacement.
 
+        Applies to every string in the field, at any nesting depth.
+
         Example: Mask SSN (123-45-6789 → ***-**-****)
         """
         field = rule["field"]
@@ -202,58 +422,171 @@ class ContentFilterProcessor(BaseProcessor):
             return {"modified": False, "items_masked": 0}
 
         total_masked = 0
+        mask_passes = self._get_mask_passes(patterns)
+        batchable = self._get_mask_batchable(patterns)
 
-        # Apply masking to string fields
-        def mask_text(text: str) -> tuple[str, int]:
+        def mask_text(text: str) -> Tuple[str, int]:
             """Mask text and return (masked_text, count_of_masks)"""
-            if not isinstance(text, str):
-                return text, 0
-
-            masked_text = text
             mask_count = 0
+            for compiled, replacement in mask_passes:
+                # Replace and count matches in a single pass
+                text, count = compiled.subn(replacement, text)
+                mask_count += count
+            return text, mask_count
+
+        def mask_texts(texts: List[str]) -> Tuple[List[str], int]:
+            """Mask a list of strings, returning (masked_texts, count_of_masks)"""
+            if batchable and len(texts) >= MASK_BATCH_MIN_ITEMS:
+                # Scan all strings in one pass over a sentinel-joined buffer
+                joined = _MASK_BATCH_SENTINEL.join(texts)
+                if joined.count(_MASK_BATCH_SENTINEL) == len(texts) - 1:
+                    masked, mask_count = mask_text(joined)
+                    if not mask_count:
+                        return texts, 0
+                    pieces = masked.split(_MASK_BATCH_SENTINEL)
+                    # A match that swallowed a sentinel spans two strings -
+                    # discard the batch result and mask per string instead
+                    if len(pieces) == len(texts):
+                        return pieces, mask_count
+                # else: an input contains the sentinel - mask per string
+
+            results = [mask_text(text) for text in texts]
+            return [text for text, _ in results], sum(count for _, count in results)
+
+        def mask_cells(cells: List[Tuple[Any, Any]]) -> int:
+            """Mask (parent, key) string cells in place, returning the mask count."""
+            masked_texts, masked_total = mask_texts([parent[key] for parent, key in cells])
+            if masked_total:
+                for (parent, key), masked_text in zip(cells, masked_texts):
+                    parent[key] = masked_text
+            return masked_total
+
+        value = context[field]
+
+        # Observation lists are almost always homogeneous - sniff the first
+        # item and take a typed fast path; anything else uses the walker
+        if isinstance(value, list) and value and isinstance(value[0], str) and all(
+            type(item) is str for item in value
+        ):
+            # All strings: mask as a batch, replace the list only if changed
+            masked_texts, total_masked = mask_texts(value)
+            if total_masked:
+                context[field] = masked_texts
+
+        elif isinstance(value, list) and value and isinstance(value[0], dict):
+            # Dicts: collect their string values directly, walk nested containers
+            cells = []
+            for index, item in enumerate(value):
+                if type(item) is not dict:
+                    cells.extend(_iter_string_cells(value, index))
+                    continue
+
+                for key, item_value in item.items():
+                    if type(item_value) is str:
+                        cells.append((item, key))
+                    elif isinstance(item_value, (dict, list)):
+                        cells.extend(_iter_string_cells(item, key))
+
+            total_masked = mask_cells(cells)
 
-            for pattern_config in patterns:
-                pattern = pattern_config["pattern"]
-                replacement = pattern_config["replacement"]
-
-                # Count matches before replacement
-                matches = re.findall(pattern, masked_text)
-                mask_count += len(matches)
-
-                # Apply replacement
-                masked_text = re.sub(pattern, replacement, masked_text)
-
-            return masked_text, mask_count
-
-        # Apply masking based on field type
-        if isinstance(context[field], str):
-            # String field
-            context[field], total_masked = mask_text(context[field])
-
-        elif isinstance(context[field], dict):
-            # Dict field - recurse through values
-            for key, value in context[field].items():
-                if isinstance(value, str):
-                    context[field][key], count = mask_text(value)
-                    total_masked += count
-
-        elif isinstance(context[field], list):
-            # List field - process each item
-            for i, item in enumerate(context[field]):
-                if isinstance(item, str):
-                    context[field][i], count = mask_text(item)
-                    total_masked += count
-                elif isinstance(item, dict):
-                    for key, value in item.items():
-                        if isinstance(value, str):
-                            item[key], count = mask_text(value)
-                            total_masked += count
+        else:
+            # Walk every string reachable from the field and mask it in place
+            total_masked = mask_cells(list(_iter_string_cells(context, field)))
 
         return {
             "modified": total_masked > 0,
             "items_masked": total_masked,
         }
 
+    def _compile_pattern(self, pattern: str, flags: int = 0) -> re.Pattern:
+        """
+        Compile a masking pattern once and reuse it across process() calls.
+
+        Masking runs over untrusted context text, so patterns are compiled
+        with RE2 (linear-time) when google-re2 is installed. Patterns RE2
+        does not support (backreferences, lookaround), flagged patterns and
+        patterns whose Unicode semantics differ under RE2 (see
+        _RE2_UNSAFE_SYNTAX) use stdlib re.
+        """
+        key = (pattern, flags)
+        compiled = self._compiled_patterns.get(key)
+        if compiled is None:
+            if re2 is not None and not flags and not _RE2_UNSAFE_SYNTAX.search(pattern):
+                try:
+                    compiled = re2.compile(pattern, _RE2_OPTIONS)
+                except re2.error:
+                    compiled = None
+            if compiled is None:
+                compiled = re.compile(pattern, flags)
+            self._compiled_patterns[key] = compiled
+        return compiled
+
+    def _get_mask_passes(
+        self, patterns: List[Dict[str, Any]]
+    ) -> Tuple[Tuple[re.Pattern, Union[str, Callable[[re.Match], str]]], ...]:
+        """
+        Get the (compiled_pattern, replacement) passes for a regex_mask rule.
+
+        All patterns are merged into one alternation - (?P<g0>p0)|(?P<g1>p1)|...
+        - so each string is scanned once, with the replacement chosen by the
+        group that matched. Where alternatives overlap, the earliest-listed
+        pattern wins at a position instead of patterns applying one after
+        another. Patterns that cannot be merged (capture groups, replacement
+        templates with backslashes, or inline global flags) keep one pass
+        per pattern.
+        """
+        key = tuple((p["pattern"], p["replacement"]) for p in patterns)
+        passes = self._mask_passes.get(key)
+        if passes is not None:
+            return passes
+
+        compiled = [self._compile_pattern(pattern) for pattern, _ in key]
+        mergeable = len(key) > 1 and all(
+            c.groups == 0 and "\\" not in replacement
+            for c, (_, replacement) in zip(compiled, key)
+        )
+
+        passes = tuple(zip(compiled, (replacement for _, replacement in key)))
+        if mergeable:
+            try:
+                combined = self._compile_pattern(
+                    "|".join(f"(?P<g{i}>{pattern})" for i, (pattern, _) in enumerate(key))
+                )
+            except _REGEX_ERRORS:
+                pass  # e.g. inline global flags - keep per-pattern passes
+            else:
+                replacements = tuple(replacement for _, replacement in key)
+                passes = ((combined, lambda m: replacements[m.lastindex - 1]),)
+
+        self._mask_passes[key] = passes
+        return passes
+
+    def _get_mask_batchable(self, patterns: List[Dict[str, Any]]) -> bool:
+        """
+        Whether the patterns can mask many strings joined by the sentinel.
+
+        Requires that neither patterns nor replacements contain the sentinel,
+        that replacements hold no group references (which could copy a
+        sentinel), and that no pattern uses anchors or lookaround, which
+        would see neighbouring strings in the joined buffer. Matches that
+        consume a sentinel are caught after the scan (see _mask_by_regex).
+        """
+        key = tuple((p["pattern"], p["replacement"]) for p in patterns)
+        batchable = self._mask_batchable.get(key)
+        if batchable is not None:
+            return batchable
+
+        batchable = bool(key) and all(
+            _MASK_BATCH_SENTINEL not in pattern
+            and _MASK_BATCH_SENTINEL not in replacement
+            and "\\" not in replacement
+            and not _has_position_dependence(pattern)
+            for pattern, replacement in key
+        )
+
+        self._mask_batchable[key] = batchable
+        return batchable
+
     def _filter_by_field_match(
         self, rule: Dict[str, Any], context: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -271,15 +604,11 @@ class ContentFilterProcessor(BaseProcessor):
 
         original_count = len(context[field])
 
-        # Filter items where match_field != match_value
-        filtered_items = []
-        for item in context[field]:
-            if isinstance(item, dict):
-                if item.get(match_field) != match_value:
-                    filtered_items.append(item)
-            else:
-                # Keep non-dict items
-                filtered_items.append(item)
+        # Filter items where match_field != match_value (non-dict items are kept)
+        filtered_items = [
+            item for item in context[field]
+            if not (isinstance(item, dict) and item.get(match_field) == match_value)
+        ]
 
         context[field] = filtered_items
         items_removed = original_count - len(filtered_items)
@@ -297,11 +626,12 @@ class ContentFilterProcessor(BaseProcessor):
             "event_type": "content_filtered",
             "session_id": session_id,
             "agent_id": agent_id,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": utc_timestamp(),
             "filtering_log": filtering_log,
             "total_rules_triggered": len(filtering_log),
         }
 
+        # Buffered by the session writer's group commit - no disk I/O here
         write_event(session_id, event)
 
         logger.info(
@@ -22,17 +22,23 @@ class ContentSelectorProcessor(BaseProcessor):
     - Filters by context scope (scoped/full/minimal)
     """
 
+    def __init__(self, processor_id: str, config: Dict[str, Any]):
+        super().__init__(processor_id, config)
+
+        # Noise event types as a set, built once from config (O(1) membership)
+        self._noise_event_types = frozenset(self.config.get("noise_event_types", []))
+
     def process(
         self, context: Dict[str, Any], agent_id: str, session_id: str
     ) -> ProcessorResult:
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         try:
-            filtered_context = context.copy()
+            # Processors own the pipeline context - select in place (no copy)
+            filtered_context = context
             modifications = {}
 
-            # Get noise event types from config
-            noise_event_types = self.config.get("noise_event_types", [])
+            noise_event_types = self._noise_event_types
             filter_noise = self.config.get("filter_noise", True)
 
             # Filter noise from observations if present
@@ -65,7 +71,7 @@ class ContentSelectorProcessor(BaseProcessor):
                 modifications["scope_applied"] = "minimal"
                 logger.debug(f"Applied minimal context scope for agent={agent_id}")
 
-            execution_time_ms = (time.time() - start_time) * 1000
+            execution_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
 
             return self._create_result(
                 context=filtered_context,
@@ -75,7 +81,7 @@ class ContentSelectorProcessor(BaseProcessor):
             )
 
         except Exception as e:
-            execution_time_ms = (time.time() - start_time) * 1000
+            execution_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
             logger.error(
                 f"ContentSelector failed for agent={agent_id}: {e}", exc_info=True
             )
@@ -5,18 +5,44 @@ Final formatting and injection of context into LLM-ready format.
 Produces a clean, traceable prompt boundary.
 """
 
+import sys
 import time
-import json
 import logging
 import hashlib
 from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
-from app.services.processors.base_processor import BaseProcessor, ProcessorResult
+from app.services import json_utils
+from app.services.processors.base_processor import BaseProcessor, ProcessorResult, load_json_cached
+
+try:
+    import xxhash  # Fast non-cryptographic hash for prefix cache keys
+except ImportError:  # Optional - falls back to hashlib.blake2b
+    xxhash = None
 
 logger = logging.getLogger(__name__)
 
 
+def _prefix_digest(prefix_data: Dict[str, Any]) -> str:
+    """
+    8-hex-char digest of prefix data (identity only, not security).
+
+    Hashes each component incrementally instead of serializing the whole
+    dict into one string first.
+    """
+    hasher = xxhash.xxh3_64() if xxhash is not None else hashlib.blake2b(digest_size=4)
+
+    for key in sorted(prefix_data):
+        hasher.update(key.encode())
+        hasher.update(b"\0")
+        hasher.update(json_utils.dumps(prefix_data[key], sort_keys=True))
+        hasher.update(b"\0")
+
+    if xxhash is not None:
+        return f"{hasher.intdigest() & 0xFFFFFFFF:08x}"
+    return hasher.hexdigest()
+
+
 class InjectorProcessor(BaseProcessor):
     """
     Final processor that formats context for LLM consumption.
@@ -26,13 +52,29 @@ class InjectorProcessor(BaseProcessor):
     - Produces final compiled context
     """
 
+    # Component lists used when the caching config doesn't set them
+    DEFAULT_STABLE_COMPONENTS = ("system_instructions", "agent_identity", "tool_schemas")
+    DEFAULT_VARIABLE_COMPONENTS = ("recent_observations", "current_task", "session_context")
+
+    def __init__(self, processor_id: str, config: Dict[str, Any]):
+        super().__init__(processor_id, config)
+
+        # (caching_config, stable_set, variable_set) - rebuilt when the
+        # cached config object changes (i.e. the file was modified)
+        self._component_sets: Optional[Tuple[Dict[str, Any], frozenset, frozenset]] = None
+
+        # Shared tuples of interned component names for the metadata - the
+        # names come from a small fixed vocabulary, so this stays tiny
+        self._component_names: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
     def process(
         self, context: Dict[str, Any], agent_id: str, session_id: str
     ) -> ProcessorResult:
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         try:
-            final_context = context.copy()
+            # Processors own the pipeline context - inject in place (no copy)
+            final_context = context
             modifications = {}
 
             format_type = self.config.get("format", "llm_ready")
@@ -86,8 +128,8 @@ class InjectorProcessor(BaseProcessor):
 
                 final_context["metadata"]["prefix_caching_ready"] = True
                 final_context["metadata"]["cache_key"] = cache_key
-                final_context["metadata"]["prefix_components"] = list(prefix_data.keys())
-                final_context["metadata"]["suffix_components"] = list(suffix_data.keys())
+                final_context["metadata"]["prefix_components"] = self._get_component_names(prefix_data)
+                final_context["metadata"]["suffix_components"] = self._get_component_names(suffix_data)
 
                 # Store separated components for LLM client to use
                 final_context["prefix_cache"] = {
@@ -110,7 +152,7 @@ class InjectorProcessor(BaseProcessor):
                 final_context["metadata"]["prefix_caching_ready"] = False
                 logger.debug("Prefix caching disabled in system config")
 
-            execution_time_ms = (time.time() - start_time) * 1000
+            execution_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
 
             return self._create_result(
                 context=final_context,
@@ -120,7 +162,7 @@ class InjectorProcessor(BaseProcessor):
             )
 
         except Exception as e:
-            execution_time_ms = (time.time() - start_time) * 1000
+            execution_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
             logger.error(f"Injector failed for agent={agent_id}: {e}", exc_info=True)
             return self._create_result(
                 context=context,
@@ -136,8 +178,8 @@ class InjectorProcessor(BaseProcessor):
             registry_path = os.environ.get("REGISTRY_PATH", "/registries")
             config_file = Path(registry_path) / "system_config.json"
 
-            with open(config_file, 'r') as f:
-                config = json.load(f)
+            # Cached - only re-parsed when the system config changes
+            config = load_json_cached(config_file)
 
             caching_config = config.get("prefix_caching", {})
             return caching_config
@@ -158,16 +200,7 @@ class InjectorProcessor(BaseProcessor):
         Returns:
             (prefix_data, suffix_data, cache_key)
         """
-        stable_components = caching_config.get("stable_prefix_components", [
-            "system_instructions",
-            "agent_identity",
-            "tool_schemas"
-        ])
-        variable_components = caching_config.get("variable_suffix_components", [
-            "recent_observations",
-            "current_task",
-            "session_context"
-        ])
+        stable_components, variable_components = self._get_component_sets(caching_config)
 
         prefix_data = {}
         suffix_data = {}
@@ -208,6 +241,33 @@ class InjectorProcessor(BaseProcessor):
 
         return prefix_data, suffix_data, cache_key
 
+    def _get_component_sets(
+        self, caching_config: Dict[str, Any]
+    ) -> Tuple[frozenset, frozenset]:
+        """Stable-prefix and variable-suffix component names as frozensets."""
+        cached = self._component_sets
+        if cached is None or cached[0] is not caching_config:
+            cached = (
+                caching_config,
+                frozenset(caching_config.get(
+                    "stable_prefix_components", self.DEFAULT_STABLE_COMPONENTS
+                )),
+                frozenset(caching_config.get(
+                    "variable_suffix_components", self.DEFAULT_VARIABLE_COMPONENTS
+                )),
+            )
+            self._component_sets = cached
+        return cached[1], cached[2]
+
+    def _get_component_names(self, data: Dict[str, Any]) -> Tuple[str, ...]:
+        """Component names of data as a shared tuple of interned strings."""
+        names = tuple(data)
+        shared = self._component_names.get(names)
+        if shared is None:
+            shared = tuple(sys.intern(name) for name in names)
+            self._component_names[shared] = shared
+        return shared
+
     def _generate_cache_key(
         self,
         agent_id: str,
@@ -219,8 +279,7 @@ class InjectorProcessor(BaseProcessor):
         Format: {agent_id}:{prefix_hash}
         """
         # Create deterministic hash of prefix data
-        prefix_str = json.dumps(prefix_data, sort_keys=True)
-        prefix_hash = hashlib.md5(prefix_str.encode()).hexdigest()[:8]
+        prefix_hash = _prefix_digest(prefix_data)
 
         cache_key = f"{agent_id}:{prefix_hash}"
         return cache_key
@@ -5,17 +5,28 @@ Retrieves relevant memories from the Memory Layer during context compilation.
 Supports both reactive (agent-controlled) and proactive (automatic) retrieval modes.
 """
 
+import os
 import time
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple, Iterator
+from pathlib import Path
 
-from app.services.processors.base_processor import BaseProcessor, ProcessorResult
+from app.services.processors.base_processor import BaseProcessor, ProcessorResult, load_json_cached
 from app.config import get_config
-from app.services.storage import write_event
+from app.services.storage import get_event_batcher, utc_timestamp
 from app.services.governance_auditor import get_governance_auditor
+from app.services.memory_manager import get_memory_manager
+
+try:
+    import numpy as np  # Vectorized score averaging for large retrievals
+except ImportError:  # Optional - scores are averaged in Python
+    np = None
 
 logger = logging.getLogger(__name__)
 
+# Retrievals smaller than this are averaged in Python (array setup costs more)
+SCORE_MEAN_VECTORIZE_MIN_ITEMS = 64
+
 
 class MemoryRetrieverProcessor(BaseProcessor):
     """
@@ -26,18 +37,37 @@ class MemoryRetrieverProcessor(BaseProcessor):
     - Adds retrieved memories to context for agent consumption
     """
 
+    # Input keys searched first when building a similarity query
+    QUERY_PRIORITY_KEYS = ("description", "summary", "text", "content", "query", "question")
+    _QUERY_PRIORITY_KEY_SET = frozenset(QUERY_PRIORITY_KEYS)
+
+    # Similarity queries are cut to this length (embeddings have token limits)
+    MAX_QUERY_CHARS = 500
+
+    def __init__(self, processor_id: str, config: Dict[str, Any]):
+        super().__init__(processor_id, config)
+
+        # Settings derived from config objects, rebuilt only when the source
+        # object changes (config reloaded or file modified):
+        # (config, memory_enabled, retrieval_mode)
+        self._memory_settings: Optional[Tuple[Any, bool, str]] = None
+        # (system_config, enabled, max_memories, similarity_threshold, use_embeddings)
+        self._proactive_settings: Optional[Tuple[Dict[str, Any], bool, int, float, bool]] = None
+        # (governance_policies, {limit_name: value})
+        self._governance_limits: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None
+
     def process(
         self, context: Dict[str, Any], agent_id: str, session_id: str
     ) -> ProcessorResult:
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         try:
-            config = get_config()
+            memory_enabled, retrieval_mode = self._get_memory_settings()
             modifications = {}
 
             # Check if memory layer is enabled
-            if not hasattr(config, 'memory') or not config.memory.enabled:
-                execution_time_ms = (time.time() - start_time) * 1000
+            if not memory_enabled:
+                execution_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
                 return self._create_result(
                     context=context,
                     success=True,
@@ -45,12 +75,6 @@ class MemoryRetrieverProcessor(BaseProcessor):
                     modifications_made={"status": "memory_layer_disabled"},
                 )
 
-            # Get retrieval mode from config
-            retrieval_mode = config.memory.retrieval_mode if hasattr(config.memory, 'retrieval_mode') else "reactive"
-
-            # Import MemoryManager
-            from app.services.memory_manager import get_memory_manager
-
             memory_manager = get_memory_manager()
 
             memories_retrieved = []
@@ -106,19 +130,14 @@ class MemoryRetrieverProcessor(BaseProcessor):
                 )
 
                 # Load proactive settings from system config
-                import os
-                import json
-                from pathlib import Path
-
-                registry_path = os.environ.get("REGISTRY_PATH", "/registries")
-                config_file = Path(registry_path) / "system_config.json"
-
-                with open(config_file, 'r') as f:
-                    system_config = json.load(f)
-
-                proactive_settings = system_config.get("memory", {}).get("proactive_settings", {})
-
-                if not proactive_settings.get("enabled", False):
+                (
+                    proactive_enabled,
+                    max_memories,
+                    similarity_threshold,
+                    use_embeddings,
+                ) = self._get_proactive_settings()
+
+                if not proactive_enabled:
                     logger.info("Proactive memory preloading disabled in config")
                     modifications["retrieval_mode"] = "proactive"
                     modifications["memories_retrieved"] = 0
@@ -135,10 +154,6 @@ class MemoryRetrieverProcessor(BaseProcessor):
                         modifications["reason"] = "no_query_text"
                     else:
                         # Use similarity search
-                        max_memories = proactive_settings.get("max_memories_to_preload", 5)
-                        similarity_threshold = proactive_settings.get("similarity_threshold", 0.7)
-                        use_embeddings = proactive_settings.get("use_embeddings", False)
-
                         # Retrieve memories by similarity
                         scored_memories = memory_manager.retrieve_memories_by_similarity(
                             query_text=query_text,
@@ -148,10 +163,9 @@ class MemoryRetrieverProcessor(BaseProcessor):
                         )
 
                         # Phase 8: Enforce governance limits
-                        auditor = get_governance_auditor(session_id)
-
-                        # Load governance limits
-                        governance_limit = self._load_governance_limit("max_memory_retrievals_per_invocation", 10)
+                        governance_limit = self._load_governance_limit(
+                            "max_memory_retrievals_per_invocation", 10
+                        )
 
                         if len(scored_memories) > governance_limit:
                             logger.warning(
@@ -159,6 +173,7 @@ class MemoryRetrieverProcessor(BaseProcessor):
                             )
 
                             # Log governance limit enforcement
+                            auditor = get_governance_auditor(session_id)
                             auditor.log_governance_limit_exceeded(
                                 limit_type="max_memory_retrievals_per_invocation",
                                 requested=len(scored_memories),
@@ -192,10 +207,8 @@ class MemoryRetrieverProcessor(BaseProcessor):
                         modifications["similarity_method"] = "embeddings" if use_embeddings else "keyword"
                         modifications["similarity_threshold"] = similarity_threshold
 
-                        if memories_retrieved:
-                            modifications["avg_similarity_score"] = sum(
-                                m["similarity_score"] for m in memories_retrieved
-                            ) / len(memories_retrieved)
+                        if scored_memories:
+                            modifications["avg_similarity_score"] = self._mean_score(scored_memories)
 
             # Write memory retrieval event if memories were retrieved
             if memories_retrieved:
@@ -203,21 +216,23 @@ class MemoryRetrieverProcessor(BaseProcessor):
                     "event_type": "memory_retrieved",
                     "session_id": session_id,
                     "agent_id": agent_id,
-                    "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                    "timestamp": utc_timestamp(),
                     "retrieval_mode": retrieval_mode,
                     "query": modifications.get("query"),
                     "memories_found": len(memories_retrieved),
                     "memory_ids": [m["memory_id"] for m in memories_retrieved],
                 }
 
-                write_event(session_id, memory_event)
+                # Written with the session's other pipeline events when the
+                # pipeline finishes (see ContextProcessorPipeline.execute)
+                get_event_batcher().append(session_id, memory_event)
 
                 logger.info(
                     f"Memory retrieval completed for session={session_id}: "
                     f"{len(memories_retrieved)} memories retrieved"
                 )
 
-            execution_time_ms = (time.time() - start_time) * 1000
+            execution_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
 
             return self._create_result(
                 context=context,
@@ -227,7 +242,7 @@ class MemoryRetrieverProcessor(BaseProcessor):
             )
 
         except Exception as e:
-            execution_time_ms = (time.time() - start_time) * 1000
+            execution_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
             logger.error(
                 f"MemoryRetriever failed for session={session_id}: {e}",
                 exc_info=True,
@@ -239,6 +254,16 @@ class MemoryRetrieverProcessor(BaseProcessor):
                 error=str(e),
             )
 
+    def _mean_score(self, scored_memories: List[Tuple[Any, float]]) -> float:
+        """Mean similarity score of (memory, score) pairs (non-empty)."""
+        count = len(scored_memories)
+        if np is not None and count >= SCORE_MEAN_VECTORIZE_MIN_ITEMS:
+            scores = np.fromiter(
+                (score for _, score in scored_memories), dtype=np.float64, count=count
+            )
+            return float(scores.mean())
+        return sum(score for _, score in scored_memories) / count
+
     def _build_query_from_context(self, original_input: Any) -> str:
         """
         Build a query string from original input for similarity search.
@@ -246,29 +271,81 @@ class MemoryRetrieverProcessor(BaseProcessor):
         Phase 8: Extract relevant text from structured input.
         """
         query_parts = []
+        query_length = 0
+
+        # Stop collecting once the query is long enough - large inputs
+        # shouldn't cost more than the 500 chars we keep
+        for text in self._iter_query_strings(original_input):
+            query_parts.append(text)
+            query_length += len(text) + 1
+            if (
+                query_length > self.MAX_QUERY_CHARS
+                and len(" ".join(query_parts).strip()) >= self.MAX_QUERY_CHARS
+            ):
+                break
 
-        if isinstance(original_input, dict):
-            # Extract text from dict values (prioritize certain keys)
-            priority_keys = ["description", "summary", "text", "content", "query", "question"]
+        # Combine and limit length (embeddings have token limits)
+        query_text = " ".join(query_parts)
+        query_text = query_text.strip()[:self.MAX_QUERY_CHARS]
+
+        return query_text
 
+    def _iter_query_strings(self, original_input: Any) -> Iterator[str]:
+        """Yield the strings of original input, priority keys first."""
+        if isinstance(original_input, dict):
             # First try priority keys
-            for key in priority_keys:
-                if key in original_input and isinstance(original_input[key], str):
-                    query_parts.append(original_input[key])
+            for key in self.QUERY_PRIORITY_KEYS:
+                value = original_input.get(key)
+                if isinstance(value, str):
+                    yield value
 
             # Then add other string values
             for key, value in original_input.items():
-                if key not in priority_keys and isinstance(value, str):
-                    query_parts.append(value)
+                if key not in self._QUERY_PRIORITY_KEY_SET and isinstance(value, str):
+                    yield value
 
         elif isinstance(original_input, str):
-            query_parts.append(original_input)
+            yield original_input
+
+    def _get_memory_settings(self) -> Tuple[bool, str]:
+        """(memory_enabled, retrieval_mode) from the app config."""
+        config = get_config()
+        cached = self._memory_settings
+        if cached is None or cached[0] is not config:
+            memory = getattr(config, "memory", None)
+            cached = (
+                config,
+                bool(memory is not None and memory.enabled),
+                getattr(memory, "retrieval_mode", "reactive"),
+            )
+            self._memory_settings = cached
+        return cached[1], cached[2]
 
-        # Combine and limit length (embeddings have token limits)
-        query_text = " ".join(query_parts)
-        query_text = query_text.strip()[:500]  # Limit to 500 chars
+    def _get_proactive_settings(self) -> Tuple[bool, int, float, bool]:
+        """
+        Proactive retrieval settings from system config.
 
-        return query_text
+        Returns:
+            (enabled, max_memories_to_preload, similarity_threshold, use_embeddings)
+        """
+        registry_path = os.environ.get("REGISTRY_PATH", "/registries")
+        config_file = Path(registry_path) / "system_config.json"
+
+        # Cached - only re-parsed when the system config changes
+        system_config = load_json_cached(config_file)
+
+        cached = self._proactive_settings
+        if cached is None or cached[0] is not system_config:
+            proactive_settings = system_config.get("memory", {}).get("proactive_settings", {})
+            cached = (
+                system_config,
+                proactive_settings.get("enabled", False),
+                proactive_settings.get("max_memories_to_preload", 5),
+                proactive_settings.get("similarity_threshold", 0.7),
+                proactive_settings.get("use_embeddings", False),
+            )
+            self._proactive_settings = cached
+        return cached[1:]
 
     def _load_governance_limit(self, limit_name: str, default: int) -> int:
         """
@@ -284,20 +361,23 @@ class MemoryRetrieverProcessor(BaseProcessor):
             Limit value from governance policies or default
         """
         try:
-            import os
-            import json
-            from pathlib import Path
-
             registry_path = os.environ.get("REGISTRY_PATH", "/registries")
             policy_file = Path(registry_path) / "governance_policies.json"
 
-            with open(policy_file, 'r') as f:
-                policies = json.load(f)
+            # Cached - only re-parsed when the policies file changes
+            policies = load_json_cached(policy_file)
+
+            cached = self._governance_limits
+            if cached is None or cached[0] is not policies:
+                cached = (policies, {})
+                self._governance_limits = cached
 
-            context_governance = policies.get("policies", {}).get("context_governance", {})
-            limit_value = context_governance.get(limit_name, default)
+            limits = cached[1]
+            if limit_name not in limits:
+                context_governance = policies.get("policies", {}).get("context_governance", {})
+                limits[limit_name] = context_governance.get(limit_name, default)
 
-            return limit_value
+            return limits[limit_name]
 
         except Exception as e:
             logger.warning(f"Failed to load governance limit {limit_name}: {e}, using default={default}")
@@ -6,13 +6,130 @@ This is a critical processor that prevents context bloat.
 """
 
 import time
+import hashlib
 import logging
-from typing import Dict, Any, List
+import threading
+from typing import Dict, Any, List, Optional
 
+from app.services import json_utils
 from app.services.processors.base_processor import BaseProcessor, ProcessorResult
 
+try:
+    import tiktoken
+except ImportError:  # Optional - tokens are estimated as 4 chars per token
+    tiktoken = None
+
 logger = logging.getLogger(__name__)
 
+# Token counts memoized per serialized text, cleared when full. Observations
+# repeat across an agent's invocations, so most texts are seen before.
+TOKEN_COUNT_CACHE_MAX_SIZE = 4096
+
+# Keyed by a digest of the text, so the cache doesn't pin large contexts
+_token_counts: Dict[bytes, int] = {}
+_token_counts_lock = threading.Lock()
+
+# Encoding loaded on first use; False once loading has failed
+_encoding: Any = None
+_encoding_lock = threading.Lock()
+
+
+def _get_encoding() -> Optional[Any]:
+    """Get the shared tiktoken encoding, or None if it can't be loaded."""
+    global _encoding
+    if _encoding is None:
+        with _encoding_lock:
+            if _encoding is None:
+                try:
+                    # Same encoding ContextCompiler counts with
+                    _encoding = tiktoken.encoding_for_model("gpt-3.5-turbo")
+                except Exception as e:  # tiktoken missing, or the encoding can't be fetched
+                    logger.warning(f"tiktoken unavailable, estimating 4 chars per token: {e}")
+                    _encoding = False
+    return _encoding or None
+
+
+def _count_tokens_batch(encoding: Any, texts: List[str]) -> List[int]:
+    """Token counts for texts, encoding only the ones not counted before."""
+    keys = [hashlib.blake2b(text.encode(), digest_size=16).digest() for text in texts]
+
+    # Work from a local copy - other threads may clear the shared cache
+    counts: Dict[bytes, int] = {}
+    with _token_counts_lock:
+        for key in keys:
+            count = _token_counts.get(key)
+            if count is not None:
+                counts[key] = count
+
+    missing = {key: text for key, text in zip(keys, texts) if key not in counts}
+    if missing:
+        # encode_batch tokenizes on tiktoken's own threads (outside the lock)
+        for key, tokens in zip(missing, encoding.encode_batch(list(missing.values()))):
+            counts[key] = len(tokens)
+
+        with _token_counts_lock:
+            if len(_token_counts) + len(missing) > TOKEN_COUNT_CACHE_MAX_SIZE:
+                _token_counts.clear()
+            _token_counts.update((key, counts[key]) for key in missing)
+
+    return [counts[key] for key in keys]
+
+
+def _dumps(value: Any) -> str:
+    """Serialize value as JSON text."""
+    return json_utils.dumps(value, non_str_keys=True).decode()
+
+
+def _json_length(value: Any) -> int:
+    """
+    Length of json.dumps(value) with default separators, without building it.
+
+    Strings are counted as len + 2 quotes (escapes are ignored), which is
+    close enough for the 4-chars-per-token estimate.
+
+    Raises:
+        TypeError: If value contains a non-JSON-serializable object
+    """
+    if isinstance(value, str):
+        return len(value) + 2
+    if isinstance(value, dict):
+        if not value:
+            return 2
+        # "{" + '"key": value' items joined by ", " + "}"
+        return sum(
+            len(str(key)) + 4 + _json_length(item) for key, item in value.items()
+        ) + 2 * len(value)
+    if isinstance(value, (list, tuple)):
+        if not value:
+            return 2
+        return sum(_json_length(item) for item in value) + 2 * len(value)
+    if value is None or value is True:
+        return 4
+    if value is False:
+        return 5
+    if isinstance(value, (int, float)):
+        return len(repr(value))
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# Length of the separator between serialized list items (see _serialized_length)
+_ITEM_SEPARATOR_LENGTH = 1 if json_utils.HAS_ORJSON else 2
+
+
+def _serialized_length(value: Any) -> int:
+    """
+    Length of value serialized as JSON - the basis of the token estimate.
+
+    Serializes with orjson when available (compact, in C); otherwise
+    estimates with _json_length instead of building the text in Python.
+
+    Raises:
+        TypeError: If value contains a non-JSON-serializable object
+    """
+    if json_utils.HAS_ORJSON:
+        return len(json_utils.dumps(value, non_str_keys=True))
+    return _json_length(value)
+
 
 class TokenBudgetEnforcerProcessor(BaseProcessor):
     """
@@ -30,14 +147,14 @@ class TokenBudgetEnforcerProcessor(BaseProcessor):
     def process(
         self, context: Dict[str, Any], agent_id: str, session_id: str
     ) -> ProcessorResult:
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         try:
             enforce_limits = self.config.get("enforce_limits", True)
 
             if not enforce_limits:
                 # Passthrough if enforcement disabled
-                execution_time_ms = (time.time() - start_time) * 1000
+                execution_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
                 return self._create_result(
                     context=context,
                     success=True,
@@ -47,8 +164,7 @@ class TokenBudgetEnforcerProcessor(BaseProcessor):
             # Get max tokens from context metadata (set by registry)
             max_tokens = context.get("metadata", {}).get("max_context_tokens", 10000)
 
-            # Simplified token estimation (4 chars ≈ 1 token)
-            # Full implementation will use tiktoken
+            # tiktoken counts when available, else 4 chars ≈ 1 token
             estimated_tokens = self._estimate_tokens(context)
 
             modifications = {
@@ -73,7 +189,7 @@ class TokenBudgetEnforcerProcessor(BaseProcessor):
                     f"(max: {max_tokens})"
                 )
 
-                execution_time_ms = (time.time() - start_time) * 1000
+                execution_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
 
                 return self._create_result(
                     context=truncated_context,
@@ -83,7 +199,7 @@ class TokenBudgetEnforcerProcessor(BaseProcessor):
                 )
 
             # Within budget
-            execution_time_ms = (time.time() - start_time) * 1000
+            execution_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
 
             return self._create_result(
                 context=context,
@@ -93,11 +209,13 @@ class TokenBudgetEnforcerProcessor(BaseProcessor):
             )
 
         except Exception as e:
-            execution_time_ms = (time.time() - start_time) * 1000
+            execution_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
             logger.error(
                 f"TokenBudgetEnforcer failed for agent={agent_id}: {e}",
                 exc_info=True,
             )
+            # No copy to roll back to - if re-estimating failed, observations
+            # stay truncated in the context the pipeline continues with
             return self._create_result(
                 context=context,
                 success=False,
@@ -106,15 +224,47 @@ class TokenBudgetEnforcerProcessor(BaseProcessor):
             )
 
     def _estimate_tokens(self, context: Dict[str, Any]) -> int:
-        """Simplified token estimation (4 chars ≈ 1 token)"""
-        import json
+        """
+        Estimate the tokens in context.
 
+        With tiktoken, each top-level key and value (and each observation)
+        is serialized and counted separately, so unchanged parts hit the
+        token count cache. Otherwise 4 chars ≈ 1 token.
+        """
         try:
-            context_str = json.dumps(context)
-            return len(context_str) // 4
+            encoding = _get_encoding()
+            if encoding is None:
+                return _serialized_length(context) // 4
+
+            texts = []
+            for key, value in context.items():
+                texts.append(key)
+                if key == "observations" and isinstance(value, list):
+                    texts.extend(_dumps(item) for item in value)
+                else:
+                    texts.append(_dumps(value))
+            return sum(_count_tokens_batch(encoding, texts))
         except:
             return 0
 
+    def _observation_tokens(self, observations: List[Any]) -> List[float]:
+        """Estimated tokens contributed by each observation (see _estimate_tokens)."""
+        encoding = _get_encoding()
+        if encoding is not None:
+            try:
+                return _count_tokens_batch(encoding, [_dumps(item) for item in observations])
+            except TypeError:
+                return [0] * len(observations)
+
+        # The observation and its separator, at 4 chars per token
+        costs = []
+        for item in observations:
+            try:
+                costs.append((_serialized_length(item) + _ITEM_SEPARATOR_LENGTH) / 4)
+            except TypeError:
+                costs.append(0)
+        return costs
+
     def _truncate_context(
         self, context: Dict[str, Any], current_tokens: int, max_tokens: int
     ) -> Dict[str, Any]:
@@ -126,21 +276,26 @@ class TokenBudgetEnforcerProcessor(BaseProcessor):
         2. Prior outputs (keep required ones)
         3. Recent observations over old ones
         """
-        truncated = context.copy()
+        # Processors own the pipeline context - truncate in place (no copy).
+        # The observations list is replaced, never mutated.
+        truncated = context
         truncation_strategy = self.config.get("truncation_strategy", "prioritize_recent")
 
         # Simple strategy: Truncate observations from oldest first
-        if "observations" in truncated and truncated["observations"]:
-            # Keep only recent observations
-            target_reduction = current_tokens - max_tokens
-            removed_count = 0
+        observations = truncated.get("observations")
+        if observations:
+            # Keep only recent observations. Subtract each removed
+            # observation's tokens instead of re-estimating the context.
+            observation_tokens = self._observation_tokens(observations)
 
-            while removed_count < len(truncated["observations"]) and target_reduction > 0:
-                # Remove oldest observation
-                truncated["observations"].pop(0)
+            # Count the oldest observations to drop, then slice once - the
+            # caller's list is left untouched and nothing is shifted per removal
+            removed_count = 0
+            while removed_count < len(observations) and current_tokens > max_tokens:
+                current_tokens -= observation_tokens[removed_count]
                 removed_count += 1
-                # Re-estimate
-                current_tokens = self._estimate_tokens(truncated)
-                target_reduction = current_tokens - max_tokens
+
+            if removed_count:
+                truncated["observations"] = observations[removed_count:]
 
         return truncated
@@ -26,10 +26,13 @@ class TransformerProcessor(BaseProcessor):
     def process(
         self, context: Dict[str, Any], agent_id: str, session_id: str
     ) -> ProcessorResult:
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         try:
-            transformed_context = context.copy()
+            # Processors own the pipeline context - transform in place (no copy).
+            # message_observations is only assigned once built, so a failure
+            # leaves the context as it was.
+            transformed_context = context
             modifications = {}
 
             convert_to_messages = self.config.get("convert_to_messages", True)
@@ -39,7 +42,7 @@ class TransformerProcessor(BaseProcessor):
 
             if not convert_to_messages:
                 # Passthrough mode
-                execution_time_ms = (time.time() - start_time) * 1000
+                execution_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
                 return self._create_result(
                     context=transformed_context,
                     success=True,
@@ -50,25 +53,18 @@ class TransformerProcessor(BaseProcessor):
             # This is a simplified version - full implementation would
             # convert all context components to proper message format
             if "observations" in transformed_context:
-                message_observations = []
-                for obs in transformed_context["observations"]:
-                    # Convert observation to message format
-                    if obs.get("event_type") == "tool_invocation":
-                        message_observations.append(
-                            {
-                                "role": "function",
-                                "name": obs.get("tool_id", "unknown"),
-                                "content": obs.get("result", {}),
-                            }
-                        )
-                    else:
-                        # Generic observation
-                        message_observations.append(
-                            {
-                                "role": "assistant",
-                                "content": str(obs.get("data", obs)),
-                            }
-                        )
+                # Convert observations to message format in one pass
+                message_observations = [
+                    {
+                        "role": "function",
+                        "name": obs.get("tool_id", "unknown"),
+                        "content": obs.get("result", {}),
+                    }
+                    if obs.get("event_type") == "tool_invocation"
+                    # Generic observation
+                    else {"role": "assistant", "content": str(obs.get("data", obs))}
+                    for obs in transformed_context["observations"]
+                ]
 
                 transformed_context["message_observations"] = message_observations
                 modifications["observations_transformed"] = len(message_observations)
@@ -79,7 +75,7 @@ class TransformerProcessor(BaseProcessor):
                 # In production, this would enforce stricter validation
                 modifications["role_validation_applied"] = True
 
-            execution_time_ms = (time.time() - start_time) * 1000
+            execution_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
 
             return self._create_result(
                 context=transformed_context,
@@ -89,7 +85,7 @@ class TransformerProcessor(BaseProcessor):
             )
 
         except Exception as e:
-            execution_time_ms = (time.time() - start_time) * 1000
+            execution_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
             logger.error(
                 f"Transformer failed for agent={agent_id}: {e}", exc_info=True
             )
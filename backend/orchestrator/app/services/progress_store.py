@@ -5,29 +5,53 @@ Pattern: ClaimSense AI polling-based approach
 
 Demonstrates:
 - Thread-safe concurrent access from sync orchestrator and async SSE
-- Delta streaming (send only new events)
+- Delta streaming (send only new events, tracked by per-session sequence)
 - Memory-bounded storage (auto-trim old events)
 - Session lifecycle management
 """
 
+from collections import deque
 from threading import Lock
-from typing import Dict, List, Optional
-from datetime import datetime
-from pydantic import BaseModel
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional
 
+from .storage import utc_timestamp
 
-class SessionProgress(BaseModel):
+
+@dataclass(slots=True)
+class SessionProgress:
     """Progress tracking for a workflow session"""
     session_id: str
     workflow_id: str
     status: str  # "running", "completed", "error"
     created_at: str
     updated_at: str
-    events: List[Dict] = []  # All logged events
+    events: Deque[Dict] = field(default_factory=deque)  # Logged events (bounded by ProgressStore)
     current_agent: Optional[str] = None
 
-    class Config:
-        arbitrary_types_allowed = True
+
+@dataclass(slots=True)
+class SessionDelta:
+    """Events added to a session since a sequence number, plus its current state"""
+    events: List[Dict]  # New events, oldest first
+    next_seq: int  # Sequence number to poll from next
+    status: str
+    updated_at: str
+
+
+# Sessions are spread over this many independently locked shards, so
+# concurrent writers and SSE pollers only contend within a shard
+PROGRESS_STORE_SHARDS = 16
+
+
+@dataclass(slots=True)
+class _ProgressShard:
+    """A partition of the store's sessions guarded by its own lock"""
+    sessions: Dict[str, SessionProgress] = field(default_factory=dict)
+    # Sequence number of the next event per session. Events are only
+    # trimmed from the front, so events[i] has seq next_seq - len(events) + i
+    next_seq: Dict[str, int] = field(default_factory=dict)
+    lock: Lock = field(default_factory=Lock)
 
 
 class ProgressStore:
@@ -45,12 +69,16 @@ class ProgressStore:
         Initialize progress store.
 
         Args:
-            max_events_per_session: Maximum events to keep per session (auto-trim oldest)
+            max_events_per_session: Maximum events to keep per session (oldest dropped first)
         """
-        self._sessions: Dict[str, SessionProgress] = {}
-        self._lock = Lock()  # Thread-safe access
+        # Thread-safe access: one lock per shard
+        self._shards = [_ProgressShard() for _ in range(PROGRESS_STORE_SHARDS)]
         self.max_events = max_events_per_session
 
+    def _shard(self, session_id: str) -> _ProgressShard:
+        """Get the shard holding a session."""
+        return self._shards[hash(session_id) % PROGRESS_STORE_SHARDS]
+
     def create_session(self, session_id: str, workflow_id: str) -> None:
         """
         Initialize session progress tracking.
@@ -59,15 +87,19 @@ class ProgressStore:
             session_id: Unique session identifier
             workflow_id: Workflow being executed
         """
-        with self._lock:
-            self._sessions[session_id] = SessionProgress(
+        shard = self._shard(session_id)
+        with shard.lock:
+            now = utc_timestamp()
+            shard.sessions[session_id] = SessionProgress(
                 session_id=session_id,
                 workflow_id=workflow_id,
                 status="running",
-                created_at=datetime.utcnow().isoformat() + "Z",
-                updated_at=datetime.utcnow().isoformat() + "Z",
-                events=[]
+                created_at=now,
+                updated_at=now,
+                # Bounded deque drops the oldest event in O(1) once full
+                events=deque(maxlen=self.max_events),
             )
+            shard.next_seq[session_id] = 0
 
     def add_event(self, session_id: str, event: Dict) -> None:
         """
@@ -78,11 +110,13 @@ class ProgressStore:
 
         Thread-safe: Can be called from sync orchestrator running in thread pool
         """
-        with self._lock:
-            if session_id in self._sessions:
-                session = self._sessions[session_id]
+        shard = self._shard(session_id)
+        with shard.lock:
+            if session_id in shard.sessions:
+                session = shard.sessions[session_id]
                 session.events.append(event)
-                session.updated_at = datetime.utcnow().isoformat() + "Z"
+                shard.next_seq[session_id] += 1
+                session.updated_at = utc_timestamp()
 
                 # Extract current agent from event if present
                 if event.get("event_type") == "agent_invocation_started":
@@ -90,10 +124,6 @@ class ProgressStore:
                 elif event.get("event_type") in ["agent_invocation_completed", "agent_invocation_error", "agent_invocation_incomplete"]:
                     session.current_agent = None
 
-                # Trim if exceeds max (keep most recent events)
-                if len(session.events) > self.max_events:
-                    session.events = session.events[-self.max_events:]
-
     def update_status(self, session_id: str, status: str) -> None:
         """
         Update session status.
@@ -102,29 +132,45 @@ class ProgressStore:
             session_id: Session to update
             status: New status ("running", "completed", "error")
         """
-        with self._lock:
-            if session_id in self._sessions:
-                self._sessions[session_id].status = status
-                self._sessions[session_id].updated_at = datetime.utcnow().isoformat() + "Z"
+        shard = self._shard(session_id)
+        with shard.lock:
+            if session_id in shard.sessions:
+                shard.sessions[session_id].status = status
+                shard.sessions[session_id].updated_at = utc_timestamp()
 
-    def get_session_progress(self, session_id: str) -> Optional[SessionProgress]:
+    def get_session_delta(self, session_id: str, since_seq: int = 0) -> Optional[SessionDelta]:
         """
-        Get session progress (called by SSE endpoint).
+        Get the events added since a sequence number (called by SSE endpoint).
+
+        Only the new events are copied, so polling costs O(new events)
+        rather than O(all events). Pass the returned next_seq as since_seq
+        on the next poll. If events after since_seq were already trimmed,
+        all retained events are returned.
 
         Args:
             session_id: Session to retrieve
+            since_seq: Sequence number of the first event wanted (0 for all)
 
         Returns:
-            SessionProgress if exists, None otherwise
+            SessionDelta if session exists, None otherwise
 
         Thread-safe: Can be called from async SSE endpoint while orchestrator writes
         """
-        with self._lock:
-            session = self._sessions.get(session_id)
-            # Return a copy to avoid external mutations
-            if session:
-                return SessionProgress(**session.dict())
-            return None
+        shard = self._shard(session_id)
+        with shard.lock:
+            session = shard.sessions.get(session_id)
+            if not session:
+                return None
+
+            next_seq = shard.next_seq[session_id]
+            first_seq = next_seq - len(session.events)
+            events = session.events
+            return SessionDelta(
+                events=[events[i] for i in range(max(since_seq - first_seq, 0), len(events))],
+                next_seq=next_seq,
+                status=session.status,
+                updated_at=session.updated_at,
+            )
 
     def cleanup_session(self, session_id: str) -> None:
         """
@@ -133,9 +179,11 @@ class ProgressStore:
         Args:
             session_id: Session to cleanup
         """
-        with self._lock:
-            if session_id in self._sessions:
-                del self._sessions[session_id]
+        shard = self._shard(session_id)
+        with shard.lock:
+            if session_id in shard.sessions:
+                del shard.sessions[session_id]
+                del shard.next_seq[session_id]
 
     def get_stats(self) -> Dict:
         """
@@ -144,11 +192,17 @@ class ProgressStore:
         Returns:
             Dict with active_sessions, total_events
         """
-        with self._lock:
-            return {
-                "active_sessions": len(self._sessions),
-                "total_events": sum(len(s.events) for s in self._sessions.values())
-            }
+        active_sessions = 0
+        total_events = 0
+        for shard in self._shards:
+            with shard.lock:
+                active_sessions += len(shard.sessions)
+                total_events += sum(len(s.events) for s in shard.sessions.values())
+
+        return {
+            "active_sessions": active_sessions,
+            "total_events": total_events
+        }
 
 
 # Singleton instance
@@ -9,13 +9,145 @@ Demonstrates scalability patterns:
 - Versioning support
 """
 
-import json
+import logging
+import os
+import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Set, Tuple, Type, TypeVar
 import threading
+from collections import defaultdict
+from dataclasses import dataclass, field, replace
 from pydantic import BaseModel, ValidationError
 
+from app.services import json_utils
+from app.services.storage import utc_timestamp
+
+try:
+    from jsonschema import Draft7Validator
+    from jsonschema.exceptions import SchemaError
+
+    # Meta-schema validator built once (check_schema() rebuilds it per call)
+    _SCHEMA_META_VALIDATOR = Draft7Validator(
+        Draft7Validator.META_SCHEMA, format_checker=Draft7Validator.FORMAT_CHECKER
+    )
+except ImportError:  # Optional - tool schemas are not validated without it
+    _SCHEMA_META_VALIDATOR = None
+
+
+logger = logging.getLogger(__name__)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a registry JSON file."""
+    return json_utils.loads(path.read_bytes())
+
+
+def _dumps_json(data: Any) -> bytes:
+    """Serialize registry data as indented JSON bytes."""
+    return json_utils.dumps(data, indent=True, append_newline=True)
+
+
+def _drain(entries: List[Any]) -> Iterator[Any]:
+    """
+    Yield list items in order, removing each from the list as it's consumed.
+
+    Lets the raw JSON entries be freed one by one while models are built
+    from them, instead of keeping the whole parsed file alive until the end.
+    """
+    entries.reverse()
+    while entries:
+        yield entries.pop()
+
+
+def _cached_entries(
+    entries: Dict[str, BaseModel], serialized: Dict[str, bytes]
+) -> List[bytes]:
+    """
+    Each entry in order, serialized as an item of a registry file's list.
+
+    Reuses the bytes cached by ID, so a write only serializes the entries
+    that changed since the last one.
+    """
+    result = []
+    for entry_id, entry in entries.items():
+        item = serialized.get(entry_id)
+        if item is None:
+            # Indented one level deeper, as it sits inside the top-level list
+            item = b"    " + _dumps_json(entry.model_dump()).rstrip(b"\n").replace(b"\n", b"\n    ")
+            serialized[entry_id] = item
+        result.append(item)
+    return result
+
+
+def _dumps_registry(document: Dict[str, Any], key: str) -> bytes:
+    """
+    Serialize a registry document whose document[key] holds pre-serialized items.
+
+    Produces the same bytes as _dumps_json() on the plain document - only
+    the rest of the document is serialized here, the items are spliced in.
+    """
+    items = document[key]
+    serialized = _dumps_json({**document, key: []})
+    if not items:
+        return serialized
+
+    # key is the last member, so its empty list is the last "[]"
+    head, _, tail = serialized.rpartition(b"[]")
+    return head + b"[\n" + b",\n".join(items) + b"\n  ]" + tail
+
+
+def _index_access_rules(
+    policy: Dict[str, Any], allowed_key: str, denied_key: str
+) -> Dict[str, Dict[str, bool]]:
+    """
+    Index an access policy's rules as agent ID -> {target ID: allowed}.
+
+    Matches scanning the rules in order: the first rule for the agent that
+    mentions the target decides, and a rule's denials beat its allowances.
+    """
+    index: Dict[str, Dict[str, bool]] = {}
+    for rule in policy.get("rules", []):
+        decisions = index.setdefault(rule.get("agent_id"), {})
+        for target_id in rule.get(denied_key) or ():
+            decisions.setdefault(target_id, False)
+        for target_id in rule.get(allowed_key) or ():
+            decisions.setdefault(target_id, True)
+    return index
+
+
+def _discard_reference(index: Dict[str, Set[str]], key: str, ref: str) -> None:
+    """Remove ref from a reverse index entry, dropping the entry once empty."""
+    refs = index.get(key)
+    if refs is not None:
+        refs.discard(ref)
+        if not refs:
+            del index[key]
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Write bytes to path atomically.
+
+    Writes a temp file in the same directory, fsyncs it, then os.replace()s
+    it over the target (atomic on POSIX and Windows, unlike os.rename).
+    Prevents corruption if the process crashes during the write.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    except BaseException:
+        os.close(fd)
+        os.unlink(tmp_path)
+        raise
+    os.close(fd)
+    os.replace(tmp_path, path)
+
 
 class AgentMetadata(BaseModel):
     """Agent registry entry with full metadata."""
@@ -83,6 +215,25 @@ class GovernancePolicies(BaseModel):
     policies: Dict[str, Any]
 
 
+@dataclass(frozen=True, slots=True)
+class _RegistrySnapshot:
+    """
+    Immutable view of the registries served to readers.
+
+    Writers build a new snapshot and publish it with a single attribute
+    assignment, so queries read a consistent state without locking.
+    """
+    agents: Dict[str, AgentMetadata] = field(default_factory=dict)
+    tools: Dict[str, ToolMetadata] = field(default_factory=dict)
+    models: Dict[str, ModelProfile] = field(default_factory=dict)
+    workflows: Dict[str, WorkflowDefinition] = field(default_factory=dict)
+    governance: Optional[GovernancePolicies] = None
+
+    # Governance access rules: agent ID -> {target ID: allowed}
+    invocation_rules: Dict[str, Dict[str, bool]] = field(default_factory=dict)
+    tool_access_rules: Dict[str, Dict[str, bool]] = field(default_factory=dict)
+
+
 class RegistryManager:
     """
     Production-grade registry manager.
@@ -95,17 +246,66 @@ class RegistryManager:
     - Lookup optimization (O(1) by ID)
     """
 
-    def __init__(self, registries_path: str = "/registries"):
+    def __init__(self, registries_path: str = "/registries", trusted: bool = False):
+        """
+        Args:
+            registries_path: Directory containing the registry files
+            trusted: Skip Pydantic validation when loading files from disk.
+                Only for registries written by this manager (CRUD input is
+                always validated).
+        """
         self.registries_path = Path(registries_path)
+        self.trusted = trusted
         self._lock = threading.RLock()
 
-        # Caches (indexed by ID for O(1) lookup)
+        # Published read snapshot (never mutated - replaced by writers)
+        self._snapshot = _RegistrySnapshot()
+
+        # Writer-side caches (indexed by ID for O(1) lookup), only touched
+        # with the lock held and published to readers via _publish()
         self._agents: Dict[str, AgentMetadata] = {}
         self._tools: Dict[str, ToolMetadata] = {}
         self._models: Dict[str, ModelProfile] = {}
         self._workflows: Dict[str, WorkflowDefinition] = {}
         self._governance: Optional[GovernancePolicies] = None
 
+        # Serialized registry file item of each entry, filled on first write
+        # and dropped when the entry changes (writers re-serialize only
+        # what changed)
+        self._agent_json: Dict[str, bytes] = {}
+        self._tool_json: Dict[str, bytes] = {}
+        self._model_json: Dict[str, bytes] = {}
+
+        # Reverse indexes for usage checks: tool/model/agent ID -> IDs of the
+        # agents/workflows referencing it. Rebuilt on load, kept in sync by CRUD.
+        self._tool_to_agents: Dict[str, Set[str]] = defaultdict(set)
+        self._model_to_agents: Dict[str, Set[str]] = defaultdict(set)
+        self._agent_to_workflows: Dict[str, Set[str]] = defaultdict(set)
+
+        # (snapshot dict, capability/tag -> entries in registry order) for
+        # filtered listings - built on first use per published snapshot
+        self._agents_by_capability: Optional[
+            Tuple[Dict[str, AgentMetadata], Dict[str, List[AgentMetadata]]]
+        ] = None
+        self._tools_by_tag: Optional[
+            Tuple[Dict[str, ToolMetadata], Dict[str, List[ToolMetadata]]]
+        ] = None
+
+        # (snapshot dicts, result) for the per-step discovery queries - the
+        # answers only change when a new snapshot is published
+        self._orchestrator_agents: Optional[
+            Tuple[Dict[str, AgentMetadata], List[AgentMetadata]]
+        ] = None
+        self._tools_for_agent: Optional[
+            Tuple[Dict[str, AgentMetadata], Dict[str, ToolMetadata], Dict[str, List[ToolMetadata]]]
+        ] = None
+
+        # Workflow file -> ((mtime_ns, size), workflow) from the last load
+        self._workflow_files: Dict[Path, Tuple[Tuple[int, int], WorkflowDefinition]] = {}
+
+        # Registries whose last write failed (retried by the next flush)
+        self._dirty: Set[str] = set()
+
         # Metadata
         self._loaded_at: Optional[datetime] = None
         self._load_count = 0
@@ -118,102 +318,195 @@ class RegistryManager:
         Validates all entries on load.
         """
         with self._lock:
+            # Don't let the reload discard changes still waiting to be written
+            self.flush()
+
+            # Loaded serially on purpose: the files are small and parsing and
+            # validation hold the GIL, so fanning the loaders out to a thread
+            # pool measured ~2x slower, even with a cold page cache
             self._load_agents()
             self._load_tools()
             self._load_models()
             self._load_workflows()
             self._load_governance()
+            self._rebuild_indexes()
+
+            self._snapshot = _RegistrySnapshot(
+                agents=dict(self._agents),
+                tools=dict(self._tools),
+                models=dict(self._models),
+                workflows=dict(self._workflows),
+                governance=self._governance,
+                **self._governance_rules(),
+            )
 
             self._loaded_at = datetime.utcnow()
             self._load_count += 1
 
-            print(f"[RegistryManager] Loaded all registries (count: {self._load_count})")
-            print(f"  - Agents: {len(self._agents)}")
-            print(f"  - Tools: {len(self._tools)}")
-            print(f"  - Models: {len(self._models)}")
-            print(f"  - Workflows: {len(self._workflows)}")
+            logger.info(
+                "Loaded all registries (count: %d): agents=%d, tools=%d, models=%d, workflows=%d",
+                self._load_count, len(self._agents), len(self._tools),
+                len(self._models), len(self._workflows),
+            )
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild the reverse indexes from the loaded registries."""
+        self._tool_to_agents.clear()
+        self._model_to_agents.clear()
+        self._agent_to_workflows.clear()
+
+        for agent in self._agents.values():
+            self._index_agent(agent)
+        for workflow in self._workflows.values():
+            self._index_workflow(workflow)
+
+    def _index_agent(self, agent: AgentMetadata) -> None:
+        """Add an agent's tool and model references to the reverse indexes."""
+        for tool_id in agent.allowed_tools or []:
+            self._tool_to_agents[tool_id].add(agent.agent_id)
+        self._model_to_agents[agent.model_profile_id].add(agent.agent_id)
+
+    def _unindex_agent(self, agent: AgentMetadata) -> None:
+        """Remove an agent's tool and model references from the reverse indexes."""
+        for tool_id in agent.allowed_tools or []:
+            _discard_reference(self._tool_to_agents, tool_id, agent.agent_id)
+        _discard_reference(self._model_to_agents, agent.model_profile_id, agent.agent_id)
+
+    def _index_workflow(self, workflow: WorkflowDefinition) -> None:
+        """Add a workflow's required agents to the reverse index."""
+        for agent_id in workflow.required_agents or []:
+            self._agent_to_workflows[agent_id].add(workflow.workflow_id)
+
+    def _unindex_workflow(self, workflow: WorkflowDefinition) -> None:
+        """Remove a workflow's required agents from the reverse index."""
+        for agent_id in workflow.required_agents or []:
+            _discard_reference(self._agent_to_workflows, agent_id, workflow.workflow_id)
+
+    def _build_entry(self, model_cls: Type[ModelT], data: Dict[str, Any]) -> ModelT:
+        """Build a registry entry from file data (unvalidated if trusted)."""
+        if self.trusted:
+            return model_cls.model_construct(**data)
+        return model_cls(**data)
+
+    def _record_write(self) -> None:
+        """
+        Update load metadata after a CRUD write.
+
+        Writers update the in-memory caches before writing to disk, so the
+        caches are authoritative and a full load_all() is unnecessary. Use
+        reload_registries() to pick up changes made outside this process.
+        """
+        self._loaded_at = datetime.utcnow()
+        self._load_count += 1
 
     def _load_agents(self) -> None:
         """Load agent registry with validation."""
         registry_file = self.registries_path / "agent_registry.json"
 
-        with open(registry_file, "r") as f:
-            data = json.load(f)
+        data = _read_json(registry_file)
 
         self._agents.clear()
-        for agent_data in data["agents"]:
+        self._agent_json.clear()
+        for agent_data in _drain(data["agents"]):
             try:
-                agent = AgentMetadata(**agent_data)
+                agent = self._build_entry(AgentMetadata, agent_data)
                 self._agents[agent.agent_id] = agent
             except ValidationError as e:
-                print(f"[RegistryManager] WARNING: Invalid agent entry: {agent_data.get('agent_id')}")
-                print(f"  Error: {e}")
+                logger.warning("Invalid agent entry: %s\n  Error: %s", agent_data.get("agent_id"), e)
                 # In production: log error, skip entry, continue
 
     def _load_tools(self) -> None:
         """Load tool registry with validation."""
         registry_file = self.registries_path / "tool_registry.json"
 
-        with open(registry_file, "r") as f:
-            data = json.load(f)
+        data = _read_json(registry_file)
 
         self._tools.clear()
-        for tool_data in data["tools"]:
+        self._tool_json.clear()
+        for tool_data in _drain(data["tools"]):
             try:
-                tool = ToolMetadata(**tool_data)
+                tool = self._build_entry(ToolMetadata, tool_data)
                 self._tools[tool.tool_id] = tool
             except ValidationError as e:
-                print(f"[RegistryManager] WARNING: Invalid tool entry: {tool_data.get('tool_id')}")
+                logger.warning("Invalid tool entry: %s", tool_data.get("tool_id"))
 
     def _load_models(self) -> None:
         """Load model profiles."""
         registry_file = self.registries_path / "model_profiles.json"
 
-        with open(registry_file, "r") as f:
-            data = json.load(f)
+        data = _read_json(registry_file)
 
         self._models.clear()
-        for model_data in data["profiles"]:
+        self._model_json.clear()
+        for model_data in _drain(data["profiles"]):
             try:
-                model = ModelProfile(**model_data)
+                model = self._build_entry(ModelProfile, model_data)
                 self._models[model.profile_id] = model
             except ValidationError as e:
-                print(f"[RegistryManager] WARNING: Invalid model profile: {model_data.get('profile_id')}")
+                logger.warning("Invalid model profile: %s", model_data.get("profile_id"))
 
     def _load_workflows(self) -> None:
         """Load workflow definitions."""
         workflows_dir = self.registries_path / "workflows"
 
         self._workflows.clear()
+        workflow_files = {}
         for workflow_file in workflows_dir.glob("*.json"):
-            with open(workflow_file, "r") as f:
-                data = json.load(f)
+            stat = workflow_file.stat()
+            signature = (stat.st_mtime_ns, stat.st_size)
+
+            # Reuse the validated workflow if the file hasn't changed
+            cached = self._workflow_files.get(workflow_file)
+            if cached is not None and cached[0] == signature:
+                workflow = cached[1]
+            else:
+                data = _read_json(workflow_file)
+
+                try:
+                    workflow = self._build_entry(WorkflowDefinition, data)
+                except ValidationError as e:
+                    logger.warning("Invalid workflow: %s", workflow_file.name)
+                    continue
 
-            try:
-                workflow = WorkflowDefinition(**data)
-                self._workflows[workflow.workflow_id] = workflow
-            except ValidationError as e:
-                print(f"[RegistryManager] WARNING: Invalid workflow: {workflow_file.name}")
+            self._workflows[workflow.workflow_id] = workflow
+            workflow_files[workflow_file] = (signature, workflow)
+
+        # Drop entries for deleted files
+        self._workflow_files = workflow_files
 
     def _load_governance(self) -> None:
         """Load governance policies."""
         governance_file = self.registries_path / "governance_policies.json"
 
-        with open(governance_file, "r") as f:
-            data = json.load(f)
+        data = _read_json(governance_file)
 
         try:
-            self._governance = GovernancePolicies(**data)
+            self._governance = self._build_entry(GovernancePolicies, data)
         except ValidationError as e:
-            print(f"[RegistryManager] WARNING: Invalid governance policies")
+            logger.warning("Invalid governance policies")
             self._governance = None
 
+    def _governance_rules(self) -> Dict[str, Dict[str, Dict[str, bool]]]:
+        """Snapshot fields indexing the current governance access rules."""
+        policies = self._governance.policies if self._governance else {}
+        return {
+            "invocation_rules": _index_access_rules(
+                policies.get("agent_invocation_access", {}), "allowed_agents", "denied_agents"
+            ),
+            "tool_access_rules": _index_access_rules(
+                policies.get("agent_tool_access", {}), "allowed_tools", "denied_tools"
+            ),
+        }
+
+    def _publish(self, **changes: Any) -> None:
+        """Publish a new read snapshot with the given fields replaced (lock held)."""
+        self._snapshot = replace(self._snapshot, **changes)
+
     # ============= Agent Queries =============
 
     def get_agent(self, agent_id: str) -> Optional[AgentMetadata]:
         """Get agent metadata by ID (O(1) lookup)."""
-        with self._lock:
-            return self._agents.get(agent_id)
+        return self._snapshot.agents.get(agent_id)
 
     def list_agents(self, capability: Optional[str] = None) -> List[AgentMetadata]:
         """
@@ -221,13 +514,20 @@ class RegistryManager:
 
         Demonstrates: Dynamic discovery for agent selection.
         """
-        with self._lock:
-            agents = list(self._agents.values())
+        agents = self._snapshot.agents
+        if not capability:
+            return list(agents.values())
 
-            if capability:
-                agents = [a for a in agents if capability in a.capabilities]
+        cached = self._agents_by_capability
+        if cached is None or cached[0] is not agents:
+            by_capability = defaultdict(list)
+            for agent in agents.values():
+                for agent_capability in dict.fromkeys(agent.capabilities):
+                    by_capability[agent_capability].append(agent)
+            cached = (agents, by_capability)
+            self._agents_by_capability = cached
 
-            return agents
+        return list(cached[1].get(capability, ()))
 
     def get_agents_for_orchestrator(self) -> List[AgentMetadata]:
         """
@@ -235,23 +535,29 @@ class RegistryManager:
 
         Demonstrates: Governance-aware discovery.
         """
-        orchestrator = self.get_agent("orchestrator_agent")
-        if not orchestrator or not orchestrator.allowed_agents:
-            return []
-
-        with self._lock:
-            return [
-                self._agents[agent_id]
-                for agent_id in orchestrator.allowed_agents
-                if agent_id in self._agents
-            ]
+        agents = self._snapshot.agents
+
+        cached = self._orchestrator_agents
+        if cached is None or cached[0] is not agents:
+            orchestrator = agents.get("orchestrator_agent")
+            if not orchestrator or not orchestrator.allowed_agents:
+                result = []
+            else:
+                result = [
+                    agents[agent_id]
+                    for agent_id in orchestrator.allowed_agents
+                    if agent_id in agents
+                ]
+            cached = (agents, result)
+            self._orchestrator_agents = cached
+
+        return list(cached[1])
 
     # ============= Tool Queries =============
 
     def get_tool(self, tool_id: str) -> Optional[ToolMetadata]:
         """Get tool metadata by ID (O(1) lookup)."""
-        with self._lock:
-            return self._tools.get(tool_id)
+        return self._snapshot.tools.get(tool_id)
 
     def get_tools_for_agent(self, agent_id: str) -> List[ToolMetadata]:
         """
@@ -259,47 +565,62 @@ class RegistryManager:
 
         Demonstrates: Governance-aware tool discovery.
         """
-        agent = self.get_agent(agent_id)
+        snapshot = self._snapshot
+        agent = snapshot.agents.get(agent_id)
         if not agent:
             return []
 
-        with self._lock:
-            return [
-                self._tools[tool_id]
+        tools = snapshot.tools
+        cached = self._tools_for_agent
+        if cached is None or cached[0] is not snapshot.agents or cached[1] is not tools:
+            cached = (snapshot.agents, tools, {})
+            self._tools_for_agent = cached
+
+        agent_tools = cached[2].get(agent_id)
+        if agent_tools is None:
+            agent_tools = [
+                tools[tool_id]
                 for tool_id in agent.allowed_tools
-                if tool_id in self._tools
+                if tool_id in tools
             ]
+            cached[2][agent_id] = agent_tools
+
+        return list(agent_tools)
 
     def list_tools(self, tag: Optional[str] = None) -> List[ToolMetadata]:
         """List all tools, optionally filtered by lineage tag."""
-        with self._lock:
-            tools = list(self._tools.values())
+        tools = self._snapshot.tools
+        if not tag:
+            return list(tools.values())
 
-            if tag:
-                tools = [t for t in tools if tag in t.lineage_tags]
+        cached = self._tools_by_tag
+        if cached is None or cached[0] is not tools:
+            by_tag = defaultdict(list)
+            for tool in tools.values():
+                for tool_tag in dict.fromkeys(tool.lineage_tags):
+                    by_tag[tool_tag].append(tool)
+            cached = (tools, by_tag)
+            self._tools_by_tag = cached
 
-            return tools
+        return list(cached[1].get(tag, ()))
 
     # ============= Model Queries =============
 
     def get_model_profile(self, profile_id: str) -> Optional[ModelProfile]:
         """Get model profile by ID."""
-        with self._lock:
-            return self._models.get(profile_id)
+        return self._snapshot.models.get(profile_id)
 
     # ============= Workflow Queries =============
 
     def get_workflow(self, workflow_id: str) -> Optional[WorkflowDefinition]:
         """Get workflow definition by ID."""
-        with self._lock:
-            return self._workflows.get(workflow_id)
+        return self._snapshot.workflows.get(workflow_id)
 
     # ============= Governance Queries =============
 
     def get_governance_policies(self) -> Optional[GovernancePolicies]:
         """Get governance policies."""
-        with self._lock:
-            return self._governance
+        return self._snapshot.governance
 
     def is_agent_invocation_allowed(self, invoker_agent_id: str, target_agent_id: str) -> bool:
         """
@@ -307,23 +628,12 @@ class RegistryManager:
 
         Demonstrates: Runtime governance enforcement.
         """
-        if not self._governance:
+        snapshot = self._snapshot
+        if not snapshot.governance:
             return True  # Permissive if no policies loaded
 
-        policy = self._governance.policies.get("agent_invocation_access", {})
-        rules = policy.get("rules", [])
-
-        for rule in rules:
-            if rule.get("agent_id") == invoker_agent_id:
-                allowed = rule.get("allowed_agents", [])
-                denied = rule.get("denied_agents", [])
-
-                if target_agent_id in denied:
-                    return False
-                if target_agent_id in allowed:
-                    return True
-
-        return False  # Deny by default if not explicitly allowed
+        # Deny by default if not explicitly allowed
+        return snapshot.invocation_rules.get(invoker_agent_id, {}).get(target_agent_id, False)
 
     def is_tool_access_allowed(self, agent_id: str, tool_id: str) -> bool:
         """
@@ -331,23 +641,11 @@ class RegistryManager:
 
         Demonstrates: Runtime governance enforcement.
         """
-        if not self._governance:
+        snapshot = self._snapshot
+        if not snapshot.governance:
             return True
 
-        policy = self._governance.policies.get("agent_tool_access", {})
-        rules = policy.get("rules", [])
-
-        for rule in rules:
-            if rule.get("agent_id") == agent_id:
-                allowed = rule.get("allowed_tools", [])
-                denied = rule.get("denied_tools", [])
-
-                if tool_id in denied:
-                    return False
-                if tool_id in allowed:
-                    return True
-
-        return False
+        return snapshot.tool_access_rules.get(agent_id, {}).get(tool_id, False)
 
     # ============= Agent CRUD Operations =============
 
@@ -373,14 +671,16 @@ class RegistryManager:
 
             # Update in-memory cache
             self._agents[agent.agent_id] = agent
+            self._index_agent(agent)
+            self._publish(agents=dict(self._agents))
 
             # Write to disk atomically
-            self._write_agent_registry()
+            self._mark_dirty("agents")
 
-            # Hot reload to ensure consistency
-            self.load_all()
+            # Cache is already current - no need to reload from disk
+            self._record_write()
 
-            print(f"[RegistryManager] Created agent: {agent.agent_id}")
+            logger.info("Created agent: %s", agent.agent_id)
 
     def update_agent(self, agent_id: str, agent: AgentMetadata) -> None:
         """
@@ -404,15 +704,18 @@ class RegistryManager:
             self._validate_agent_references(agent)
 
             # Update cache
+            self._unindex_agent(self._agents[agent_id])
             self._agents[agent_id] = agent
+            self._index_agent(agent)
+            self._publish(agents=dict(self._agents))
+            self._agent_json.pop(agent_id, None)
 
             # Write to disk
-            self._write_agent_registry()
+            self._mark_dirty("agents")
 
-            # Hot reload
-            self.load_all()
+            self._record_write()
 
-            print(f"[RegistryManager] Updated agent: {agent_id}")
+            logger.info("Updated agent: %s", agent_id)
 
     def delete_agent(self, agent_id: str) -> None:
         """
@@ -438,15 +741,16 @@ class RegistryManager:
             self._check_agent_usage(agent_id)
 
             # Delete from cache
-            del self._agents[agent_id]
+            self._unindex_agent(self._agents.pop(agent_id))
+            self._publish(agents=dict(self._agents))
+            self._agent_json.pop(agent_id, None)
 
             # Write to disk
-            self._write_agent_registry()
+            self._mark_dirty("agents")
 
-            # Hot reload
-            self.load_all()
+            self._record_write()
 
-            print(f"[RegistryManager] Deleted agent: {agent_id}")
+            logger.info("Deleted agent: %s", agent_id)
 
     # ============= Tool CRUD Operations =============
 
@@ -461,10 +765,11 @@ class RegistryManager:
             self._validate_json_schema(tool.output_schema)
 
             self._tools[tool.tool_id] = tool
-            self._write_tool_registry()
-            self.load_all()
+            self._publish(tools=dict(self._tools))
+            self._mark_dirty("tools")
+            self._record_write()
 
-            print(f"[RegistryManager] Created tool: {tool.tool_id}")
+            logger.info("Created tool: %s", tool.tool_id)
 
     def update_tool(self, tool_id: str, tool: ToolMetadata) -> None:
         """Update existing tool."""
@@ -479,10 +784,12 @@ class RegistryManager:
             self._validate_json_schema(tool.output_schema)
 
             self._tools[tool_id] = tool
-            self._write_tool_registry()
-            self.load_all()
+            self._tool_json.pop(tool_id, None)
+            self._publish(tools=dict(self._tools))
+            self._mark_dirty("tools")
+            self._record_write()
 
-            print(f"[RegistryManager] Updated tool: {tool_id}")
+            logger.info("Updated tool: %s", tool_id)
 
     def delete_tool(self, tool_id: str) -> None:
         """Delete tool after usage checks."""
@@ -493,10 +800,12 @@ class RegistryManager:
             self._check_tool_usage(tool_id)
 
             del self._tools[tool_id]
-            self._write_tool_registry()
-            self.load_all()
+            self._tool_json.pop(tool_id, None)
+            self._publish(tools=dict(self._tools))
+            self._mark_dirty("tools")
+            self._record_write()
 
-            print(f"[RegistryManager] Deleted tool: {tool_id}")
+            logger.info("Deleted tool: %s", tool_id)
 
     # ============= Model Profile CRUD Operations =============
 
@@ -507,10 +816,11 @@ class RegistryManager:
                 raise ValueError(f"Model profile '{profile.profile_id}' already exists")
 
             self._models[profile.profile_id] = profile
-            self._write_model_registry()
-            self.load_all()
+            self._publish(models=dict(self._models))
+            self._mark_dirty("models")
+            self._record_write()
 
-            print(f"[RegistryManager] Created model profile: {profile.profile_id}")
+            logger.info("Created model profile: %s", profile.profile_id)
 
     def update_model_profile(self, profile_id: str, profile: ModelProfile) -> None:
         """Update existing model profile."""
@@ -522,10 +832,12 @@ class RegistryManager:
                 raise ValueError(f"Profile ID mismatch: '{profile_id}' != '{profile.profile_id}'")
 
             self._models[profile_id] = profile
-            self._write_model_registry()
-            self.load_all()
+            self._model_json.pop(profile_id, None)
+            self._publish(models=dict(self._models))
+            self._mark_dirty("models")
+            self._record_write()
 
-            print(f"[RegistryManager] Updated model profile: {profile_id}")
+            logger.info("Updated model profile: %s", profile_id)
 
     def delete_model_profile(self, profile_id: str) -> None:
         """Delete model profile after usage checks."""
@@ -536,10 +848,12 @@ class RegistryManager:
             self._check_model_usage(profile_id)
 
             del self._models[profile_id]
-            self._write_model_registry()
-            self.load_all()
+            self._model_json.pop(profile_id, None)
+            self._publish(models=dict(self._models))
+            self._mark_dirty("models")
+            self._record_write()
 
-            print(f"[RegistryManager] Deleted model profile: {profile_id}")
+            logger.info("Deleted model profile: %s", profile_id)
 
     # ============= Workflow CRUD Operations =============
 
@@ -550,15 +864,15 @@ class RegistryManager:
                 raise ValueError(f"Workflow '{workflow.workflow_id}' already exists")
 
             # Validate referenced agents exist
-            for agent_id in workflow.required_agents or []:
-                if agent_id not in self._agents:
-                    raise ValueError(f"Required agent '{agent_id}' not found")
+            self._validate_workflow_references(workflow)
 
             self._workflows[workflow.workflow_id] = workflow
+            self._index_workflow(workflow)
+            self._publish(workflows=dict(self._workflows))
             self._write_workflow_registry(workflow)
-            self.load_all()
+            self._record_write()
 
-            print(f"[RegistryManager] Created workflow: {workflow.workflow_id}")
+            logger.info("Created workflow: %s", workflow.workflow_id)
 
     def update_workflow(self, workflow_id: str, workflow: WorkflowDefinition) -> None:
         """Update existing workflow."""
@@ -569,15 +883,16 @@ class RegistryManager:
             if workflow.workflow_id != workflow_id:
                 raise ValueError(f"Workflow ID mismatch: '{workflow_id}' != '{workflow.workflow_id}'")
 
-            for agent_id in workflow.required_agents or []:
-                if agent_id not in self._agents:
-                    raise ValueError(f"Required agent '{agent_id}' not found")
+            self._validate_workflow_references(workflow)
 
+            self._unindex_workflow(self._workflows[workflow_id])
             self._workflows[workflow_id] = workflow
+            self._index_workflow(workflow)
+            self._publish(workflows=dict(self._workflows))
             self._write_workflow_registry(workflow)
-            self.load_all()
+            self._record_write()
 
-            print(f"[RegistryManager] Updated workflow: {workflow_id}")
+            logger.info("Updated workflow: %s", workflow_id)
 
     def delete_workflow(self, workflow_id: str) -> None:
         """Delete workflow."""
@@ -585,17 +900,18 @@ class RegistryManager:
             if workflow_id not in self._workflows:
                 raise ValueError(f"Workflow '{workflow_id}' not found")
 
-            workflow = self._workflows[workflow_id]
-            del self._workflows[workflow_id]
+            workflow = self._workflows.pop(workflow_id)
+            self._unindex_workflow(workflow)
+            self._publish(workflows=dict(self._workflows))
 
             # Delete file
             workflow_file = self.registries_path / "workflows" / f"{workflow_id}.json"
             if workflow_file.exists():
                 workflow_file.unlink()
 
-            self.load_all()
+            self._record_write()
 
-            print(f"[RegistryManager] Deleted workflow: {workflow_id}")
+            logger.info("Deleted workflow: %s", workflow_id)
 
     # ============= Governance Update Operations =============
 
@@ -603,10 +919,11 @@ class RegistryManager:
         """Update governance policies (no create/delete - single document)."""
         with self._lock:
             self._governance = policies
-            self._write_governance_policies()
-            self.load_all()
+            self._publish(governance=policies, **self._governance_rules())
+            self._mark_dirty("governance")
+            self._record_write()
 
-            print("[RegistryManager] Updated governance policies")
+            logger.info("Updated governance policies")
 
     def get_system_config(self) -> Dict[str, Any]:
         """Get current system configuration."""
@@ -614,24 +931,21 @@ class RegistryManager:
         if not config_file.exists():
             raise FileNotFoundError(f"System config not found at {config_file}")
 
-        with open(config_file, 'r') as f:
-            return json.load(f)
+        return _read_json(config_file)
 
     def update_system_config(self, config: Dict[str, Any]) -> None:
         """Update system configuration."""
         with self._lock:
             self._write_system_config(config)
-            print("[RegistryManager] Updated system configuration")
+            logger.info("Updated system configuration")
 
     def list_model_profiles(self) -> List[ModelProfile]:
         """List all model profiles."""
-        with self._lock:
-            return list(self._models.values())
+        return list(self._snapshot.models.values())
 
     def list_workflows(self) -> List[WorkflowDefinition]:
         """List all workflows."""
-        with self._lock:
-            return list(self._workflows.values())
+        return list(self._snapshot.workflows.values())
 
     # ============= Validation Helper Methods =============
 
@@ -661,6 +975,17 @@ class RegistryManager:
                     f"Available tools: {list(self._tools.keys())}"
                 )
 
+    def _validate_workflow_references(self, workflow: WorkflowDefinition):
+        """
+        Validate that all of a workflow's required agents exist.
+
+        Raises:
+            ValueError: Listing every missing agent
+        """
+        missing = set(workflow.required_agents or ()).difference(self._agents)
+        if missing:
+            raise ValueError(f"Required agents not found: {sorted(missing)}")
+
     def _validate_json_schema(self, schema: Dict[str, Any]):
         """
         Validate that a dictionary is a well-formed JSON Schema.
@@ -670,14 +995,15 @@ class RegistryManager:
         Raises:
             ValueError: If schema is malformed
         """
-        try:
-            import jsonschema
-            jsonschema.Draft7Validator.check_schema(schema)
-        except jsonschema.exceptions.SchemaError as e:
-            raise ValueError(f"Invalid JSON schema: {str(e)}")
-        except ImportError:
+        if _SCHEMA_META_VALIDATOR is None:
             # jsonschema not installed - skip validation
-            print("[RegistryManager] WARNING: jsonschema not installed, skipping schema validation")
+            logger.warning("jsonschema not installed, skipping schema validation")
+            return
+
+        # First error, as Draft7Validator.check_schema() reports it
+        error = next(_SCHEMA_META_VALIDATOR.iter_errors(schema), None)
+        if error is not None:
+            raise ValueError(f"Invalid JSON schema: {str(SchemaError.create_from(error))}")
 
     def _check_agent_usage(self, agent_id: str):
         """
@@ -699,12 +1025,14 @@ class RegistryManager:
             )
 
         # Check workflows
-        for workflow in self._workflows.values():
-            if agent_id in (workflow.required_agents or []):
-                raise ValueError(
-                    f"Cannot delete agent '{agent_id}': "
-                    f"required by workflow '{workflow.workflow_id}'"
-                )
+        using_workflows = self._agent_to_workflows.get(agent_id)
+        if using_workflows:
+            # Report the first one in registry order
+            workflow_id = next(w for w in self._workflows if w in using_workflows)
+            raise ValueError(
+                f"Cannot delete agent '{agent_id}': "
+                f"required by workflow '{workflow_id}'"
+            )
 
     def _check_tool_usage(self, tool_id: str):
         """
@@ -713,12 +1041,10 @@ class RegistryManager:
         Raises:
             ValueError: If tool is in use
         """
-        using_agents = []
-        for agent in self._agents.values():
-            if tool_id in (agent.allowed_tools or []):
-                using_agents.append(agent.agent_id)
-
+        using_agents = self._tool_to_agents.get(tool_id)
         if using_agents:
+            # Report in registry order
+            using_agents = [a for a in self._agents if a in using_agents]
             raise ValueError(
                 f"Cannot delete tool '{tool_id}': "
                 f"used by agents: {', '.join(using_agents)}"
@@ -731,12 +1057,10 @@ class RegistryManager:
         Raises:
             ValueError: If model is in use
         """
-        using_agents = []
-        for agent in self._agents.values():
-            if agent.model_profile_id == profile_id:
-                using_agents.append(agent.agent_id)
-
+        using_agents = self._model_to_agents.get(profile_id)
         if using_agents:
+            # Report in registry order
+            using_agents = [a for a in self._agents if a in using_agents]
             raise ValueError(
                 f"Cannot delete model profile '{profile_id}': "
                 f"used by agents: {', '.join(using_agents)}"
@@ -744,6 +1068,35 @@ class RegistryManager:
 
     # ============= Atomic File Writing Methods =============
 
+    def _mark_dirty(self, registry: str) -> None:
+        """
+        Write a changed registry file before the CRUD call returns (lock held).
+        """
+        self._dirty.add(registry)
+        self.flush()
+
+    def flush(self) -> None:
+        """
+        Write registries with pending changes to disk now.
+
+        CRUD calls write before returning; this retries writes that failed.
+        """
+        writers = {
+            "agents": self._write_agent_registry,
+            "tools": self._write_tool_registry,
+            "models": self._write_model_registry,
+            "governance": self._write_governance_policies,
+        }
+
+        with self._lock:
+            while self._dirty:
+                registry = self._dirty.pop()
+                try:
+                    writers[registry]()
+                except Exception:
+                    self._dirty.add(registry)  # Retry on the next flush
+                    raise
+
     def _write_agent_registry(self):
         """
         Write agent registry to disk atomically.
@@ -751,77 +1104,39 @@ class RegistryManager:
         Uses temp file + rename pattern for atomicity.
         Prevents corruption if process crashes during write.
         """
-        import tempfile
-        import os
-
         registry_file = self.registries_path / "agent_registry.json"
 
         data = {
             "version": "1.0.0",
-            "last_updated": datetime.utcnow().isoformat() + "Z",
-            "agents": [agent.model_dump() for agent in self._agents.values()]
+            "last_updated": utc_timestamp(),
+            "agents": _cached_entries(self._agents, self._agent_json)
         }
 
-        # Write to temporary file first
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            dir=registry_file.parent,
-            delete=False,
-            suffix='.json'
-        ) as tmp:
-            json.dump(data, tmp, indent=2)
-            tmp_path = tmp.name
-
-        # Atomic rename (POSIX systems)
-        os.rename(tmp_path, registry_file)
+        _atomic_write_bytes(registry_file, _dumps_registry(data, "agents"))
 
     def _write_tool_registry(self):
         """Write tool registry atomically."""
-        import tempfile
-        import os
-
         registry_file = self.registries_path / "tool_registry.json"
 
         data = {
             "version": "1.0.0",
-            "last_updated": datetime.utcnow().isoformat() + "Z",
-            "tools": [tool.model_dump() for tool in self._tools.values()]
+            "last_updated": utc_timestamp(),
+            "tools": _cached_entries(self._tools, self._tool_json)
         }
 
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            dir=registry_file.parent,
-            delete=False,
-            suffix='.json'
-        ) as tmp:
-            json.dump(data, tmp, indent=2)
-            tmp_path = tmp.name
-
-        os.rename(tmp_path, registry_file)
+        _atomic_write_bytes(registry_file, _dumps_registry(data, "tools"))
 
     def _write_model_registry(self):
         """Write model profiles registry atomically."""
-        import tempfile
-        import os
-
         registry_file = self.registries_path / "model_profiles.json"
 
         data = {
             "version": "1.0.0",
-            "last_updated": datetime.utcnow().isoformat() + "Z",
-            "profiles": [model.model_dump() for model in self._models.values()]
+            "last_updated": utc_timestamp(),
+            "profiles": _cached_entries(self._models, self._model_json)
         }
 
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            dir=registry_file.parent,
-            delete=False,
-            suffix='.json'
-        ) as tmp:
-            json.dump(data, tmp, indent=2)
-            tmp_path = tmp.name
-
-        os.rename(tmp_path, registry_file)
+        _atomic_write_bytes(registry_file, _dumps_registry(data, "profiles"))
 
     def _write_workflow_registry(self, workflow: WorkflowDefinition):
         """
@@ -829,93 +1144,62 @@ class RegistryManager:
 
         Note: Workflows are stored as individual files in workflows/ directory.
         """
-        import tempfile
-        import os
-
         workflows_dir = self.registries_path / "workflows"
         workflows_dir.mkdir(exist_ok=True)
 
         workflow_file = workflows_dir / f"{workflow.workflow_id}.json"
 
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            dir=workflows_dir,
-            delete=False,
-            suffix='.json'
-        ) as tmp:
-            json.dump(workflow.model_dump(), tmp, indent=2)
-            tmp_path = tmp.name
+        _atomic_write_bytes(workflow_file, _dumps_json(workflow.model_dump()))
 
-        os.rename(tmp_path, workflow_file)
+        # Record the written file so the next load can't pick up a stale
+        # entry for a same-size rewrite within the mtime granularity
+        stat = workflow_file.stat()
+        self._workflow_files[workflow_file] = ((stat.st_mtime_ns, stat.st_size), workflow)
 
     def _write_governance_policies(self):
         """Write governance policies atomically."""
-        import tempfile
-        import os
-
         governance_file = self.registries_path / "governance_policies.json"
 
         if not self._governance:
             return
 
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            dir=governance_file.parent,
-            delete=False,
-            suffix='.json'
-        ) as tmp:
-            json.dump(self._governance.model_dump(), tmp, indent=2)
-            tmp_path = tmp.name
-
-        os.rename(tmp_path, governance_file)
+        _atomic_write_bytes(governance_file, _dumps_json(self._governance.model_dump()))
 
     def _write_system_config(self, config: Dict[str, Any]):
         """Write system configuration atomically."""
-        import tempfile
-        import os
-        from datetime import datetime
-
         config_file = self.registries_path / "system_config.json"
 
         # Update last_updated timestamp
-        config["last_updated"] = datetime.utcnow().isoformat() + "Z"
-
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            dir=config_file.parent,
-            delete=False,
-            suffix='.json'
-        ) as tmp:
-            json.dump(config, tmp, indent=2)
-            tmp_path = tmp.name
+        config["last_updated"] = utc_timestamp()
 
-        os.rename(tmp_path, config_file)
+        _atomic_write_bytes(config_file, _dumps_json(config))
 
     # ============= Metadata =============
 
     def get_stats(self) -> Dict[str, Any]:
         """Get registry statistics (for observability)."""
-        with self._lock:
-            return {
-                "loaded_at": self._loaded_at.isoformat() if self._loaded_at else None,
-                "load_count": self._load_count,
-                "counts": {
-                    "agents": len(self._agents),
-                    "tools": len(self._tools),
-                    "models": len(self._models),
-                    "workflows": len(self._workflows)
-                }
+        snapshot = self._snapshot
+        loaded_at = self._loaded_at
+        return {
+            "loaded_at": loaded_at.isoformat() if loaded_at else None,
+            "load_count": self._load_count,
+            "counts": {
+                "agents": len(snapshot.agents),
+                "tools": len(snapshot.tools),
+                "models": len(snapshot.models),
+                "workflows": len(snapshot.workflows)
             }
+        }
 
 
 # Singleton instance
 _registry_manager: Optional[RegistryManager] = None
 
 
-def init_registry_manager(registries_path: str = "/registries"):
+def init_registry_manager(registries_path: str = "/registries", trusted: bool = False):
     """Initialize registry manager singleton."""
     global _registry_manager
-    _registry_manager = RegistryManager(registries_path)
+    _registry_manager = RegistryManager(registries_path, trusted=trusted)
     _registry_manager.load_all()
 
 
@@ -13,6 +13,7 @@ import re
 from typing import Dict, Any, Optional, Tuple
 from pydantic import ValidationError
 
+from . import json_utils
 from ..services.agent_react_loop import AgentReasoning, AgentAction, ActionType, ToolRequest
 from ..services.orchestrator_runner import (
     OrchestratorReasoning,
@@ -22,11 +23,52 @@ from ..services.orchestrator_runner import (
 )
 
 
+# JSON object inside a markdown code block (``` or ```json)
+_JSON_BLOCK_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+
+# Characters that matter when scanning for the end of a JSON object
+_JSON_SCAN_RE = re.compile(r'[{}"\\]')
+
+
 class ResponseParseError(Exception):
     """Custom exception for response parsing errors."""
     pass
 
 
+def _scan_json_object(content: str, start: int) -> Optional[str]:
+    """
+    Return the balanced {...} object starting at content[start].
+
+    Single linear pass over braces and quotes (braces inside strings are
+    ignored); returns None if the object is never closed.
+    """
+    depth = 0
+    in_string = False
+    escaped_until = -1
+
+    for match in _JSON_SCAN_RE.finditer(content, start):
+        pos = match.start()
+        if pos < escaped_until:
+            continue  # Character escaped by a preceding backslash
+
+        char = match.group()
+        if in_string:
+            if char == "\\":
+                escaped_until = pos + 2
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return content[start:pos + 1]
+
+    return None
+
+
 def extract_json_from_response(content: str) -> str:
     """
     Extract JSON from LLM response.
@@ -36,16 +78,21 @@ def extract_json_from_response(content: str) -> str:
     Demonstrates: Robust parsing with multiple extraction strategies.
     """
     # Strategy 1: Try to find JSON in markdown code block
-    json_block_pattern = r'```(?:json)?\s*(\{.*?\})\s*```'
-    match = re.search(json_block_pattern, content, re.DOTALL)
+    match = _JSON_BLOCK_RE.search(content)
     if match:
         return match.group(1)
 
     # Strategy 2: Try to find JSON object directly
-    json_object_pattern = r'\{.*\}'
-    match = re.search(json_object_pattern, content, re.DOTALL)
-    if match:
-        return match.group(0)
+    start = content.find("{")
+    if start != -1:
+        json_object = _scan_json_object(content, start)
+        if json_object is not None:
+            return json_object
+
+        # Unbalanced - fall back to first "{" through last "}"
+        end = content.rfind("}")
+        if end > start:
+            return content[start:end + 1]
 
     # Strategy 3: Content itself might be JSON
     return content.strip()
@@ -75,7 +122,7 @@ def parse_worker_agent_response(
         json_str = extract_json_from_response(response_content)
 
         # Parse JSON
-        data = json.loads(json_str)
+        data = json_utils.loads(json_str)
 
         # Validate required fields
         if "reasoning" not in data:
@@ -171,7 +218,7 @@ def parse_orchestrator_response(
         json_str = extract_json_from_response(response_content)
 
         # Parse JSON
-        data = json.loads(json_str)
+        data = json_utils.loads(json_str)
 
         # Validate required fields
         if "reasoning" not in data:
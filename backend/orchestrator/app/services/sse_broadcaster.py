@@ -10,14 +10,23 @@ Demonstrates scalability patterns:
 """
 
 import asyncio
-import json
+import itertools
 import logging
+import time
 from typing import Dict, List, AsyncGenerator, Optional
 from collections import deque
-from datetime import datetime
+
+from . import json_utils
+from .storage import utc_timestamp
 
 logger = logging.getLogger(__name__)
 
+# Event IDs are "<process start ns>_<zero-padded counter>" - they compare
+# in order as strings (subscribe() replays buffered events by "id >
+# last_event_id"), also across restarts, without per-event clock/uuid calls
+_EVENT_ID_PREFIX = str(time.time_ns())
+_event_id_counter = itertools.count(1)
+
 
 class SSEBroadcaster:
     """
@@ -137,7 +146,7 @@ class SSEBroadcaster:
             "id": event_id or self._generate_event_id(),
             "event": event_type,
             "data": event_data,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": utc_timestamp()
         }
 
         # Buffer event
@@ -195,7 +204,7 @@ class SSEBroadcaster:
             lines.append(f"event: {event['event']}")
 
         if "data" in event:
-            data_json = json.dumps(event["data"])
+            data_json = json_utils.dumps(event["data"]).decode()
             lines.append(f"data: {data_json}")
 
         lines.append("")  # Empty line signals end of event
@@ -203,11 +212,8 @@ class SSEBroadcaster:
         return "\n".join(lines) + "\n"
 
     def _generate_event_id(self) -> str:
-        """Generate unique event ID."""
-        import uuid
-        timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
-        unique_id = uuid.uuid4().hex[:8]
-        return f"{timestamp}_{unique_id}"
+        """Generate unique, monotonically increasing event ID."""
+        return f"{_EVENT_ID_PREFIX}_{next(_event_id_counter):012d}"
 
     def cleanup_session(self, session_id: str) -> None:
         """
@@ -5,18 +5,75 @@ Provides thread-safe append-only JSONL logging for session events
 and JSON artifact storage for Evidence Maps and other outputs.
 """
 
+import asyncio
 import json
+import logging
 import os
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import threading
 import fcntl
 
+from . import json_utils
+
+logger = logging.getLogger(__name__)
+
+# Worker cap for disk I/O handed off by the async (a*) methods
+STORAGE_IO_WORKERS = 4
+
+# Shared I/O pool for the async methods (created on first use)
+_io_pool: Optional[ThreadPoolExecutor] = None
+_io_pool_lock = threading.Lock()
+
+
+def _get_io_pool() -> ThreadPoolExecutor:
+    """Get the shared thread pool that keeps disk I/O off the event loop."""
+    global _io_pool
+    if _io_pool is None:
+        with _io_pool_lock:
+            if _io_pool is None:
+                _io_pool = ThreadPoolExecutor(
+                    max_workers=STORAGE_IO_WORKERS,
+                    thread_name_prefix="storage-io",
+                )
+    return _io_pool
+
+
+async def _run_io(func, *args):
+    """Run a blocking storage call on the I/O pool and await its result."""
+    return await asyncio.get_running_loop().run_in_executor(_get_io_pool(), func, *args)
+
+
+@lru_cache(maxsize=1)
+def _format_utc_seconds(epoch_seconds: int) -> str:
+    """Format whole epoch seconds as ISO-8601 (cached: consecutive events share a second)."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(epoch_seconds))
+
+
+def utc_timestamp() -> str:
+    """
+    Current UTC time as an ISO-8601 string with microseconds and "Z" suffix.
+
+    Cheaper than datetime.utcnow().isoformat() + "Z" for event timestamps.
+    """
+    now = time.time()
+    seconds = int(now)
+    return f"{_format_utc_seconds(seconds)}.{int((now - seconds) * 1_000_000):06d}Z"
+
 
 class SessionWriter:
     """Thread-safe JSONL writer for session event streams."""
 
+    # Group commit: buffered events are written (one write + fsync per
+    # session) at most this long after the first one is buffered...
+    GROUP_COMMIT_SECONDS = 0.02
+
+    # ...or straight away once a session has this many buffered
+    GROUP_COMMIT_MAX_EVENTS = 100
+
     def __init__(self, storage_path: str = "/storage"):
         self.storage_path = Path(storage_path)
         self.sessions_path = self.storage_path / "sessions"
@@ -24,6 +81,11 @@ class SessionWriter:
         self._locks = {}
         self._locks_lock = threading.Lock()
 
+        # Serialized event lines waiting for the next group commit
+        self._pending: Dict[str, List[bytes]] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+
     def _get_session_file(self, session_id: str) -> Path:
         """Get path to session JSONL file."""
         return self.sessions_path / f"{session_id}.jsonl"
@@ -35,34 +97,129 @@ class SessionWriter:
                 self._locks[session_id] = threading.Lock()
             return self._locks[session_id]
 
+    def _prepare_line(self, session_id: str, event: Dict[str, Any]) -> bytes:
+        """Stamp an event for the session and serialize it as a JSONL line."""
+        # Add timestamp if not present
+        if "timestamp" not in event:
+            event["timestamp"] = utc_timestamp()
+
+        # Add session_id to event
+        event["session_id"] = session_id
+
+        return json_utils.dumps(event, append_newline=True)
+
     def write_event(self, session_id: str, event: Dict[str, Any]) -> None:
         """
         Append event to session JSONL file (thread-safe).
 
+        The event is serialized immediately but written with the session's
+        next group commit, so a burst of events shares one write/fsync.
+        read_session() always sees it (without forcing a write); call
+        flush_sync() when it must be on disk before continuing.
+
         Args:
             session_id: Session identifier
             event: Event dictionary (will be serialized to JSON line)
         """
-        lock = self._get_lock(session_id)
-        session_file = self._get_session_file(session_id)
+        if self._buffer_event(session_id, event):
+            self.flush_sync(session_id)
 
-        # Add timestamp if not present
-        if "timestamp" not in event:
-            event["timestamp"] = datetime.utcnow().isoformat() + "Z"
+    async def awrite_event(self, session_id: str, event: Dict[str, Any]) -> None:
+        """
+        Async write_event for request handlers.
 
-        # Add session_id to event
-        event["session_id"] = session_id
+        Buffering is cheap and stays on the event loop; a group commit it
+        triggers runs on the I/O pool.
+        """
+        if self._buffer_event(session_id, event):
+            await _run_io(self.flush_sync, session_id)
 
-        with lock:
-            # Use file locking for additional safety across processes
-            with open(session_file, "a") as f:
-                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-                try:
-                    f.write(json.dumps(event) + "\n")
-                    f.flush()
-                    os.fsync(f.fileno())
-                finally:
-                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    def _buffer_event(self, session_id: str, event: Dict[str, Any]) -> bool:
+        """Buffer an event for the group commit; True if it's due now."""
+        line = self._prepare_line(session_id, event)
+
+        with self._pending_lock:
+            lines = self._pending.setdefault(session_id, [])
+            lines.append(line)
+
+            commit_now = len(lines) >= self.GROUP_COMMIT_MAX_EVENTS
+            if not commit_now and self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.GROUP_COMMIT_SECONDS, self.flush)
+                self._flush_timer.start()
+
+        return commit_now
+
+    def write_events_batch(self, session_id: str, events: List[Dict[str, Any]]) -> None:
+        """
+        Append several events to session JSONL file in one write (thread-safe).
+
+        Same per-event handling as write_event, but the lines (together with
+        any still buffered for the session) are written before returning,
+        with a single lock/write/fsync.
+
+        Args:
+            session_id: Session identifier
+            events: Event dictionaries, in order
+        """
+        if not events:
+            return
+
+        lines = [self._prepare_line(session_id, event) for event in events]
+
+        with self._pending_lock:
+            self._pending.setdefault(session_id, []).extend(lines)
+
+        self.flush_sync(session_id)
+
+    def flush_sync(self, session_id: str) -> None:
+        """
+        Write the session's buffered events now.
+
+        Args:
+            session_id: Session identifier
+        """
+        # Hold the session lock while taking the lines, so concurrent
+        # flushes of one session can't reorder its events
+        with self._get_lock(session_id):
+            with self._pending_lock:
+                lines = self._pending.pop(session_id, None)
+
+            if not lines:
+                return
+
+            try:
+                # Use file locking for additional safety across processes
+                with open(self._get_session_file(session_id), "ab") as f:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                    try:
+                        f.write(b"".join(lines))
+                        f.flush()
+                        os.fsync(f.fileno())
+                    finally:
+                        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            except Exception:
+                # Retry on the next flush, ahead of anything buffered since
+                with self._pending_lock:
+                    self._pending[session_id] = lines + self._pending.get(session_id, [])
+                raise
+
+    def flush(self) -> None:
+        """
+        Write all buffered events now.
+
+        Runs on the group commit timer; call on shutdown.
+        """
+        with self._pending_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            session_ids = list(self._pending)
+
+        for session_id in session_ids:
+            try:
+                self.flush_sync(session_id)
+            except Exception as e:
+                logger.error(f"Failed to write events for session {session_id}: {e}")
 
     def read_session(self, session_id: str) -> List[Dict[str, Any]]:
         """
@@ -76,30 +233,48 @@ class SessionWriter:
         """
         session_file = self._get_session_file(session_id)
 
-        if not session_file.exists():
+        # Read the file and the lines still waiting for their group commit
+        # under the session lock, so a concurrent flush can't move lines
+        # between the two in the meantime
+        with self._get_lock(session_id):
+            data = session_file.read_bytes() if session_file.exists() else b""
+            with self._pending_lock:
+                pending = list(self._pending.get(session_id, ()))
+
+        if not data and not pending:
             return []
 
         events = []
-        with open(session_file, "r") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        events.append(json.loads(line))
-                    except json.JSONDecodeError as e:
-                        # Log error but continue reading
-                        print(f"Error parsing JSONL line: {e}")
-                        continue
+        for line in data.splitlines() + pending:
+            line = line.strip()
+            if line:
+                try:
+                    events.append(json_utils.loads(line))
+                except json.JSONDecodeError as e:
+                    # Log error but continue reading
+                    print(f"Error parsing JSONL line: {e}")
+                    continue
 
         return events
 
+    async def aread_session(self, session_id: str) -> List[Dict[str, Any]]:
+        """Async read_session for request handlers (reads on the I/O pool)."""
+        return await _run_io(self.read_session, session_id)
+
     def session_exists(self, session_id: str) -> bool:
-        """Check if session file exists."""
+        """Check if session file exists (or has events waiting to be written)."""
+        with self._pending_lock:
+            if session_id in self._pending:
+                return True
         return self._get_session_file(session_id).exists()
 
     def list_sessions(self) -> List[str]:
         """List all session IDs."""
-        return [f.stem for f in self.sessions_path.glob("*.jsonl")]
+        session_ids = [f.stem for f in self.sessions_path.glob("*.jsonl")]
+        on_disk = set(session_ids)
+        with self._pending_lock:
+            session_ids.extend(sid for sid in self._pending if sid not in on_disk)
+        return session_ids
 
 
 class ArtifactStore:
@@ -126,12 +301,14 @@ class ArtifactStore:
         # Add metadata
         artifact_data = {
             "artifact_id": artifact_id,
-            "created_at": datetime.utcnow().isoformat() + "Z",
+            "created_at": utc_timestamp(),
             "data": data
         }
 
-        with open(artifact_file, "w") as f:
-            json.dump(artifact_data, f, indent=2)
+        # Compact, not indented - artifacts are machine-read (load_artifact)
+        # and indentation roughly doubles the size of large evidence maps
+        with open(artifact_file, "wb") as f:
+            f.write(json_utils.dumps(artifact_data, separators=(",", ":")))
 
         return str(artifact_file)
 
@@ -155,6 +332,14 @@ class ArtifactStore:
 
         return artifact_data.get("data")
 
+    async def asave_artifact(self, artifact_id: str, data: Dict[str, Any]) -> str:
+        """Async save_artifact (writes on the I/O pool)."""
+        return await _run_io(self.save_artifact, artifact_id, data)
+
+    async def aload_artifact(self, artifact_id: str) -> Optional[Dict[str, Any]]:
+        """Async load_artifact (reads on the I/O pool)."""
+        return await _run_io(self.load_artifact, artifact_id)
+
     def artifact_exists(self, artifact_id: str) -> bool:
         """Check if artifact exists."""
         return (self.artifacts_path / f"{artifact_id}.json").exists()
@@ -164,9 +349,48 @@ class ArtifactStore:
         return [f.stem for f in self.artifacts_path.glob("*.json")]
 
 
+class EventBatcher:
+    """
+    Thread-safe per-session buffer for events written in one batch.
+
+    Lets code on a hot path (e.g. context processors) defer event writes
+    until a natural boundary, where flush() writes them with a single
+    SessionWriter.write_events_batch call.
+    """
+
+    def __init__(self):
+        self._pending: Dict[str, List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def append(self, session_id: str, event: Dict[str, Any]) -> None:
+        """Buffer an event for the session's next flush."""
+        with self._lock:
+            self._pending.setdefault(session_id, []).append(event)
+
+    def flush(self, session_id: str) -> int:
+        """
+        Write the session's buffered events.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Number of events written
+        """
+        with self._lock:
+            events = self._pending.pop(session_id, None)
+
+        if not events:
+            return 0
+
+        get_session_writer().write_events_batch(session_id, events)
+        return len(events)
+
+
 # Singleton instances (initialized in main app)
 _session_writer: Optional[SessionWriter] = None
 _artifact_store: Optional[ArtifactStore] = None
+_event_batcher: Optional[EventBatcher] = None
 
 
 def init_storage(storage_path: str = "/storage"):
@@ -183,8 +407,21 @@ def get_session_writer() -> SessionWriter:
     return _session_writer
 
 
+def write_event(session_id: str, event: Dict[str, Any]) -> None:
+    """Append an event to a session log via the singleton SessionWriter."""
+    get_session_writer().write_event(session_id, event)
+
+
 def get_artifact_store() -> ArtifactStore:
     """Get singleton ArtifactStore instance."""
     if _artifact_store is None:
         raise RuntimeError("Storage not initialized. Call init_storage() first.")
     return _artifact_store
+
+
+def get_event_batcher() -> EventBatcher:
+    """Get singleton EventBatcher instance."""
+    global _event_batcher
+    if _event_batcher is None:
+        _event_batcher = EventBatcher()
+    return _event_batcher
@@ -157,7 +157,7 @@ class WorkflowExecutor:
             # Save evidence map as artifact
             if result.evidence_map:
                 artifact_id = f"{session_id}_evidence_map"
-                self.artifact_store.save_artifact(
+                await self.artifact_store.asave_artifact(
                     artifact_id=artifact_id,
                     data=result.evidence_map
                 )
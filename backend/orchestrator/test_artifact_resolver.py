@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Test script for artifact handle discovery
+
+Tests ArtifactResolverProcessor._discover_handles to verify:
+- Handles in nested values, dict keys and tuples are found
+- The serialized (orjson) scan and the walker find the same handles
+- The producer hint skips the scan
+"""
+
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add app to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.services import json_utils
+from app.services.processors.artifact_resolver import ArtifactResolverProcessor
+
+
+def print_section(title: str):
+    """Print a formatted section header."""
+    print(f"\n{'=' * 70}")
+    print(f"  {title}")
+    print('=' * 70)
+
+
+def _context():
+    """Context with handles in values, keys, tuples and prose."""
+    return {
+        "original_input": {"claim": "see artifact://claim_doc/v1 attached"},
+        "prior_outputs": {
+            "intake_agent": {
+                "artifact://intake_summary/v2": {"status": "ok"},
+                "files": ("artifact://photo-01/v3", "artifact://photo-02/v3"),
+            },
+        },
+        "observations": [
+            {"result": "no handle here"},
+            {"result": ["artifact://claim_doc/v1", "not artifact://bad/vx"]},
+        ],
+        "other_field": "artifact://ignored/v9",
+    }
+
+
+EXPECTED = {
+    "artifact://claim_doc/v1",
+    "artifact://intake_summary/v2",
+    "artifact://photo-01/v3",
+    "artifact://photo-02/v3",
+}
+
+
+def test_discover_handles():
+    """Handles are found in values, keys and tuples of the searched fields."""
+    print_section("Testing Handle Discovery")
+
+    processor = ArtifactResolverProcessor("artifact_resolver", {})
+
+    handles = processor._discover_handles(_context())
+    assert set(handles) == EXPECTED, handles
+    assert len(handles) == len(EXPECTED)
+    print(f"✓ {len(handles)} unique handles found, unsearched fields ignored")
+
+    assert processor._discover_handles({"observations": [{"a": "plain"}]}) == []
+    print("✓ Context without handles returns []")
+
+
+def test_serialized_scan_matches_walker():
+    """The orjson scan and the walker discover the same handles."""
+    print_section("Testing Scan/Walker Parity")
+
+    processor = ArtifactResolverProcessor("artifact_resolver", {})
+    context = _context()
+
+    with mock.patch.object(json_utils, "HAS_ORJSON", False):
+        walked = processor._discover_handles(context)
+    scanned = processor._discover_handles(context)
+
+    assert set(walked) == set(scanned) == EXPECTED
+    print("✓ Both paths find handles in dict keys and tuples")
+
+
+def test_producer_hint_skips_scan():
+    """_artifact_refs_present=False means no handles are reported."""
+    print_section("Testing Producer Hint")
+
+    processor = ArtifactResolverProcessor("artifact_resolver", {})
+    context = _context()
+    context["_artifact_refs_present"] = False
+
+    assert processor._discover_handles(context) == []
+    print("✓ Scan skipped when the producer reports no handles")
+
+
+def main():
+    """Run all artifact resolver tests."""
+    print_section("Artifact Handle Discovery Tests")
+
+    tests = [
+        ("Handle Discovery", test_discover_handles),
+        ("Scan/Walker Parity", test_serialized_scan_matches_walker),
+        ("Producer Hint", test_producer_hint_skips_scan),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            test_func()
+            results.append((name, True))
+        except Exception as e:
+            print(f"\n✗ Test '{name}' failed with exception: {e}")
+            import traceback
+            traceback.print_exc()
+            results.append((name, False))
+
+    # Summary
+    print_section("Test Summary")
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for name, result in results:
+        status = "✓ PASS" if result else "✗ FAIL"
+        print(f"{status}: {name}")
+
+    print(f"\nTotal: {passed}/{total} tests passed")
+    return 0 if passed == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
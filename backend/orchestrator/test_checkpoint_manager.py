@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Test script for checkpoint waits
+
+Tests CheckpointManager.wait_for_resolution to verify:
+- Waiters wake when a checkpoint is resolved, cancelled or timed out
+- Waits on checkpoints that are no longer pending return immediately
+- Resolution events are dropped once signalled and never created for unknown IDs
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+# Add app to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.models.checkpoint_models import (
+    CheckpointConfig,
+    CheckpointResolution,
+    CheckpointStatus,
+    CheckpointType,
+)
+from app.services.checkpoint_manager import CheckpointManager
+from app.services.checkpoint_store import CheckpointStore
+
+
+def print_section(title: str):
+    """Print a formatted section header."""
+    print(f"\n{'=' * 70}")
+    print(f"  {title}")
+    print('=' * 70)
+
+
+def make_manager(store: CheckpointStore = None) -> CheckpointManager:
+    """CheckpointManager backed by a checkpoint store (a new temp dir by default)."""
+    store = store or CheckpointStore(tempfile.mkdtemp())
+    with mock.patch(
+        "app.services.checkpoint_manager.get_checkpoint_store", return_value=store
+    ):
+        return CheckpointManager()
+
+
+def create_checkpoint(manager: CheckpointManager, session_id: str = "s1"):
+    """Create a pending approval checkpoint."""
+    config = CheckpointConfig(
+        checkpoint_id="review",
+        checkpoint_type=CheckpointType.APPROVAL,
+        trigger_point="pre_workflow",
+        checkpoint_name="Review",
+        description="Review the claim",
+        required_role="reviewer",
+    )
+    return manager.create_checkpoint(session_id, "claims_triage", config, {})
+
+
+def resolution(action: str = "approve") -> CheckpointResolution:
+    """Reviewer resolution for a checkpoint."""
+    return CheckpointResolution(
+        action=action,
+        user_id="u1",
+        user_role="reviewer",
+        resolved_at=datetime.utcnow().isoformat() + "Z",
+    )
+
+
+def wait_in_thread(manager: CheckpointManager, checkpoint_instance_id: str) -> tuple:
+    """Start a waiter thread; returns (thread, result list)."""
+    result = []
+    thread = threading.Thread(
+        target=lambda: result.append(
+            manager.wait_for_resolution(checkpoint_instance_id, timeout=5.0)
+        )
+    )
+    thread.start()
+    return thread, result
+
+
+def test_waiters_wake_on_every_outcome():
+    """Resolve, cancel and timeout all wake a blocked waiter."""
+    print_section("Testing Waiter Wake-up")
+
+    manager = make_manager()
+    outcomes = [
+        ("resolve", lambda cp: manager.resolve_checkpoint(cp.checkpoint_instance_id, resolution())),
+        ("cancel", lambda cp: manager.cancel_checkpoint(cp.checkpoint_instance_id)),
+        ("timeout", lambda cp: manager._apply_timeout_action(cp)),
+    ]
+
+    for name, finish in outcomes:
+        checkpoint = create_checkpoint(manager)
+        thread, result = wait_in_thread(manager, checkpoint.checkpoint_instance_id)
+        time.sleep(0.05)
+
+        started = time.monotonic()
+        finish(checkpoint)
+        thread.join(5.0)
+
+        assert result == [True], name
+        assert time.monotonic() - started < 1.0, name
+        assert checkpoint.checkpoint_instance_id not in manager._resolution_events, name
+        print(f"✓ {name}: waiter woken, event dropped")
+
+
+def test_wait_after_resolution_returns_immediately():
+    """Waiting on a checkpoint that already left PENDING does not block."""
+    print_section("Testing Wait After Resolution")
+
+    manager = make_manager()
+    checkpoint = create_checkpoint(manager)
+    assert manager.resolve_checkpoint(checkpoint.checkpoint_instance_id, resolution())
+
+    started = time.monotonic()
+    assert manager.wait_for_resolution(checkpoint.checkpoint_instance_id, timeout=5.0)
+    assert time.monotonic() - started < 1.0
+    assert manager._resolution_events == {}
+    print("✓ Resolved checkpoint returns at once without an event")
+
+
+def test_wait_times_out_while_pending():
+    """A pending checkpoint's wait returns False once the timeout passes."""
+    print_section("Testing Wait Timeout")
+
+    manager = make_manager()
+    checkpoint = create_checkpoint(manager)
+
+    assert not manager.wait_for_resolution(checkpoint.checkpoint_instance_id, timeout=0.05)
+    assert manager.get_checkpoint(checkpoint.checkpoint_instance_id).status == CheckpointStatus.PENDING
+    print("✓ Wait timed out, checkpoint still pending")
+
+    # Pending checkpoints reloaded from disk get an event on first wait
+    reloaded = make_manager(manager.checkpoint_store)
+    thread, result = wait_in_thread(reloaded, checkpoint.checkpoint_instance_id)
+    time.sleep(0.05)
+    assert reloaded.resolve_checkpoint(checkpoint.checkpoint_instance_id, resolution())
+    thread.join(5.0)
+    assert result == [True]
+    assert reloaded._resolution_events == {}
+    print("✓ Checkpoint without an event still wakes its waiter")
+
+
+def test_unknown_ids_leave_no_events():
+    """Waits and signals for unknown checkpoints never create events."""
+    print_section("Testing Unknown Checkpoints")
+
+    manager = make_manager()
+
+    assert not manager.wait_for_resolution("cp_missing", timeout=0.01)
+    with manager._lock:
+        manager._signal_resolution("cp_missing")
+    assert not manager.resolve_checkpoint("cp_missing", resolution())
+    assert not manager.cancel_checkpoint("cp_missing")
+
+    assert manager._resolution_events == {}
+    print("✓ No events created for unknown checkpoint IDs")
+
+
+def main():
+    """Run all checkpoint manager tests."""
+    print_section("Checkpoint Wait Tests")
+
+    tests = [
+        ("Waiter Wake-up", test_waiters_wake_on_every_outcome),
+        ("Wait After Resolution", test_wait_after_resolution_returns_immediately),
+        ("Wait Timeout", test_wait_times_out_while_pending),
+        ("Unknown Checkpoints", test_unknown_ids_leave_no_events),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            test_func()
+            results.append((name, True))
+        except Exception as e:
+            print(f"\n✗ Test '{name}' failed with exception: {e}")
+            import traceback
+            traceback.print_exc()
+            results.append((name, False))
+
+    # Summary
+    print_section("Test Summary")
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for name, result in results:
+        status = "✓ PASS" if result else "✗ FAIL"
+        print(f"{status}: {name}")
+
+    print(f"\nTotal: {passed}/{total} tests passed")
+    return 0 if passed == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
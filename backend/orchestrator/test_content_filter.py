@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Test script for Phase 8: Content Filter PII Masking
+
+Tests regex masking with the shipped governance rules to verify:
+- Unicode digits are masked (with or without google-re2 installed)
+- Merged patterns mask as if applied per pattern, earliest pattern first
+- Batched masking matches masking each string on its own
+- Only RE2-only masking fields are handed to the rule thread pool
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add app to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.services.processors import content_filter
+from app.services.processors.content_filter import (
+    ContentFilterProcessor,
+    MASK_BATCH_MIN_ITEMS,
+    _MASK_BATCH_SENTINEL,
+)
+
+REGISTRIES_PATH = Path(__file__).parent.parent.parent / "registries"
+
+
+def print_section(title: str):
+    """Print a formatted section header."""
+    print(f"\n{'=' * 70}")
+    print(f"  {title}")
+    print('=' * 70)
+
+
+def shipped_rule(rule_id: str) -> dict:
+    """Load a context filtering rule from the shipped governance policies."""
+    with open(REGISTRIES_PATH / "governance_policies.json") as f:
+        policies = json.load(f)
+    rules = policies["policies"]["context_filtering"]["rules"]
+    return next(rule for rule in rules if rule["rule_id"] == rule_id)
+
+
+def mask_rule(field: str, *patterns) -> dict:
+    """Build a regex_mask rule from (pattern, replacement) pairs."""
+    return {
+        "rule_id": "test",
+        "field": field,
+        "condition": {
+            "type": "regex_mask",
+            "patterns": [
+                {"pattern": pattern, "replacement": replacement}
+                for pattern, replacement in patterns
+            ],
+        },
+    }
+
+
+def mask_one_by_one(rule: dict, texts: list) -> list:
+    """Reference result: mask each string with its own processor call."""
+    processor = ContentFilterProcessor("content_filter", {})
+    masked = []
+    for text in texts:
+        context = {"field": text}
+        processor._mask_by_regex({**rule, "field": "field"}, context)
+        masked.append(context["field"])
+    return masked
+
+
+def test_unicode_digits_masked():
+    """Shipped mask_ssn masks SSNs written with non-ASCII digits."""
+    print_section("Testing Unicode Digit Masking")
+
+    processor = ContentFilterProcessor("content_filter", {})
+    rule = shipped_rule("mask_ssn")
+    context = {
+        "original_input": {
+            "ascii": "ssn 123-45-6789",
+            "fullwidth": "ssn １２３-４５-６７８９",
+            "arabic_indic": "ssn ١٢٣-٤٥-٦٧٨٩",
+            "nested": ["１２３４５６７８９"],
+        }
+    }
+
+    result = processor._mask_by_regex(rule, context)
+
+    assert context["original_input"] == {
+        "ascii": "ssn ***-**-****",
+        "fullwidth": "ssn ***-**-****",
+        "arabic_indic": "ssn ***-**-****",
+        "nested": ["*********"],
+    }, context["original_input"]
+    assert result == {"modified": True, "items_masked": 4}
+    print("✓ ASCII, fullwidth and Arabic-Indic SSNs masked")
+
+    # \d patterns must not be handed to RE2, whose \d is ASCII-only
+    assert isinstance(processor._compile_pattern(r"\d{3}-\d{2}-\d{4}"), re.Pattern)
+    print("✓ \\d patterns compiled with stdlib re")
+
+
+def test_merged_patterns():
+    """Multi-pattern rules mask in one pass, earliest-listed pattern first."""
+    print_section("Testing Merged Patterns")
+
+    processor = ContentFilterProcessor("content_filter", {})
+    rule = shipped_rule("mask_ssn")
+    context = {"original_input": "a 123-45-6789 b 123456789 c 12345"}
+
+    result = processor._mask_by_regex(rule, context)
+
+    assert context["original_input"] == "a ***-**-**** b ********* c 12345"
+    assert result["items_masked"] == 2
+    assert len(processor._get_mask_passes(rule["condition"]["patterns"])) == 1
+    print("✓ Both SSN formats masked by a single merged pass")
+
+    # Overlap: the earlier pattern claims the match at a position
+    overlap = mask_rule("field", (r"ab", "X"), (r"abc", "Y"))
+    context = {"field": "abc"}
+    processor._mask_by_regex(overlap, context)
+    assert context["field"] == "Xc"
+    print("✓ Earliest-listed pattern wins on overlap")
+
+    # Capture groups can't be merged - one pass per pattern, applied in order
+    grouped = mask_rule("field", (r"(\d)-(\d)", "#"), (r"#", "!"))
+    assert len(processor._get_mask_passes(grouped["condition"]["patterns"])) == 2
+    context = {"field": "1-2"}
+    processor._mask_by_regex(grouped, context)
+    assert context["field"] == "!"
+    print("✓ Patterns with groups keep per-pattern passes")
+
+
+def test_batched_masking_matches_per_string():
+    """Masking a list as one sentinel-joined batch equals per-string masking."""
+    print_section("Testing Batched Masking")
+
+    texts = [f"note {i} 123-45-6789" if i % 3 == 0 else f"note {i}" for i in range(20)]
+    assert len(texts) >= MASK_BATCH_MIN_ITEMS
+
+    cases = [
+        ("shipped SSN rule", shipped_rule("mask_ssn"), texts),
+        # Anchored pattern: must not see the previous string's end
+        ("anchored", mask_rule("field", (r"^note", "N")), texts),
+        # "." matches the sentinel - a cross-string match forces per-string masking
+        ("cross-string", mask_rule("field", (r"1.n", "X")), [f"{i}1" if i % 2 else "note" for i in range(10)]),
+        # An input containing the sentinel itself
+        ("sentinel in input", shipped_rule("mask_ssn"), texts[:-1] + [f"x{_MASK_BATCH_SENTINEL}123456789"]),
+    ]
+
+    for name, rule, items in cases:
+        processor = ContentFilterProcessor("content_filter", {})
+        context = {"observations": list(items)}
+        result = processor._mask_by_regex({**rule, "field": "observations"}, context)
+
+        expected = mask_one_by_one(rule, items)
+        assert context["observations"] == expected, name
+        assert result["items_masked"] == sum(
+            a != b for a, b in zip(items, expected)
+        ), name
+        print(f"✓ {name}: batch result equals per-string result")
+
+    # Lists of dicts are masked in place, nested values included
+    processor = ContentFilterProcessor("content_filter", {})
+    observations = [
+        {"msg": f"ssn 123-45-678{i % 10}", "meta": {"tags": ["123456789"]}, "n": i}
+        for i in range(MASK_BATCH_MIN_ITEMS)
+    ]
+    context = {"observations": observations}
+    rule = {**shipped_rule("mask_ssn"), "field": "observations"}
+    result = processor._mask_by_regex(rule, context)
+
+    assert all(
+        o["msg"] == "ssn ***-**-****" and o["meta"]["tags"] == ["*********"]
+        for o in context["observations"]
+    )
+    assert result["items_masked"] == 2 * MASK_BATCH_MIN_ITEMS
+    print("✓ Dict observations masked, including nested values")
+
+
+def test_rule_pool_only_for_re2_masking():
+    """Fields are fanned out to the pool only when their masking uses RE2."""
+    print_section("Testing Rule Pool Gating")
+
+    # Shipped rules use \d, so they compile with stdlib re and hold the GIL
+    shipped = [
+        {**shipped_rule("mask_ssn"), "field": "original_input"},
+        {**shipped_rule("mask_ssn"), "field": "observations"},
+    ]
+    processor = ContentFilterProcessor("content_filter", {})
+    context = {"original_input": "123-45-6789", "observations": ["123456789"]}
+    with mock.patch.object(content_filter, "_get_rule_pool") as get_pool:
+        processor._apply_rules(shipped, context)
+    assert not get_pool.called
+    assert context == {"original_input": "***-**-****", "observations": ["*********"]}
+    print("✓ stdlib re masking runs on the calling thread")
+
+    if content_filter.re2 is None:
+        print("- google-re2 not installed, skipping the pool case")
+        return
+
+    rules = [
+        mask_rule("original_input", (r"[0-9]{9}", "#")),
+        mask_rule("observations", (r"[0-9]{9}", "#")),
+        {**shipped_rule("mask_ssn"), "field": "prior_outputs"},
+    ]
+    context = {
+        "original_input": "123456789",
+        "observations": ["x 123456789"],
+        "prior_outputs": {"a": "123-45-6789"},
+    }
+    pool = content_filter._get_rule_pool()
+    with mock.patch.object(pool, "submit", wraps=pool.submit) as submit:
+        results = processor._apply_rules(rules, context)
+    assert submit.call_count == 2
+    assert [rule for rule, _ in results] == rules
+    assert context == {
+        "original_input": "#",
+        "observations": ["x #"],
+        "prior_outputs": {"a": "***-**-****"},
+    }
+    print("✓ RE2 fields submitted to the pool, stdlib field run in place")
+
+
+def main():
+    """Run all content filter tests."""
+    print_section("Phase 8: Content Filter Masking Tests")
+
+    tests = [
+        ("Unicode Digits", test_unicode_digits_masked),
+        ("Merged Patterns", test_merged_patterns),
+        ("Batched Masking", test_batched_masking_matches_per_string),
+        ("Rule Pool Gating", test_rule_pool_only_for_re2_masking),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            test_func()
+            results.append((name, True))
+        except Exception as e:
+            print(f"\n✗ Test '{name}' failed with exception: {e}")
+            import traceback
+            traceback.print_exc()
+            results.append((name, False))
+
+    # Summary
+    print_section("Test Summary")
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for name, result in results:
+        status = "✓ PASS" if result else "✗ FAIL"
+        print(f"{status}: {name}")
+
+    print(f"\nTotal: {passed}/{total} tests passed")
+    return 0 if passed == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
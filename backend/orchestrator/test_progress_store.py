@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Test script for SSE progress delta polling
+
+Tests ProgressStore.get_session_delta to verify:
+- Each poll returns only the events added since the previous one
+- Polls after events were trimmed resume at the oldest retained event
+- Concurrent writers and a poller never lose or repeat events
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+# Add app to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.services.progress_store import ProgressStore
+
+
+def print_section(title: str):
+    """Print a formatted section header."""
+    print(f"\n{'=' * 70}")
+    print(f"  {title}")
+    print('=' * 70)
+
+
+def test_delta_returns_only_new_events():
+    """Polling with next_seq yields each event exactly once."""
+    print_section("Testing Delta Polling")
+
+    store = ProgressStore()
+    store.create_session("s1", "claims_triage")
+
+    delta = store.get_session_delta("s1")
+    assert delta.events == [] and delta.next_seq == 0
+    assert delta.status == "running"
+
+    store.add_event("s1", {"event_type": "a"})
+    store.add_event("s1", {"event_type": "b"})
+    delta = store.get_session_delta("s1", delta.next_seq)
+    assert [e["event_type"] for e in delta.events] == ["a", "b"]
+    assert delta.next_seq == 2
+    print("✓ First poll returns both events")
+
+    assert store.get_session_delta("s1", delta.next_seq).events == []
+    store.add_event("s1", {"event_type": "c"})
+    store.update_status("s1", "completed")
+    delta = store.get_session_delta("s1", delta.next_seq)
+    assert [e["event_type"] for e in delta.events] == ["c"]
+    assert delta.next_seq == 3 and delta.status == "completed"
+    print("✓ Later polls return only new events and the current status")
+
+    assert [e["event_type"] for e in store.get_session_delta("s1").events] == ["a", "b", "c"]
+    print("✓ since_seq=0 returns every retained event")
+
+    store.cleanup_session("s1")
+    assert store.get_session_delta("s1") is None
+    print("✓ Unknown session returns None")
+
+
+def test_delta_after_trim():
+    """A poller that fell behind the trimmed events gets the retained ones."""
+    print_section("Testing Delta After Trim")
+
+    store = ProgressStore(max_events_per_session=5)
+    store.create_session("s1", "claims_triage")
+    for i in range(3):
+        store.add_event("s1", {"i": i})
+    delta = store.get_session_delta("s1")
+
+    for i in range(3, 12):
+        store.add_event("s1", {"i": i})
+
+    behind = store.get_session_delta("s1", delta.next_seq)
+    assert [e["i"] for e in behind.events] == [7, 8, 9, 10, 11]
+    assert behind.next_seq == 12
+    print("✓ Trimmed events skipped, retained events returned")
+
+    current = store.get_session_delta("s1", 10)
+    assert [e["i"] for e in current.events] == [10, 11]
+    print("✓ Poll within the retained window returns only newer events")
+
+
+def test_concurrent_writers_and_poller():
+    """A poller sees every event once while writers add them concurrently."""
+    print_section("Testing Concurrent Polling")
+
+    per_thread = 500
+    store = ProgressStore(max_events_per_session=4 * per_thread)
+    store.create_session("s1", "claims_triage")
+
+    def write(thread_id: int):
+        for i in range(per_thread):
+            store.add_event("s1", {"t": thread_id, "i": i})
+
+    threads = [threading.Thread(target=write, args=(t,)) for t in range(4)]
+    for thread in threads:
+        thread.start()
+
+    seen = []
+    next_seq = 0
+    while any(thread.is_alive() for thread in threads) or next_seq < 4 * per_thread:
+        delta = store.get_session_delta("s1", next_seq)
+        seen.extend(delta.events)
+        next_seq = delta.next_seq
+
+    for thread in threads:
+        thread.join()
+
+    assert len(seen) == 4 * per_thread
+    for t in range(4):
+        assert [e["i"] for e in seen if e["t"] == t] == list(range(per_thread))
+    print(f"✓ {len(seen)} events polled once each, per-thread order kept")
+
+
+def main():
+    """Run all progress store tests."""
+    print_section("Progress Store Delta Polling Tests")
+
+    tests = [
+        ("Delta Polling", test_delta_returns_only_new_events),
+        ("Delta After Trim", test_delta_after_trim),
+        ("Concurrent Polling", test_concurrent_writers_and_poller),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            test_func()
+            results.append((name, True))
+        except Exception as e:
+            print(f"\n✗ Test '{name}' failed with exception: {e}")
+            import traceback
+            traceback.print_exc()
+            results.append((name, False))
+
+    # Summary
+    print_section("Test Summary")
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for name, result in results:
+        status = "✓ PASS" if result else "✗ FAIL"
+        print(f"{status}: {name}")
+
+    print(f"\nTotal: {passed}/{total} tests passed")
+    return 0 if passed == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
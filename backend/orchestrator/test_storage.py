@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Test script for session event storage (group commit)
+
+Tests SessionWriter buffering to verify:
+- Buffered events are visible to reads before they are written
+- Group commits happen on the timer, on the size cap and on flush
+- Batch writes keep their order relative to buffered events
+- Failed writes keep their events for the next flush
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest import mock
+
+# Add app to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.services import storage
+from app.services.storage import SessionWriter
+
+
+def print_section(title: str):
+    """Print a formatted section header."""
+    print(f"\n{'=' * 70}")
+    print(f"  {title}")
+    print('=' * 70)
+
+
+def make_writer(commit_seconds: float = 60.0) -> SessionWriter:
+    """SessionWriter in a temp dir whose timer won't fire during a test."""
+    writer = SessionWriter(tempfile.mkdtemp())
+    writer.GROUP_COMMIT_SECONDS = commit_seconds
+    return writer
+
+
+def file_events(writer: SessionWriter, session_id: str) -> list:
+    """Event lines currently on disk for a session."""
+    session_file = writer._get_session_file(session_id)
+    if not session_file.exists():
+        return []
+    return session_file.read_text().splitlines()
+
+
+def test_buffered_events_visible_without_write():
+    """read_session includes buffered events without writing them."""
+    print_section("Testing Buffered Reads")
+
+    writer = make_writer()
+    try:
+        writer.write_event("s1", {"event_type": "a"})
+        writer.write_event("s1", {"event_type": "b"})
+
+        events = writer.read_session("s1")
+        assert [e["event_type"] for e in events] == ["a", "b"]
+        assert all(e["session_id"] == "s1" and e["timestamp"].endswith("Z") for e in events)
+        assert file_events(writer, "s1") == [], "read_session must not force a write"
+        assert writer.session_exists("s1")
+        assert writer.list_sessions() == ["s1"]
+        print("✓ Buffered events read back in order, nothing written")
+    finally:
+        writer.flush()
+
+    assert len(file_events(writer, "s1")) == 2
+    assert [e["event_type"] for e in writer.read_session("s1")] == ["a", "b"]
+    print("✓ flush() wrote both events once")
+
+
+def test_timer_commit():
+    """Buffered events are written once the group commit timer fires."""
+    print_section("Testing Timer Commit")
+
+    writer = make_writer(commit_seconds=0.01)
+    writer.write_event("s1", {"event_type": "a"})
+
+    deadline = time.monotonic() + 2.0
+    while not file_events(writer, "s1") and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert len(file_events(writer, "s1")) == 1
+    assert writer._flush_timer is None
+    print("✓ Event written by the timer")
+
+
+def test_size_cap_commits_immediately():
+    """Reaching GROUP_COMMIT_MAX_EVENTS writes without waiting for the timer."""
+    print_section("Testing Size Cap")
+
+    writer = make_writer()
+    try:
+        for i in range(writer.GROUP_COMMIT_MAX_EVENTS):
+            writer.write_event("s1", {"i": i})
+
+        assert len(file_events(writer, "s1")) == writer.GROUP_COMMIT_MAX_EVENTS
+        assert "s1" not in writer._pending
+        print(f"✓ {writer.GROUP_COMMIT_MAX_EVENTS} events written in one commit")
+    finally:
+        writer.flush()
+
+
+def test_batch_keeps_order():
+    """write_events_batch writes buffered events first, before returning."""
+    print_section("Testing Batch Order")
+
+    writer = make_writer()
+    try:
+        writer.write_event("s1", {"i": 0})
+        writer.write_events_batch("s1", [{"i": 1}, {"i": 2}])
+
+        assert len(file_events(writer, "s1")) == 3
+        assert [e["i"] for e in writer.read_session("s1")] == [0, 1, 2]
+        print("✓ Batch written after earlier buffered event")
+    finally:
+        writer.flush()
+
+
+def test_concurrent_writers_keep_order():
+    """Each thread's events stay in order across group commits."""
+    print_section("Testing Concurrent Writers")
+
+    writer = make_writer(commit_seconds=0.001)
+    per_thread = 250
+
+    def write(thread_id: int):
+        for i in range(per_thread):
+            writer.write_event("s1", {"t": thread_id, "i": i})
+
+    threads = [threading.Thread(target=write, args=(t,)) for t in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    writer.flush()
+
+    events = writer.read_session("s1")
+    assert len(events) == 4 * per_thread
+    assert len(file_events(writer, "s1")) == 4 * per_thread
+    for t in range(4):
+        assert [e["i"] for e in events if e["t"] == t] == list(range(per_thread))
+    print("✓ 1000 events from 4 threads, per-thread order kept")
+
+
+def test_failed_write_is_retried():
+    """Events from a failed commit are kept, ahead of newer ones."""
+    print_section("Testing Failed Write Retry")
+
+    writer = make_writer()
+    try:
+        writer.write_event("s1", {"i": 0})
+        with mock.patch.object(storage.fcntl, "flock", side_effect=OSError("disk")):
+            try:
+                writer.flush_sync("s1")
+                assert False, "flush_sync should re-raise the write error"
+            except OSError:
+                pass
+
+        writer.write_event("s1", {"i": 1})
+        assert [e["i"] for e in writer.read_session("s1")] == [0, 1]
+        print("✓ Failed events kept in order")
+    finally:
+        writer.flush()
+
+    assert [e["i"] for e in writer.read_session("s1")] == [0, 1]
+    assert len(file_events(writer, "s1")) == 2
+    print("✓ Retried on the next flush")
+
+
+def main():
+    """Run all storage tests."""
+    print_section("Session Storage Group Commit Tests")
+
+    tests = [
+        ("Buffered Reads", test_buffered_events_visible_without_write),
+        ("Timer Commit", test_timer_commit),
+        ("Size Cap", test_size_cap_commits_immediately),
+        ("Batch Order", test_batch_keeps_order),
+        ("Concurrent Writers", test_concurrent_writers_keep_order),
+        ("Failed Write Retry", test_failed_write_is_retried),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            test_func()
+            results.append((name, True))
+        except Exception as e:
+            print(f"\n✗ Test '{name}' failed with exception: {e}")
+            import traceback
+            traceback.print_exc()
+            results.append((name, False))
+
+    # Summary
+    print_section("Test Summary")
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for name, result in results:
+        status = "✓ PASS" if result else "✗ FAIL"
+        print(f"{status}: {name}")
+
+    print(f"\nTotal: {passed}/{total} tests passed")
+    return 0 if passed == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())